@@ -1,6 +1,6 @@
 """
-API routes - Simplified to just chat endpoint
+API routes - Chat agent and direct search endpoints
 """
-from . import chat
+from . import chat, search, metrics
 
-__all__ = ["chat"]
+__all__ = ["chat", "search", "metrics"]
@@ -1,10 +1,10 @@
 """
 Chat API endpoints - Simplified with LangGraph ReAct agent
 """
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel
-from typing import Optional, Dict
+from typing import Optional, Dict, List
 from ..core.agent import housing_agent
 import json
 
@@ -14,7 +14,7 @@ router = APIRouter()
 class ChatRequest(BaseModel):
     """Chat request model"""
     message: str
-    context: Optional[Dict] = None  # Deprecated - agent uses tools instead
+    context: Optional[Dict] = None  # Extra facts for this turn - appended to the user message, after the cached prompt prefix
     conversation_id: Optional[str] = None
 
 
@@ -24,6 +24,10 @@ class ChatResponse(BaseModel):
     conversation_id: str
     sources: Optional[list] = []
     search_params: Optional[Dict] = {}  # Parameters used by search_properties tool
+    property_ids: List[int] = []  # IDs returned by the latest search_properties call, in rank order
+    properties: List[Dict] = []  # Exact payload search_properties received from the backend
+    usage: Dict = {}  # LLM calls and prompt / cached / completion tokens for this turn
+    route: Optional[str] = None  # Model route chosen for this turn
 
 
 @router.post("/chat", response_model=ChatResponse)
@@ -48,27 +52,27 @@ async def chat(request: ChatRequest):
             thread_id=thread_id
         )
 
-        # Extract sources from agent's tool calls
-        # The agent messages contain tool call information
+        # Extract sources from the review hits returned by the agent's tools
         sources = []
-        messages = result.get("messages", [])
-
-        # Look for tool calls in messages to extract sources
-        for msg in messages:
-            if hasattr(msg, 'tool_calls') and msg.tool_calls:
-                for tool_call in msg.tool_calls:
-                    if tool_call.get('name') == 'search_tenant_reviews':
-                        # This was a review search - could extract as source
-                        sources.append({
-                            "tool": "search_tenant_reviews",
-                            "args": tool_call.get('args', {})
-                        })
+        for item in result.get("artifacts", []):
+            if item["tool"] == "search_tenant_reviews":
+                for hit in item["artifact"].get("hits", []):
+                    sources.append({
+                        "tool": "search_tenant_reviews",
+                        "review_id": hit["metadata"].get("review_id"),
+                        "area": hit["metadata"].get("area"),
+                        "score": hit["score"]
+                    })
 
         return ChatResponse(
             response=result["response"],
             conversation_id=thread_id,
             sources=sources[:5],  # Limit to 5 sources
-            search_params=result.get("search_params", {})  # Include search params for backend
+            search_params=result.get("search_params", {}),  # Include search params for backend
+            property_ids=result.get("property_ids", []),
+            properties=result.get("properties", []),
+            usage=result.get("usage", {}),
+            route=result.get("route")
         )
 
     except Exception as e:
@@ -78,39 +82,47 @@ async def chat(request: ChatRequest):
         )
 
 
+def sse(event: str, data) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
 @router.post("/chat/stream")
-async def chat_stream(request: ChatRequest):
+async def chat_stream(request: ChatRequest, http_request: Request):
     """
     Streaming chat endpoint
 
-    Returns a streaming response where the agent's response
-    is sent in chunks as it's generated.
-    """
-    try:
-        thread_id = request.conversation_id or "default"
+    Server-sent events, one per agent step as it happens:
+    token (LLM text), tool_call, tool_result (property searches include
+    property_ids), then done with the full response, usage and route.
+    An error event replaces done if the turn fails.
 
-        async def generate():
-            """Generate response chunks"""
-            async for message in housing_agent.astream(
-                user_message=request.message,
-                context=request.context,
-                thread_id=thread_id
-            ):
-                # Convert message to dict and send as JSON
-                if hasattr(message, 'content'):
-                    chunk = {"content": message.content, "type": str(type(message).__name__)}
-                    yield f"data: {json.dumps(chunk)}\n\n"
-
-            # Send done signal
-            yield "data: [DONE]\n\n"
-
-        return StreamingResponse(
-            generate(),
-            media_type="text/event-stream"
-        )
+    When the client disconnects the stream is closed, which cancels the
+    running agent turn (and its in-flight LLM call).
+    """
+    thread_id = request.conversation_id or "default"
 
-    except Exception as e:
-        raise HTTPException(
-            status_code=500,
-            detail=f"Error streaming chat: {str(e)}"
+    async def generate():
+        """Generate events"""
+        events = housing_agent.astream(
+            user_message=request.message,
+            context=request.context,
+            thread_id=thread_id
         )
+        try:
+            async for event in events:
+                if await http_request.is_disconnected():
+                    print(f"🔌 Client disconnected - stopping turn for {thread_id}")
+                    break
+                yield sse(event["type"], event)
+        except Exception as e:
+            yield sse("error", {"type": "error", "detail": f"Error streaming chat: {str(e)}"})
+        finally:
+            # Closing the generator cancels the agent turn right away
+            await events.aclose()
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
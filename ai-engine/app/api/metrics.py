@@ -0,0 +1,35 @@
+"""
+Metrics API endpoints - Runtime counters for the agent pipeline
+"""
+from fastapi import APIRouter
+from ..core.prefetch import prefetch_stats
+from ..core.telemetry import llm_usage_stats
+from ..core.router import route_stats
+from ..core.area_profiles import area_profiles
+from ..core.aspect_index import aspect_index
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics():
+    """
+    Agent pipeline metrics
+
+    - prefetch: speculative tool call predictions, hits, misses and hit rate
+    - llm: prompt / cached / completion tokens and latency per LLM call
+    - prompt_prefix: fingerprint of the static, cache-eligible request prefix
+    - routes: turns, model and latency per model route
+    - area_profiles: version and coverage of the precomputed area profiles
+    - aspect_index: version and coverage of the (area, aspect) review index
+    """
+    from ..core.agent import housing_agent
+
+    return {
+        "prefetch": prefetch_stats.snapshot(),
+        "llm": llm_usage_stats.snapshot(),
+        "prompt_prefix": housing_agent.prefix,
+        "routes": route_stats.snapshot(),
+        "area_profiles": area_profiles.snapshot(),
+        "aspect_index": aspect_index.snapshot()
+    }
@@ -0,0 +1,182 @@
+"""
+Search API endpoints - Direct vector retrieval without the agent
+"""
+from fastapi import APIRouter, HTTPException
+from pydantic import BaseModel, Field, model_validator
+from typing import Optional, Dict, List, Any
+from ..core.vector_db import vector_db, listings_db
+from ..core.listings import search_listings
+from ..services.embedding_service import embedding_service
+
+router = APIRouter()
+
+
+class ReviewSearchRequest(BaseModel):
+    """Review search request model"""
+    query: Optional[str] = None
+    queries: Optional[List[str]] = None  # Batch mode - one result set per query
+    filters: Optional[Dict[str, Any]] = None  # e.g. {"area": "Lekki", "rating": {"$gte": 4}}
+    limit: int = Field(5, ge=1, le=50)
+    diversify: Optional[bool] = None  # MMR re-ranking (defaults to MMR_ENABLED)
+
+    @model_validator(mode="after")
+    def check_queries(self):
+        if not self.query and not self.queries:
+            raise ValueError("Either 'query' or 'queries' must be provided")
+        return self
+
+    def all_queries(self) -> List[str]:
+        """Queries in request order, single query first"""
+        return ([self.query] if self.query else []) + (self.queries or [])
+
+
+class ReviewHit(BaseModel):
+    """Single review hit"""
+    id: str
+    text: str
+    metadata: Dict[str, Any] = {}
+    score: float
+
+
+class ReviewSearchResult(BaseModel):
+    """Hits for one query"""
+    query: str
+    hits: List[ReviewHit] = []
+
+
+class ReviewSearchResponse(BaseModel):
+    """Review search response model"""
+    results: List[ReviewSearchResult]
+
+
+@router.post("/search/reviews", response_model=ReviewSearchResponse)
+async def search_reviews(request: ReviewSearchRequest):
+    """
+    Semantic search over tenant reviews
+
+    Accepts one query or a batch of queries sharing the same metadata
+    filters and limit. Returns raw hits (text, metadata, score) straight
+    from ChromaDB - no LLM involved. Hits are MMR re-ranked for diversity
+    unless 'diversify' is false.
+    """
+    try:
+        queries = request.all_queries()
+        where = vector_db.build_where(request.filters)
+
+        # Embed all queries in one call and run a single batched ChromaDB query
+        query_embeddings = await embedding_service.aembed_texts(queries)
+        results = await vector_db.asearch(
+            query_embeddings=query_embeddings,
+            n_results=request.limit,
+            where=where,
+            diversify=request.diversify
+        )
+        hits_per_query = vector_db.to_hits(results)
+
+        return ReviewSearchResponse(
+            results=[
+                ReviewSearchResult(query=query, hits=hits_per_query[i] if i < len(hits_per_query) else [])
+                for i, query in enumerate(queries)
+            ]
+        )
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error searching reviews: {str(e)}"
+        )
+
+
+class ListingFilters(BaseModel):
+    """Structured filters applied inside the vector query"""
+    area: Optional[str] = None
+    property_type: Optional[str] = None
+    bedrooms: Optional[int] = Field(None, ge=0)
+    bathrooms: Optional[int] = Field(None, ge=0)
+    min_rent: Optional[float] = Field(None, ge=0)
+    max_rent: Optional[float] = Field(None, ge=0)
+    is_available: Optional[bool] = True
+
+
+class PropertySearchRequest(BaseModel):
+    """Semantic property search request model"""
+    query: str = Field(..., min_length=1)
+    filters: ListingFilters = ListingFilters()
+    limit: int = Field(10, ge=1, le=50)
+
+
+class PropertyHit(BaseModel):
+    """Single listing hit"""
+    property_id: int
+    score: float
+    metadata: Dict[str, Any] = {}
+
+
+class PropertySearchResponse(BaseModel):
+    """Semantic property search response model"""
+    query: str
+    hits: List[PropertyHit]
+
+
+@router.post("/search/properties", response_model=PropertySearchResponse)
+async def search_properties(request: PropertySearchRequest):
+    """
+    Hybrid search over property listings
+
+    Structured filters (area, type, bedrooms, rent range, availability)
+    are applied inside the vector query and the remaining listings are
+    ranked by semantic similarity of their title and description.
+    Returns property IDs for the caller to hydrate from MySQL.
+    """
+    try:
+        hits = await search_listings(
+            query=request.query,
+            filters=request.filters.model_dump(),
+            limit=request.limit
+        )
+        return PropertySearchResponse(query=request.query, hits=hits)
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error searching properties: {str(e)}"
+        )
+
+
+# Property IDs per embeddings request (the backend batches larger sets)
+MAX_EMBEDDING_IDS = 5000
+
+
+class ListingEmbeddingsRequest(BaseModel):
+    """Listing embeddings request model"""
+    property_ids: List[int] = Field(..., max_length=MAX_EMBEDDING_IDS)
+
+
+@router.post("/search/properties/embeddings")
+async def listing_embeddings(request: ListingEmbeddingsRequest):
+    """
+    Stored description embeddings for property listings
+
+    Used by the backend's similar-properties index. Listings that are not
+    in the listings collection are simply absent from the result.
+    """
+    try:
+        if not request.property_ids:
+            return {"embeddings": {}}
+
+        results = await listings_db.aget_documents(
+            ids=[f"property_{property_id}" for property_id in request.property_ids],
+            include=("embeddings", "metadatas")
+        )
+        return {
+            "embeddings": {
+                str(metadata["property_id"]): list(embedding)
+                for metadata, embedding in zip(results["metadatas"], results["embeddings"])
+            }
+        }
+
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching listing embeddings: {str(e)}"
+        )
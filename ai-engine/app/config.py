@@ -2,7 +2,7 @@
 Configuration settings for the AI Engine
 """
 from pydantic_settings import BaseSettings
-from typing import List
+from typing import Dict, List
 
 
 class Settings(BaseSettings):
@@ -16,9 +16,42 @@ class Settings(BaseSettings):
 
     # Backend API Config
     BACKEND_URL: str = "http://localhost:8000"
+    BACKEND_TIMEOUT: float = 10.0
+
+    # Agent Config
+    AGENT_GRAPH: str = "react"  # "react" or "plan_execute"
+    AGENT_MAX_PARALLEL_TOOLS: int = 4  # Concurrent tool calls allowed per turn
+    SPECULATIVE_PREFETCH_ENABLED: bool = True  # Start predicted tool calls alongside the first LLM call
+    QUERY_NORMALIZATION_ENABLED: bool = True  # Rewrite housing slang and attach parsed filters before the agent
+
+    # Tool Output Budgets (tokens fed back to the LLM)
+    TOOL_OUTPUT_TOKEN_BUDGET: int = 500  # Default per tool call
+    TOOL_OUTPUT_TOKEN_BUDGETS: Dict[str, int] = {"compare_areas": 700}  # Per-tool overrides
+    TURN_TOOL_TOKEN_BUDGET: int = 1500  # All tool output in one turn
+    REVIEW_EXCERPT_CHARS: int = 280
+    AREA_STATS_EXCERPT_CHARS: int = 160
+    AREA_STATS_SAMPLE_REVIEWS: int = 6
+
+    # Area Profiles (built offline by scripts/build_area_profiles.py)
+    AREA_PROFILES_ENABLED: bool = True  # Serve area tools from precomputed profiles when available
+    AREA_PROFILES_PATH: str = ""  # Defaults to ai-engine/data/area_profiles.json
+
+    # Aspect Index (built offline by scripts/tag_review_aspects.py)
+    ASPECT_INDEX_ENABLED: bool = True  # Answer (area, topic) review questions from posting lists
+    ASPECT_INDEX_PATH: str = ""  # Defaults to ai-engine/data/aspect_index.json
 
     # ChromaDB Config (Embedded Mode)
     CHROMADB_COLLECTION: str = "tenant_reviews"
+    CHROMADB_LISTINGS_COLLECTION: str = "property_listings"  # Synced by scripts/sync_property_listings.py
+
+    # Review Ingestion
+    DEDUP_ENABLED: bool = True  # Collapse near-duplicate reviews into one vector
+    DEDUP_THRESHOLD: float = 0.8  # Minimum estimated Jaccard similarity of word shingles
+
+    # Retrieval Re-ranking
+    MMR_ENABLED: bool = True  # Diversify review hits with maximal marginal relevance
+    MMR_LAMBDA: float = 0.6  # 1.0 = pure relevance, 0.0 = pure diversity
+    MMR_FETCH_MULTIPLIER: int = 4  # Candidates fetched per result kept
 
     # OpenAI Config
     OPENAI_API_KEY: str
@@ -26,6 +59,16 @@ class Settings(BaseSettings):
     OPENAI_EMBEDDING_MODEL: str = "text-embedding-3-small"
     OPENAI_MAX_TOKENS: int = 1000
     OPENAI_TEMPERATURE: float = 0.7
+    OPENAI_PROMPT_CACHE_KEY: str = ""  # Optional routing hint so calls sharing the prefix hit the same cache
+
+    # Model Routing Config
+    MODEL_ROUTING_ENABLED: bool = False
+    MODEL_ROUTES: Dict[str, str] = {  # route -> model
+        "chit_chat": "gpt-4o-mini",
+        "lookup": "gpt-4o-mini",
+        "reasoning": "gpt-4o",
+    }
+    ROUTER_LONG_MESSAGE_CHARS: int = 200  # Longer messages go to the reasoning route
 
     # CORS Config
     ALLOWED_ORIGINS: List[str] = ["http://localhost:8000"]
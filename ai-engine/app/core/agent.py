@@ -1,60 +1,199 @@
 """
 LangGraph ReAct Agent for Housing Intelligence
 """
+from contextlib import asynccontextmanager
+import json
+import time
 from langchain_openai import ChatOpenAI
-from langchain_core.messages import AIMessage, HumanMessage, SystemMessage
+from langchain_core.messages import AIMessage, AIMessageChunk, HumanMessage, SystemMessage, ToolMessage
 import langgraph.prebuilt  # Import module first
 from langgraph.prebuilt import create_react_agent
 from langgraph.checkpoint.memory import MemorySaver
 from .tools import AGENT_TOOLS
-from .prompts import SYSTEM_PROMPT
+from .prompts import PLAN_EXECUTE_GUIDANCE, build_system_prompt
+from .plan_execute import create_plan_execute_agent
+from .turn import turn_scope
+from .prefetch import PrefetchScope
+from .telemetry import LLMUsageTracker, prefix_fingerprint
+from .intent import ParsedQuery, parse_message, normalize_message
+from .router import classify_turn, model_for_route, route_stats
 from ..config import settings
 
+# Tools whose results are shown to the user as property cards
+PROPERTY_SEARCH_TOOLS = ("search_properties", "search_properties_semantic")
+
+
+def current_turn_messages(messages):
+    """
+    Return the messages produced by the latest turn
+
+    Args:
+        messages: Full thread history returned by the graph
+
+    Returns:
+        Messages from the last HumanMessage onwards
+    """
+    for i in range(len(messages) - 1, -1, -1):
+        if isinstance(messages[i], HumanMessage):
+            return messages[i:]
+    return messages
+
 
 class HousingAgent:
     """ReAct agent for housing queries with conversation history"""
 
-    def __init__(self):
-        """Initialize the ReAct agent"""
+    def __init__(self, graph: str = None):
+        """
+        Initialize the agent
+
+        Args:
+            graph: "react" or "plan_execute" (defaults to settings.AGENT_GRAPH)
+        """
+        self.graph = graph or settings.AGENT_GRAPH
+
+        # Initialize memory for conversation history (shared by every routed model)
+        self.memory = MemorySaver()
+
+        # Static request prefix: system prompt + tool schemas. It must stay
+        # byte-identical across calls to be eligible for provider prompt caching,
+        # so nothing per-turn is ever formatted into it.
+        self.system_prompt = build_system_prompt(settings.QUERY_NORMALIZATION_ENABLED)
+        if self.graph == "plan_execute":
+            self.system_prompt += PLAN_EXECUTE_GUIDANCE
+        self.prefix = prefix_fingerprint(self.system_prompt, AGENT_TOOLS)
+
+        # One compiled graph per model - the router picks among them per turn
+        self._agents = {}
+        self._llms = {}
+        self.agent = self._agent_for(settings.OPENAI_MODEL)
+        self.llm = self._llms[settings.OPENAI_MODEL]
+
+    def _agent_for(self, model: str):
+        """Get (or build) the compiled graph driven by the given model"""
+        if model in self._agents:
+            return self._agents[model]
+
         # Initialize LLM
-        self.llm = ChatOpenAI(
-            model=settings.OPENAI_MODEL,
+        # stream_usage makes streamed calls report token usage (incl. cached tokens)
+        llm = ChatOpenAI(
+            model=model,
             temperature=settings.OPENAI_TEMPERATURE,
             api_key=settings.OPENAI_API_KEY,
-            streaming=True
+            streaming=True,
+            stream_usage=True,
+            extra_body={"prompt_cache_key": settings.OPENAI_PROMPT_CACHE_KEY} if settings.OPENAI_PROMPT_CACHE_KEY else None
         )
 
-        # Initialize memory for conversation history
-        self.memory = MemorySaver()
+        if self.graph == "plan_execute":
+            # Plan once, run all tools in parallel, synthesize once
+            agent = create_plan_execute_agent(
+                llm,
+                AGENT_TOOLS,
+                prompt=self.system_prompt,
+                checkpointer=self.memory
+            )
+        else:
+            # Create ReAct agent with tools, system prompt, and memory
+            agent = create_react_agent(
+                llm,
+                AGENT_TOOLS,
+                prompt=self.system_prompt,  # Can be string or SystemMessage
+                checkpointer=self.memory
+            )
 
-        # Create ReAct agent with tools, system prompt, and memory
-        self.agent = create_react_agent(
-            self.llm,
-            AGENT_TOOLS,
-            prompt=SYSTEM_PROMPT,  # Can be string or SystemMessage
-            checkpointer=self.memory
-        )
+        self._llms[model] = llm
+        self._agents[model] = agent
+        return agent
 
-    async def ainvoke(self, user_message: str, context: dict = None, thread_id: str = "default"):
+    async def _route(self, user_message: str, parsed: ParsedQuery, config: dict):
+        """
+        Pick the route and graph for this turn
+
+        Returns:
+            (route name, compiled graph)
+        """
+        if not settings.MODEL_ROUTING_ENABLED:
+            return "default", self.agent
+
+        # History state is in-process (MemorySaver), so this is a cheap lookup
+        state = await self.agent.aget_state(config)
+        history = state.values.get("messages", []) if state and state.values else []
+        prior_turns = sum(1 for msg in history if isinstance(msg, HumanMessage))
+
+        route = classify_turn(user_message, parsed, prior_turns)
+        return route, self._agent_for(model_for_route(route))
+
+    def _build_input(self, user_message: str, parsed: ParsedQuery, context: dict = None) -> dict:
+        """
+        Build the graph input for one turn
+
+        The message is rewritten into canonical housing terms with the
+        extracted filters attached. Volatile content (filters, extra context)
+        is carried in the human message, after the cached system prefix and
+        conversation history.
+        """
+        content = user_message
+        if settings.QUERY_NORMALIZATION_ENABLED:
+            content = normalize_message(user_message, parsed).text
+        if context:
+            content += "\n\nContext:\n" + json.dumps(context, ensure_ascii=False, default=str)
+        return {"messages": [HumanMessage(content=content)]}
+
+    @asynccontextmanager
+    async def _turn(self, parsed: ParsedQuery):
+        """
+        Turn scope shared by ainvoke and astream
+
+        Caps parallel tools, tracks the tool token budget and starts the
+        speculative prefetch of likely tool calls.
+        """
+        with turn_scope(settings.AGENT_MAX_PARALLEL_TOOLS, settings.TURN_TOOL_TOKEN_BUDGET) as turn:
+            # Start likely tool calls while the first LLM call is still reasoning
+            if settings.SPECULATIVE_PREFETCH_ENABLED:
+                turn.prefetch = PrefetchScope()
+                turn.prefetch.start(parsed)
+
+            try:
+                yield turn
+            finally:
+                if turn.prefetch is not None:
+                    turn.prefetch.close()
+
+    async def ainvoke(self, user_message: str, context: dict = None, thread_id: str = "default", callbacks: list = None):
         """
         Invoke the ReAct agent asynchronously
 
         Args:
             user_message: User's question
-            context: Additional context (not used in new tool-based approach)
+            context: Optional extra context, sent after the cached prompt prefix
             thread_id: Conversation thread ID for memory
+            callbacks: Optional LangChain callback handlers for this turn
 
         Returns:
             Agent's response with properties found by tools
         """
+        # Record per-call prompt / cached / completion tokens for this turn
+        usage_tracker = LLMUsageTracker()
+
         # Configure thread for memory
-        config = {"configurable": {"thread_id": thread_id}}
+        config = {
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [usage_tracker] + (callbacks or [])
+        }
+
+        # Local parse of the message, shared by normalization, prefetch and routing
+        parsed = parse_message(user_message)
+        route, agent = await self._route(user_message, parsed, config)
 
         # Invoke agent with LangGraph API - agent will use search_properties tool
-        result = await self.agent.ainvoke(
-            {"messages": [HumanMessage(content=user_message)]},
-            config=config
-        )
+        # Parallel tool calls from one LLM step run concurrently, capped per turn
+        started = time.perf_counter()
+        async with self._turn(parsed):
+            result = await agent.ainvoke(
+                self._build_input(user_message, parsed, context),
+                config=config
+            )
+        route_stats.record(route, (time.perf_counter() - started) * 1000)
 
         # Extract final response from messages
         messages = result.get("messages", [])
@@ -64,54 +203,143 @@ class HousingAgent:
             last_message = messages[-1]
             response_text = last_message.content if hasattr(last_message, 'content') else str(last_message)
 
+        # Only look at messages produced by this invocation - everything after
+        # the last HumanMessage (the checkpointer also returns older turns)
+        turn_messages = current_turn_messages(messages)
+
         # Extract search parameters ONLY from the current turn
-        # Strategy: Look for tool calls in the LAST few messages only (from this invocation)
-        # The result includes old messages + new messages from this turn
-        # We'll check the last 10 messages (which should cover any new tool calls)
         search_params = {}
-
-        # Check recent messages for search_properties tool calls
-        recent_messages = messages[-10:] if len(messages) > 10 else messages
-
-        for msg in reversed(recent_messages):
+        for msg in reversed(turn_messages):
             # Look for AIMessage with tool_calls
             if hasattr(msg, 'tool_calls') and msg.tool_calls:
                 for tool_call in msg.tool_calls:
-                    if tool_call.get('name') == 'search_properties':
+                    if tool_call.get('name') in PROPERTY_SEARCH_TOOLS:
                         # Found search_properties - take the most recent one
                         search_params = tool_call.get('args', {})
                         break
                 if search_params:
                     break
 
+        # Collect structured artifacts returned alongside the LLM-facing text
+        artifacts = [
+            {"tool": msg.name, "artifact": msg.artifact}
+            for msg in turn_messages
+            if isinstance(msg, ToolMessage) and getattr(msg, "artifact", None)
+        ]
+
+        # Properties shown to the user come from the most recent property search call
+        property_artifact = next(
+            (a["artifact"] for a in reversed(artifacts) if a["tool"] in PROPERTY_SEARCH_TOOLS),
+            {}
+        )
+
         return {
             "response": response_text,
             "messages": messages,
-            "search_params": search_params  # Only params from current turn
+            "search_params": search_params,  # Only params from current turn
+            "artifacts": artifacts,
+            "property_ids": property_artifact.get("property_ids", []),
+            "properties": property_artifact.get("properties", []),
+            "usage": usage_tracker.summary(),
+            "route": route
         }
 
     async def astream(self, user_message: str, context: dict = None, thread_id: str = "default"):
         """
-        Stream the agent's response
+        Stream the agent's turn as events
 
         Args:
             user_message: User's question
-            context: Additional context (not used in new tool-based approach)
+            context: Optional extra context, sent after the cached prompt prefix
             thread_id: Conversation thread ID
 
         Yields:
-            Chunks of the agent's response
+            Event dicts, in order of occurrence:
+            - {"type": "token", "content"}: text generated by the LLM
+            - {"type": "tool_call", "id", "name", "args"}: a tool the agent called
+            - {"type": "tool_result", "id", "name", "status"}: that tool finished;
+              property searches also carry "property_ids" in rank order
+            - {"type": "done", "response", "conversation_id", "property_ids", "usage", "route"}
         """
-        # Configure thread for memory
-        config = {"configurable": {"thread_id": thread_id}}
-
-        # Stream the response - agent will use search_properties tool
-        async for chunk in self.agent.astream(
-            {"messages": [HumanMessage(content=user_message)]},
-            config=config,
-            stream_mode="values"
-        ):
-            yield chunk
+        usage_tracker = LLMUsageTracker()
+        config = {
+            "configurable": {"thread_id": thread_id},
+            "callbacks": [usage_tracker]
+        }
+
+        parsed = parse_message(user_message)
+        route, agent = await self._route(user_message, parsed, config)
+
+        response_text = ""
+        property_ids = []
+        seen = set()  # Message ids already emitted this turn
+        started = time.perf_counter()
+        async with self._turn(parsed):
+            # "messages" carries LLM tokens as they are generated, "updates"
+            # the complete messages (tool calls, tool results) each node adds
+            async for mode, payload in agent.astream(
+                self._build_input(user_message, parsed, context),
+                config=config,
+                stream_mode=["messages", "updates"]
+            ):
+                if mode == "messages":
+                    chunk, _ = payload
+                    if isinstance(chunk, AIMessageChunk):
+                        text = _text(chunk.content)
+                        if text:
+                            yield {"type": "token", "content": text}
+                    continue
+
+                for update in payload.values():
+                    # A subgraph node (plan_execute's "react") returns the whole
+                    # thread - skip earlier turns and messages already emitted
+                    for msg in current_turn_messages((update or {}).get("messages", [])):
+                        key = msg.id or id(msg)
+                        if key in seen:
+                            continue
+                        seen.add(key)
+
+                        if isinstance(msg, ToolMessage):
+                            event = {
+                                "type": "tool_result",
+                                "id": msg.tool_call_id,
+                                "name": msg.name,
+                                "status": getattr(msg, "status", "success"),
+                            }
+                            if msg.name in PROPERTY_SEARCH_TOOLS:
+                                property_ids = (getattr(msg, "artifact", None) or {}).get("property_ids", [])
+                                event["property_ids"] = property_ids
+                            yield event
+                        elif isinstance(msg, AIMessage) and msg.tool_calls:
+                            for tool_call in msg.tool_calls:
+                                yield {
+                                    "type": "tool_call",
+                                    "id": tool_call.get("id"),
+                                    "name": tool_call.get("name"),
+                                    "args": tool_call.get("args", {}),
+                                }
+                        elif isinstance(msg, AIMessage):
+                            response_text = _text(msg.content)
+        route_stats.record(route, (time.perf_counter() - started) * 1000)
+
+        yield {
+            "type": "done",
+            "response": response_text or "I apologize, I couldn't process that request.",
+            "conversation_id": thread_id,
+            "property_ids": property_ids,
+            "usage": usage_tracker.summary(),
+            "route": route,
+        }
+
+
+def _text(content) -> str:
+    """Text of a message's content (a string, or a list of content blocks)"""
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content or []
+    )
 
 
 # Global agent instance
@@ -0,0 +1,238 @@
+"""
+Precomputed area profiles
+Compact per-area summaries built offline from the full review corpus
+(scripts/build_area_profiles.py) and served by the area tools without
+touching the embedding API or the vector store.
+"""
+import hashlib
+import json
+import re
+from collections import Counter
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional, Tuple
+from .aspects import review_aspect_sentiments, sentiment_label, split_review
+from .formatting import format_naira
+from ..config import settings
+
+# Bump when the profile layout changes so stale artifacts are rebuilt in full
+SCHEMA_VERSION = 1
+
+# Aspects scored in every profile
+PROFILE_ASPECTS = ["power", "water", "security", "traffic", "flooding"]
+
+DEFAULT_PROFILES_PATH = Path(__file__).parent.parent.parent / "data" / "area_profiles.json"
+
+_PHRASE_SPLIT = re.compile(r"[.;,\n]+|\band\b", re.IGNORECASE)
+
+
+def _phrases(text: str) -> List[str]:
+    """Short lowercase phrases from a pros / cons field"""
+    phrases = []
+    for phrase in _PHRASE_SPLIT.split(text or ""):
+        phrase = phrase.strip(" -").lower()
+        if 2 < len(phrase) <= 60:
+            phrases.append(phrase)
+    return phrases
+
+
+def reviews_fingerprint(ids: List[str], documents: List[str], metadatas: List[Dict[str, Any]]) -> str:
+    """
+    Stable hash of an area's reviews, used to detect which areas changed
+
+    Order-independent, so it only moves when reviews are added, removed or edited.
+    """
+    entries = sorted(
+        json.dumps([doc_id, doc, meta], sort_keys=True, default=str)
+        for doc_id, doc, meta in zip(ids, documents, metadatas)
+    )
+    digest = hashlib.sha256()
+    for entry in entries:
+        digest.update(entry.encode("utf-8"))
+    return digest.hexdigest()[:16]
+
+
+def _weighted_mean(pairs: List[Tuple[float, int]]) -> float:
+    return sum(value * weight for value, weight in pairs) / sum(weight for _, weight in pairs)
+
+
+def _weighted_median(pairs: List[Tuple[float, int]]) -> float:
+    """Median of (value, weight) pairs already sorted by value"""
+    half = sum(weight for _, weight in pairs) / 2
+    running = 0
+    for value, weight in pairs:
+        running += weight
+        if running >= half:
+            return value
+    return pairs[-1][0]
+
+
+def build_area_profile(
+    area: str,
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]],
+    top_n: int = 3
+) -> Dict[str, Any]:
+    """
+    Aggregate one area's reviews into a profile
+
+    Args:
+        area: Area name
+        ids: Review document ids
+        documents: Stored review documents
+        metadatas: Review metadata (rating, rent_paid, duplicate_count, ...)
+        top_n: Number of pros / cons to keep
+
+    Returns:
+        Profile dict (JSON-serializable)
+    """
+    # Collapsed near-duplicates stand for duplicate_count reviews each
+    weights = [m.get("duplicate_count") or 1 for m in metadatas]
+    ratings = [
+        (m.get("cluster_avg_rating") or m["rating"], w)
+        for m, w in zip(metadatas, weights) if m.get("rating")
+    ]
+    rents = sorted(
+        (m.get("cluster_avg_rent") or m["rent_paid"], w)
+        for m, w in zip(metadatas, weights) if m.get("rent_paid")
+    )
+
+    pros, cons = Counter(), Counter()
+    aspect_scores: Dict[str, List[Tuple[float, int]]] = {aspect: [] for aspect in PROFILE_ASPECTS}
+
+    for document, weight in zip(documents, weights):
+        parts = split_review(document)
+        for phrase in set(_phrases(parts["pros"])):
+            pros[phrase] += weight
+        for phrase in set(_phrases(parts["cons"])):
+            cons[phrase] += weight
+
+        for aspect, score in review_aspect_sentiments(document).items():
+            if aspect in aspect_scores:
+                aspect_scores[aspect].append((score, weight))
+
+    return {
+        "area": area,
+        "review_count": sum(weights),
+        "avg_rating": round(_weighted_mean(ratings), 2) if ratings else None,
+        "rating_distribution": {
+            str(r): sum(w for rating, w in ratings if round(rating) == r) for r in range(1, 6)
+        },
+        "avg_rent": round(_weighted_mean(rents)) if rents else None,
+        "median_rent": _weighted_median(rents) if rents else None,
+        "rent_range": [rents[0][0], rents[-1][0]] if rents else None,
+        "aspects": {
+            aspect: {
+                "score": round(_weighted_mean(scores), 2) if scores else None,
+                "mentions": sum(w for _, w in scores),
+            }
+            for aspect, scores in aspect_scores.items()
+        },
+        "top_pros": [[phrase, count] for phrase, count in pros.most_common(top_n)],
+        "top_cons": [[phrase, count] for phrase, count in cons.most_common(top_n)],
+        "source_hash": reviews_fingerprint(ids, documents, metadatas),
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+    }
+
+
+def format_profile(profile: Dict[str, Any]) -> str:
+    """
+    Render a profile as the compact text the area tools return
+
+    Args:
+        profile: Profile from build_area_profile()
+
+    Returns:
+        A few short lines: aggregates, aspect scores, top pros and cons
+    """
+    rent_range = profile.get("rent_range") or [0, 0]
+    avg_rating = profile.get("avg_rating")
+    rating = f"avg rating {avg_rating:.1f}/5, " if avg_rating is not None else ""
+    lines = [
+        f"{profile['area']}: {profile['review_count']} reviews, {rating}"
+        f"avg rent {format_naira(profile.get('avg_rent') or 0)} "
+        f"(median {format_naira(profile.get('median_rent') or 0)}, "
+        f"range {format_naira(rent_range[0])}-{format_naira(rent_range[1])})",
+    ]
+    lines.append("aspects: " + ", ".join(
+        f"{aspect} {sentiment_label(stats['score'])}/{stats['mentions']}"
+        for aspect, stats in profile.get("aspects", {}).items()
+    ))
+    if profile.get("top_pros"):
+        lines.append("pros: " + "; ".join(f"{p} ({n})" for p, n in profile["top_pros"]))
+    if profile.get("top_cons"):
+        lines.append("cons: " + "; ".join(f"{c} ({n})" for c, n in profile["top_cons"]))
+    return "\n".join(lines)
+
+
+class AreaProfileStore:
+    """In-memory view of the versioned area profile artifact"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or settings.AREA_PROFILES_PATH or DEFAULT_PROFILES_PATH)
+        self.version = 0
+        self.built_at: Optional[str] = None
+        self.profiles: Dict[str, Dict[str, Any]] = {}
+        self._rendered: Dict[str, str] = {}
+        self._loaded = False
+
+    def load(self) -> int:
+        """
+        (Re)load the artifact from disk
+
+        Returns:
+            Number of profiles loaded (0 if the artifact is missing or stale)
+        """
+        self._loaded = True
+        self.profiles, self._rendered = {}, {}
+
+        if not self.path.exists():
+            print(f"⚠️  No area profiles at {self.path} - area tools will query reviews live")
+            return 0
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"❌ Error loading area profiles: {e}")
+            return 0
+
+        if data.get("schema_version") != SCHEMA_VERSION:
+            print("⚠️  Area profiles were built with another schema - rebuild them")
+            return 0
+
+        self.version = data.get("version", 0)
+        self.built_at = data.get("built_at")
+        for area, profile in data.get("areas", {}).items():
+            key = area.strip().lower()
+            self.profiles[key] = profile
+            # Rendered once here so lookups are a dict read
+            self._rendered[key] = format_profile(profile)
+
+        print(f"✅ Loaded {len(self.profiles)} area profiles (v{self.version})")
+        return len(self.profiles)
+
+    def get(self, area: str) -> Optional[Dict[str, Any]]:
+        """Profile for an area (case-insensitive), or None"""
+        if not self._loaded:
+            self.load()
+        return self.profiles.get((area or "").strip().lower())
+
+    def render(self, area: str) -> Optional[str]:
+        """Formatted profile text for an area, or None"""
+        if not self._loaded:
+            self.load()
+        return self._rendered.get((area or "").strip().lower())
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Artifact version and the areas it covers"""
+        return {
+            "path": str(self.path),
+            "version": self.version,
+            "built_at": self.built_at,
+            "areas": sorted(p["area"] for p in self.profiles.values()),
+        }
+
+
+# Global instance
+area_profiles = AreaProfileStore()
@@ -0,0 +1,250 @@
+"""
+Aspect-tagged review index
+Reviews are tagged with the aspects they discuss (and the sentiment of
+what they say) at ingestion time. A posting list per (area, aspect) then
+answers topic questions like "how is the water in Yaba?" with a dict
+lookup instead of an embedding call and a similarity search.
+"""
+import json
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+from .aspects import ASPECT_KEYWORDS, aspect_snippets, review_aspect_sentiments
+from .formatting import excerpt
+from ..config import settings
+
+# Bump when tagging rules change so stored tags are recomputed
+TAGGER_VERSION = 1
+SCHEMA_VERSION = 1
+
+DEFAULT_INDEX_PATH = Path(__file__).parent.parent.parent / "data" / "aspect_index.json"
+
+
+def tag_review(document: str) -> Dict[str, Any]:
+    """
+    Aspect metadata for one review document
+
+    ChromaDB metadata values must be scalars, so the aspect list is stored
+    as a comma-separated string with one sentiment field per aspect.
+
+    Args:
+        document: Stored review document ("<review> Pros: ... Cons: ...")
+
+    Returns:
+        Metadata fields to merge into the review's metadata
+    """
+    sentiments = review_aspect_sentiments(document)
+    tags: Dict[str, Any] = {
+        "aspects": ",".join(aspect for aspect in ASPECT_KEYWORDS if aspect in sentiments),
+        "aspect_tagger": TAGGER_VERSION,
+    }
+    for aspect, sentiment in sentiments.items():
+        tags[f"aspect_{aspect}_sentiment"] = round(sentiment, 2)
+    return tags
+
+
+def review_aspects(metadata: Dict[str, Any]) -> List[str]:
+    """Aspects recorded in a review's metadata"""
+    return [a for a in (metadata.get("aspects") or "").split(",") if a]
+
+
+def build_aspect_index(
+    ids: List[str],
+    documents: List[str],
+    metadatas: List[Dict[str, Any]]
+) -> Dict[str, Dict[str, Dict[str, Any]]]:
+    """
+    Build posting lists per (area, aspect) from tagged reviews
+
+    Reviews without stored tags are tagged on the fly.
+
+    Args:
+        ids: Review document ids
+        documents: Stored review documents
+        metadatas: Review metadata
+
+    Returns:
+        {area: {aspect: {score, mentions, positive, negative, postings}}}
+        with postings ordered most opinionated first and counts weighted
+        by each review's duplicate_count
+    """
+    index: Dict[str, Dict[str, Dict[str, Any]]] = {}
+
+    for doc_id, document, metadata in zip(ids, documents, metadatas):
+        area = metadata.get("area")
+        if not area:
+            continue
+        if metadata.get("aspect_tagger") != TAGGER_VERSION:
+            metadata = {**metadata, **tag_review(document)}
+
+        snippets = aspect_snippets(document)
+        for aspect in review_aspects(metadata):
+            sentiment = metadata.get(f"aspect_{aspect}_sentiment", 0.0)
+            entry = index.setdefault(area, {}).setdefault(aspect, {"postings": []})
+            entry["postings"].append({
+                "id": doc_id,
+                "review_id": metadata.get("review_id"),
+                "rating": metadata.get("rating"),
+                "rent_paid": metadata.get("rent_paid"),
+                "sentiment": sentiment,
+                "duplicates": metadata.get("duplicate_count") or 1,
+                "snippet": excerpt(snippets.get(aspect, document), settings.REVIEW_EXCERPT_CHARS),
+            })
+
+    for aspects in index.values():
+        for entry in aspects.values():
+            postings = entry["postings"]
+            postings.sort(key=lambda p: -abs(p["sentiment"]))
+            # Collapsed near-duplicates count once per review they stand for
+            mentions = sum(p["duplicates"] for p in postings)
+            entry["mentions"] = mentions
+            entry["score"] = round(sum(p["sentiment"] * p["duplicates"] for p in postings) / mentions, 2)
+            entry["positive"] = sum(p["duplicates"] for p in postings if p["sentiment"] > 0)
+            entry["negative"] = sum(p["duplicates"] for p in postings if p["sentiment"] < 0)
+
+    return index
+
+
+def _balanced(postings: List[Dict[str, Any]], limit: int) -> List[Dict[str, Any]]:
+    """Pick postings alternating negative and positive so both sides are heard"""
+    negative = [p for p in postings if p["sentiment"] < 0]
+    positive = [p for p in postings if p["sentiment"] >= 0]
+    picked = []
+    while len(picked) < limit and (negative or positive):
+        for side in (negative, positive):
+            if side and len(picked) < limit:
+                picked.append(side.pop(0))
+    return picked
+
+
+class AspectIndex:
+    """In-memory view of the versioned aspect index artifact"""
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = Path(path or settings.ASPECT_INDEX_PATH or DEFAULT_INDEX_PATH)
+        self.version = 0
+        self.built_at: Optional[str] = None
+        self.areas: Dict[str, Dict[str, Dict[str, Any]]] = {}
+        self.area_names: Dict[str, str] = {}
+        self._loaded = False
+
+    def load(self) -> int:
+        """
+        (Re)load the artifact from disk
+
+        Returns:
+            Number of areas indexed (0 if the artifact is missing or stale)
+        """
+        self._loaded = True
+        self.areas, self.area_names = {}, {}
+
+        if not self.path.exists():
+            print(f"⚠️  No aspect index at {self.path} - topic questions will use vector search")
+            return 0
+
+        try:
+            data = json.loads(self.path.read_text(encoding="utf-8"))
+        except (OSError, ValueError) as e:
+            print(f"❌ Error loading aspect index: {e}")
+            return 0
+
+        if data.get("schema_version") != SCHEMA_VERSION:
+            print("⚠️  Aspect index was built with another schema - rebuild it")
+            return 0
+
+        self.version = data.get("version", 0)
+        self.built_at = data.get("built_at")
+        for area, aspects in data.get("areas", {}).items():
+            key = area.strip().lower()
+            self.areas[key] = aspects
+            self.area_names[key] = area
+
+        print(f"✅ Loaded aspect index for {len(self.areas)} areas (v{self.version})")
+        return len(self.areas)
+
+    def lookup(self, area: str, aspect: str, limit: int = 5) -> Optional[Dict[str, Any]]:
+        """
+        Precomputed scores and top postings for one (area, aspect)
+
+        Args:
+            area: Area name (case-insensitive)
+            aspect: Aspect name from ASPECT_KEYWORDS
+            limit: Maximum postings to return
+
+        Returns:
+            {area, aspect, score, mentions, positive, negative, postings},
+            or None if the area is not indexed
+        """
+        if not self._loaded:
+            self.load()
+
+        key = (area or "").strip().lower()
+        aspects = self.areas.get(key)
+        if aspects is None:
+            return None
+
+        entry = aspects.get(aspect)
+        if entry is None:
+            # Area indexed but no review mentions the aspect - that is an answer too
+            entry = {"score": None, "mentions": 0, "positive": 0, "negative": 0, "postings": []}
+
+        return {
+            "area": self.area_names[key],
+            "aspect": aspect,
+            "score": entry["score"],
+            "mentions": entry["mentions"],
+            "positive": entry["positive"],
+            "negative": entry["negative"],
+            "postings": _balanced(entry["postings"], limit),
+        }
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Artifact version and the areas it covers"""
+        return {
+            "path": str(self.path),
+            "version": self.version,
+            "built_at": self.built_at,
+            "areas": sorted(self.area_names.values()),
+        }
+
+
+def write_aspect_index(index: Dict[str, Any], path: Optional[Path] = None) -> int:
+    """
+    Write the index artifact, bumping its version when the content changed
+
+    Args:
+        index: Result of build_aspect_index()
+        path: Artifact path (defaults to ASPECT_INDEX_PATH)
+
+    Returns:
+        Version written (unchanged if the content was identical)
+    """
+    path = AspectIndex(path).path
+    previous = {}
+    if path.exists():
+        try:
+            previous = json.loads(path.read_text(encoding="utf-8"))
+        except ValueError:
+            previous = {}
+
+    if previous.get("schema_version") == SCHEMA_VERSION and previous.get("areas") == index:
+        return previous.get("version", 0)
+
+    version = previous.get("version", 0) + 1
+    artifact = {
+        "schema_version": SCHEMA_VERSION,
+        "version": version,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "areas": index,
+    }
+
+    # Swap in atomically so a running engine never reads a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(artifact, indent=2, ensure_ascii=False), encoding="utf-8")
+    tmp_path.replace(path)
+    return version
+
+
+# Global instance
+aspect_index = AspectIndex()
@@ -0,0 +1,170 @@
+"""
+Housing aspect lexicon
+Keyword lists for the topics tenants talk about most, plus a small
+sentiment lexicon for scoring what reviews say about each topic
+"""
+import re
+from typing import Dict, List
+
+# Aspect -> keywords (matched as whole words / phrases, case-insensitive)
+ASPECT_KEYWORDS: Dict[str, List[str]] = {
+    "power": ["power", "electricity", "light", "nepa", "phcn", "generator", "outage", "outages", "blackout"],
+    "water": ["water", "borehole", "tanker", "tankers", "water supply"],
+    "security": ["security", "secure", "safe", "safety", "crime", "robbery", "break-in", "break-ins", "burglary", "thieves"],
+    "noise": ["noise", "noisy", "quiet", "serene", "peaceful", "calm", "loud", "parties"],
+    "traffic": ["traffic", "commute", "transport", "transportation", "road", "roads", "bus", "buses", "keke", "go-slow", "rush hour"],
+    "flooding": ["flood", "floods", "flooding", "flooded", "waterlogged", "drainage"],
+    "landlord": ["landlord", "landlords", "agent", "caretaker", "repairs", "maintenance"],
+    "value": ["value", "expensive", "affordable", "cheap", "overpriced", "service charge", "service charges"],
+}
+
+_ASPECT_PATTERNS = {
+    aspect: re.compile(r"\b(" + "|".join(re.escape(k) for k in keywords) + r")\b", re.IGNORECASE)
+    for aspect, keywords in ASPECT_KEYWORDS.items()
+}
+
+
+def detect_aspects(text: str) -> List[str]:
+    """
+    Detect which aspects a piece of text talks about
+
+    Args:
+        text: Message or review text
+
+    Returns:
+        Aspect names in lexicon order
+    """
+    if not text:
+        return []
+    return [aspect for aspect, pattern in _ASPECT_PATTERNS.items() if pattern.search(text)]
+
+
+POSITIVE_WORDS = {
+    "good", "great", "excellent", "stable", "reliable", "constant", "consistent", "secure", "safe",
+    "quiet", "serene", "peaceful", "calm", "responsive", "reasonable", "affordable", "easy", "improving",
+    "clean", "best", "fair", "worth", "love", "nice", "smooth", "tight", "well", "available", "regularly",
+}
+NEGATIVE_WORDS = {
+    "bad", "poor", "terrible", "unstable", "inconsistent", "outage", "outages", "scarcity", "problem",
+    "problems", "issue", "issues", "noisy", "difficult", "expensive", "overpriced", "flooding", "flood",
+    "waterlogged", "nightmare", "frustrating", "break-ins", "robbery", "worst", "jammed", "stressful",
+    "concern", "disturbing", "limited", "low", "severe", "awful", "horrible", "outrageous", "lack",
+}
+NEGATIONS = {"no", "not", "never", "rarely", "hardly", "without", "don't", "doesn't", "isn't", "wasn't"}
+
+_SENTENCE_SPLIT = re.compile(r"(?<=[.!?])\s+")
+_WORD = re.compile(r"[a-z']+(?:-[a-z]+)?")
+
+
+def sentence_sentiment(sentence: str) -> float:
+    """
+    Lexicon sentiment of one sentence in [-1, 1]
+
+    A negation within the two preceding words flips a word's polarity
+    ("no water problem" reads as positive).
+    """
+    words = _WORD.findall(sentence.lower())
+    score = 0
+    for i, word in enumerate(words):
+        polarity = 1 if word in POSITIVE_WORDS else -1 if word in NEGATIVE_WORDS else 0
+        if polarity and any(w in NEGATIONS for w in words[max(0, i - 2):i]):
+            polarity = -polarity
+        score += polarity
+    if score == 0:
+        return 0.0
+    return max(-1.0, min(1.0, score / 2))
+
+
+def aspect_sentiments(text: str) -> Dict[str, float]:
+    """
+    Sentiment per aspect mentioned in a review
+
+    Each sentence is scored once and credited to every aspect it mentions.
+
+    Args:
+        text: Review text
+
+    Returns:
+        {aspect: mean sentence sentiment in [-1, 1]} for aspects mentioned
+    """
+    scores: Dict[str, List[float]] = {}
+    for sentence in _SENTENCE_SPLIT.split(text or ""):
+        aspects = detect_aspects(sentence)
+        if not aspects:
+            continue
+        sentiment = sentence_sentiment(sentence)
+        for aspect in aspects:
+            scores.setdefault(aspect, []).append(sentiment)
+    return {aspect: sum(values) / len(values) for aspect, values in scores.items()}
+
+
+def sentiment_label(score) -> str:
+    """Short label for an aggregate sentiment score, e.g. "poor(-0.4)" """
+    if score is None:
+        return "n/a"
+    if score >= 0.25:
+        return f"good({score:+.1f})"
+    if score <= -0.25:
+        return f"poor({score:+.1f})"
+    return f"mixed({score:+.1f})"
+
+
+_PROS_CONS = re.compile(r"\s(Pros|Cons):\s", re.IGNORECASE)
+
+
+def split_review(document: str) -> Dict[str, str]:
+    """
+    Split a stored review document back into text, pros and cons
+
+    Documents are stored as "<review> Pros: <pros> Cons: <cons>".
+    """
+    parts = {"text": "", "pros": "", "cons": ""}
+    pieces = _PROS_CONS.split(" " + (document or ""))
+    parts["text"] = pieces[0].strip()
+    for label, body in zip(pieces[1::2], pieces[2::2]):
+        parts[label.lower()] = body.strip()
+    return parts
+
+
+def review_aspect_sentiments(document: str) -> Dict[str, float]:
+    """
+    Aspect sentiment for a full review document
+
+    Sentiment comes from the free text and is pushed up / down by aspects
+    the tenant listed under pros / cons.
+
+    Args:
+        document: Stored review document
+
+    Returns:
+        {aspect: sentiment in [-1, 1]} for aspects mentioned anywhere in the review
+    """
+    parts = split_review(document)
+    sentiments = aspect_sentiments(parts["text"])
+    for aspect in detect_aspects(parts["pros"]):
+        sentiments[aspect] = max(sentiments.get(aspect, 0.0), 0.5)
+    for aspect in detect_aspects(parts["cons"]):
+        sentiments[aspect] = min(sentiments.get(aspect, 0.0), -0.5)
+    return sentiments
+
+
+def aspect_snippets(document: str) -> Dict[str, str]:
+    """
+    The sentences of a review that talk about each aspect
+
+    Args:
+        document: Stored review document
+
+    Returns:
+        {aspect: matching sentences joined, or the pros / cons entry}
+    """
+    parts = split_review(document)
+    snippets: Dict[str, List[str]] = {}
+    for sentence in _SENTENCE_SPLIT.split(parts["text"]):
+        for aspect in detect_aspects(sentence):
+            snippets.setdefault(aspect, []).append(sentence.strip())
+    for label in ("pros", "cons"):
+        for aspect in detect_aspects(parts[label]):
+            if aspect not in snippets:
+                snippets[aspect] = [f"{label.capitalize()}: {parts[label]}"]
+    return {aspect: " ".join(sentences) for aspect, sentences in snippets.items()}
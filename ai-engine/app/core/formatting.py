@@ -0,0 +1,145 @@
+"""
+Compact, token-budgeted formatting of tool outputs
+Everything a tool returns is re-sent to the LLM on every later call, so
+results are encoded as tables with shared fields hoisted out and trimmed
+to per-tool and per-turn token budgets.
+"""
+import functools
+import re
+from typing import Any, Callable, Dict, List, Optional, Sequence
+from .turn import current_turn
+from ..config import settings
+
+try:
+    import tiktoken
+    _encoding = tiktoken.get_encoding("cl100k_base")
+except Exception:  # tiktoken missing or encoding not available offline
+    _encoding = None
+
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+
+
+def estimate_tokens(text: str) -> int:
+    """Token count of text (tiktoken when available, ~4 chars/token otherwise)"""
+    if not text:
+        return 0
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    return (len(text) + 3) // 4
+
+
+def format_naira(amount: Any) -> str:
+    """Short Naira amount: ₦850k, ₦1.25M"""
+    try:
+        value = float(amount)
+    except (TypeError, ValueError):
+        return "-"
+    if value >= 1_000_000:
+        return f"₦{value / 1_000_000:.2f}".rstrip("0").rstrip(".") + "M"
+    if value >= 1_000:
+        return f"₦{value / 1_000:.0f}k"
+    return f"₦{value:.0f}"
+
+
+def excerpt(text: str, max_chars: int) -> str:
+    """Trim text to max_chars, preferring a sentence boundary"""
+    text = " ".join((text or "").split())
+    if len(text) <= max_chars:
+        return text
+    cut = text[:max_chars]
+    boundaries = [m.start() for m in _SENTENCE_END.finditer(cut)]
+    if boundaries and boundaries[-1] > max_chars // 2:
+        return cut[:boundaries[-1]]
+    return cut.rsplit(" ", 1)[0] + "…"
+
+
+def compact_table(rows: Sequence[Dict[str, Any]], columns: Sequence[str]) -> List[str]:
+    """
+    Encode rows as pipe-separated lines
+
+    Columns whose value is identical in every row are hoisted into a single
+    "key=value" line instead of being repeated per row.
+
+    Args:
+        rows: Row dicts (already formatted values)
+        columns: Column order
+
+    Returns:
+        Lines: optional shared-fields line, header line, one line per row
+    """
+    if not rows:
+        return []
+
+    shared = {}
+    if len(rows) > 1:
+        for column in columns:
+            values = {str(row.get(column, "")) for row in rows}
+            if len(values) == 1:
+                shared[column] = values.pop()
+
+    varying = [c for c in columns if c not in shared]
+    lines = []
+    if shared:
+        lines.append(" ".join(f"{k}={v}" for k, v in shared.items()))
+    lines.append("|".join(varying))
+    for row in rows:
+        lines.append("|".join(str(row.get(c, "")).replace("|", "/") for c in varying))
+    return lines
+
+
+def fit_lines(lines: List[str], budget: int, keep: int = 1) -> str:
+    """
+    Join lines, dropping trailing rows that don't fit the token budget
+
+    Args:
+        lines: Output lines, most important first
+        budget: Maximum tokens
+        keep: Leading lines (headers) that are always kept
+
+    Returns:
+        Text within budget with a note on how many lines were dropped
+    """
+    kept = list(lines[:keep])
+    used = estimate_tokens("\n".join(kept))
+    for line in lines[keep:]:
+        cost = estimate_tokens(line) + 1
+        if used + cost > budget:
+            break
+        kept.append(line)
+        used += cost
+
+    dropped = len(lines) - len(kept)
+    if dropped:
+        kept.append(f"(+{dropped} more omitted)")
+    return "\n".join(kept)
+
+
+def tool_budget(tool_name: str) -> int:
+    """Token budget for one call of a tool"""
+    return settings.TOOL_OUTPUT_TOKEN_BUDGETS.get(tool_name, settings.TOOL_OUTPUT_TOKEN_BUDGET)
+
+
+def budgeted(fn: Callable):
+    """
+    Charge a tool's output against the turn's token budget
+
+    Output that would overrun what is left of the turn budget is cut back
+    line by line. Works for plain string tools and (content, artifact) tools.
+    """
+    @functools.wraps(fn)
+    async def wrapper(**kwargs):
+        result = await fn(**kwargs)
+
+        turn = current_turn()
+        if turn is None or turn.tool_tokens_remaining is None:
+            return result
+
+        content, artifact = result if isinstance(result, tuple) else (result, None)
+        remaining = max(turn.tool_tokens_remaining, 0)
+        if estimate_tokens(content) > remaining:
+            content = fit_lines(content.split("\n"), remaining, keep=1)
+        turn.tool_tokens_remaining -= estimate_tokens(content)
+
+        return (content, artifact) if isinstance(result, tuple) else content
+
+    return wrapper
@@ -0,0 +1,278 @@
+"""
+Fast local intent and filter extraction
+Deterministic parsing and normalization of Lagos housing messages - no LLM involved
+"""
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional, Any
+from .aspects import detect_aspects
+
+# Canonical area name -> aliases (lowercase)
+LAGOS_AREAS: Dict[str, List[str]] = {
+    "Lekki": ["lekki"],
+    "Ajah": ["ajah"],
+    "Victoria Island": ["victoria island", "vi", "v.i", "v/i"],
+    "Ikoyi": ["ikoyi"],
+    "Ikeja": ["ikeja"],
+    "Yaba": ["yaba"],
+    "Surulere": ["surulere"],
+    "Gbagada": ["gbagada"],
+    "Maryland": ["maryland"],
+    "Festac": ["festac", "festac town"],
+}
+
+# Property type patterns, checked in order (more specific first)
+PROPERTY_TYPE_PATTERNS = [
+    ("room", re.compile(r"\b(self[\s-]?con(tain(ed)?)?|single room|room)\b", re.IGNORECASE)),
+    ("duplex", re.compile(r"\bduplex(es)?\b", re.IGNORECASE)),
+    ("house", re.compile(r"\b(house|houses|bungalow|bungalows|detached)\b", re.IGNORECASE)),
+    ("apartment", re.compile(r"\b(apartment|apartments|mini[\s-]?flats?|flat|flats)\b", re.IGNORECASE)),
+]
+
+# A mini flat is a 1-bedroom apartment (a self-con is the single room)
+_MINI_FLAT_PATTERN = re.compile(r"\bmini[\s-]?flats?\b", re.IGNORECASE)
+
+_NUMBER_WORDS = {"one": 1, "two": 2, "three": 3, "four": 4, "five": 5, "six": 6}
+
+# "2 rooms", "3 bedroom", "two-bed", "4br"
+_BEDROOMS_PATTERN = re.compile(
+    r"\b(\d|one|two|three|four|five|six)[\s-]*(bedrooms?|beds?|br|rooms?)\b",
+    re.IGNORECASE
+)
+
+# "500k", "2M", "1.5 million", "N800,000", "₦2,000,000"
+_AMOUNT = r"(?:₦|ngn\s*|n(?=\d))?\s*(\d+(?:[.,]\d+)*)\s*(k|m|mil|million|thousand)?\b"
+_MONEY_PATTERN = re.compile(_AMOUNT, re.IGNORECASE)
+_BETWEEN_PATTERN = re.compile(r"\bbetween\s+" + _AMOUNT + r"\s*(?:and|-|to)\s*" + _AMOUNT, re.IGNORECASE)
+_MAX_CUES = re.compile(r"\b(under|below|less than|not more than|max(imum)?|at most|within|budget( of| is)?|for|around|about|up to)\s*$", re.IGNORECASE)
+_MIN_CUES = re.compile(r"\b(above|over|more than|from|at least|min(imum)?|starting( at| from)?)\s*$", re.IGNORECASE)
+
+_LISTING_CUES = re.compile(
+    r"\b(find|show|need|looking for|look for|want|search|available|listings?|rent|to let|options)\b",
+    re.IGNORECASE
+)
+_COMPARE_CUES = re.compile(r"\b(compare|comparison|vs\.?|versus|better|difference between)\b", re.IGNORECASE)
+_AREA_INFO_CUES = re.compile(
+    r"\b(what'?s it like|what is it like|living in|live in|tell me (more )?about|how is|how's|reviews?|experience|neighbou?rhood)\b",
+    re.IGNORECASE
+)
+_CHIT_CHAT_PATTERN = re.compile(
+    r"^\s*(hi|hello|hey|thanks|thank you|thank u|ok(ay)?|cool|great|nice|good (morning|afternoon|evening)|bye|goodbye)\b[\s!.?]*$",
+    re.IGNORECASE
+)
+
+
+@dataclass
+class ParsedQuery:
+    """Result of local message parsing"""
+    intent: str = "general"  # properties | compare | area_info | reviews | chit_chat | general
+    areas: List[str] = field(default_factory=list)
+    property_type: Optional[str] = None
+    bedrooms: Optional[int] = None
+    min_rent: Optional[int] = None
+    max_rent: Optional[int] = None
+    aspects: List[str] = field(default_factory=list)
+
+    @property
+    def area(self) -> Optional[str]:
+        """First area mentioned"""
+        return self.areas[0] if self.areas else None
+
+    def property_filters(self) -> Dict[str, Any]:
+        """Arguments for search_properties (only the ones extracted)"""
+        filters = {
+            "area": self.area,
+            "property_type": self.property_type,
+            "bedrooms": self.bedrooms,
+            "min_rent": self.min_rent,
+            "max_rent": self.max_rent,
+        }
+        return {k: v for k, v in filters.items() if v is not None}
+
+
+def _to_naira(number: str, unit: Optional[str]) -> Optional[int]:
+    """Convert a matched amount like ('1.5', 'm') to Naira"""
+    try:
+        value = float(number.replace(",", ""))
+    except ValueError:
+        return None
+
+    unit = (unit or "").lower()
+    if unit in ("k", "thousand"):
+        value *= 1_000
+    elif unit in ("m", "mil", "million"):
+        value *= 1_000_000
+    return int(value)
+
+
+def extract_areas(text: str) -> List[str]:
+    """Canonical Lagos areas mentioned in the text, in order of appearance"""
+    found = []
+    lowered = text.lower()
+    for area, aliases in LAGOS_AREAS.items():
+        positions = [
+            m.start()
+            for alias in aliases
+            for m in re.finditer(r"(?<![\w.])" + re.escape(alias) + r"(?![\w])", lowered)
+        ]
+        if positions:
+            found.append((min(positions), area))
+    return [area for _, area in sorted(found)]
+
+
+def extract_rent(text: str) -> Dict[str, int]:
+    """Extract min_rent / max_rent from budget phrases"""
+    between = _BETWEEN_PATTERN.search(text)
+    if between:
+        low = _to_naira(between.group(1), between.group(2))
+        high = _to_naira(between.group(3), between.group(4))
+        if low and high:
+            return {"min_rent": min(low, high), "max_rent": max(low, high)}
+
+    rent = {}
+    for match in _MONEY_PATTERN.finditer(text):
+        number, unit = match.group(1), match.group(2)
+        raw = match.group(0)
+        # Only treat as money with a unit, a currency sign or a plausible annual rent
+        amount = _to_naira(number, unit)
+        if amount is None:
+            continue
+        if not unit and "₦" not in raw and not raw.lower().lstrip().startswith(("n", "ngn")) and amount < 50_000:
+            continue
+
+        prefix = text[:match.start()]
+        if _MIN_CUES.search(prefix):
+            rent["min_rent"] = amount
+        elif _MAX_CUES.search(prefix) or unit:
+            rent.setdefault("max_rent", amount)
+    return rent
+
+
+def extract_bedrooms(text: str) -> Optional[int]:
+    """Extract bedroom count ("2 rooms" means a 2-bedroom unit, a mini flat has 1)"""
+    match = _BEDROOMS_PATTERN.search(text)
+    if not match:
+        return 1 if _MINI_FLAT_PATTERN.search(text) else None
+    number = match.group(1).lower()
+    return int(number) if number.isdigit() else _NUMBER_WORDS.get(number)
+
+
+def extract_property_type(text: str, bedrooms: Optional[int]) -> Optional[str]:
+    """Map Nigerian property terms to the property_type enum"""
+    # "2 rooms" is an apartment, not a room - strip bedroom phrases first
+    stripped = _BEDROOMS_PATTERN.sub(" ", text)
+    for property_type, pattern in PROPERTY_TYPE_PATTERNS:
+        if pattern.search(stripped):
+            return property_type
+    if bedrooms is not None:
+        return "apartment"
+    return None
+
+
+def parse_message(text: str) -> ParsedQuery:
+    """
+    Parse a user message into intent and search filters
+
+    Args:
+        text: Raw user message
+
+    Returns:
+        ParsedQuery with everything that could be extracted deterministically
+    """
+    text = text or ""
+    bedrooms = extract_bedrooms(text)
+    rent = extract_rent(text)
+    parsed = ParsedQuery(
+        areas=extract_areas(text),
+        bedrooms=bedrooms,
+        property_type=extract_property_type(text, bedrooms),
+        min_rent=rent.get("min_rent"),
+        max_rent=rent.get("max_rent"),
+        aspects=detect_aspects(text),
+    )
+
+    has_listing_filters = any(
+        v is not None for v in (parsed.property_type, parsed.bedrooms, parsed.min_rent, parsed.max_rent)
+    )
+
+    if _CHIT_CHAT_PATTERN.match(text):
+        parsed.intent = "chit_chat"
+    elif len(parsed.areas) >= 2 and _COMPARE_CUES.search(text):
+        parsed.intent = "compare"
+    elif has_listing_filters or (parsed.areas and _LISTING_CUES.search(text) and not parsed.aspects):
+        parsed.intent = "properties"
+    elif parsed.aspects:
+        parsed.intent = "reviews"
+    elif parsed.areas and _AREA_INFO_CUES.search(text):
+        parsed.intent = "area_info"
+
+    return parsed
+
+
+# Canonical rewrites applied to the message text, in order
+_REWRITES = [
+    (re.compile(r"\bself[\s-]?con(tain(ed)?)?\b", re.IGNORECASE), "self-contained room"),
+    (_MINI_FLAT_PATTERN, "mini flat (1-bedroom apartment)"),
+    (re.compile(r"\b(VI|V\.I\.?|V/I)(?![\w])"), "Victoria Island"),
+    (re.compile(r"(?<![\w.])(vi|v\.i\.?|v/i)(?![\w])(?=\s*[?.!,]?\s*$|\s+(and|or|for|under|below|with|area)\b)"), "Victoria Island"),
+]
+_ROOMS_PATTERN = re.compile(r"\b(\d|one|two|three|four|five|six)[\s-]*rooms?\b", re.IGNORECASE)
+_AMOUNT_WITH_UNIT = re.compile(r"(?:₦|ngn\s*|n(?=\d))?(\d+(?:[.,]\d+)*)\s*(k|m|mil|million|thousand)\b", re.IGNORECASE)
+
+
+@dataclass
+class NormalizedMessage:
+    """User message rewritten into canonical terms"""
+    text: str  # Text to send to the agent
+    parsed: ParsedQuery
+
+
+def _rewrite_amount(match: re.Match) -> str:
+    amount = _to_naira(match.group(1), match.group(2))
+    return f"₦{amount:,}" if amount is not None else match.group(0)
+
+
+def normalize_message(text: str, parsed: Optional[ParsedQuery] = None) -> NormalizedMessage:
+    """
+    Rewrite Nigerian housing shorthand into canonical terms
+
+    "2 rooms" becomes "2-bedroom apartment", "self-con" becomes
+    "self-contained room", "VI" becomes "Victoria Island" and amounts like
+    "500k" / "2M" become full Naira figures. Extracted filters are appended
+    as a [Parsed: ...] line so the agent can use them as tool arguments.
+
+    Args:
+        text: Raw user message
+        parsed: Result of parse_message(text), if already computed
+
+    Returns:
+        NormalizedMessage with the rewritten text and parsed filters
+    """
+    parsed = parsed or parse_message(text)
+    normalized = text
+
+    for pattern, replacement in _REWRITES:
+        normalized = pattern.sub(replacement, normalized)
+
+    # "2 rooms" is a 2-bedroom apartment unless another type is named
+    names_type = any(
+        pattern.search(_BEDROOMS_PATTERN.sub(" ", text))
+        for property_type, pattern in PROPERTY_TYPE_PATTERNS
+        if property_type != "room"
+    )
+    normalized = _ROOMS_PATTERN.sub(
+        lambda m: f"{m.group(1)}-bedroom" + ("" if names_type else " apartment"),
+        normalized
+    )
+    normalized = _AMOUNT_WITH_UNIT.sub(_rewrite_amount, normalized)
+
+    annotations = dict(parsed.property_filters())
+    if len(parsed.areas) > 1:
+        annotations.pop("area", None)
+        annotations["areas"] = ", ".join(parsed.areas)
+    if parsed.aspects:
+        annotations["topics"] = ", ".join(parsed.aspects)
+    if annotations:
+        normalized += "\n\n[Parsed: " + "; ".join(f"{k}={v}" for k, v in annotations.items()) + "]"
+
+    return NormalizedMessage(text=normalized, parsed=parsed)
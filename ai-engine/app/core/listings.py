@@ -0,0 +1,151 @@
+"""
+Property listings for semantic search
+Listing titles and descriptions are embedded into their own collection
+(synced from the properties table by scripts/sync_property_listings.py)
+and queried with structured filters and semantic ranking in one call.
+"""
+import hashlib
+from typing import Any, Dict, List, Optional
+from .vector_db import listings_db
+
+# Area filters match name prefixes, like the backend's area_matches() LIKE.
+# ChromaDB has no string prefix operator, so each listing stores its area's
+# prefixes as area_prefix_<n> fields up to this length. All of them are
+# always written - ChromaDB merges metadata on update, so a field left out
+# after a rename to a shorter area would keep the old prefix.
+AREA_PREFIX_MAX_CHARS = 32
+
+
+def listing_document(prop: Dict[str, Any]) -> str:
+    """
+    Text embedded for a listing
+
+    Title and description carry the semantics; type, size and location are
+    included so queries like "family house near Lekki" also match.
+    """
+    parts = [
+        prop.get("title") or "",
+        prop.get("description") or "",
+        f"{prop.get('bedrooms')}-bedroom {prop.get('property_type')} in {prop.get('area')}.",
+        prop.get("address") or "",
+    ]
+    return " ".join(part.strip() for part in parts if part and part.strip())
+
+
+def area_key(area: Optional[str]) -> str:
+    """Case-insensitive form of an area name"""
+    return (area or "").strip().lower()
+
+
+def area_prefix_fields(area: Optional[str]) -> Dict[str, str]:
+    """
+    area_prefix_1 .. area_prefix_<AREA_PREFIX_MAX_CHARS> for the area name
+
+    Fields past the name's length hold the whole name, which no query of
+    that length can equal.
+    """
+    key = area_key(area)
+    return {f"area_prefix_{n}": key[:n] for n in range(1, AREA_PREFIX_MAX_CHARS + 1)}
+
+
+def listing_metadata(prop: Dict[str, Any]) -> Dict[str, Any]:
+    """Filterable listing fields (scalars only, as ChromaDB requires)"""
+    return {
+        "property_id": prop["id"],
+        "title": prop.get("title") or "",
+        "area": prop.get("area") or "",
+        "area_key": area_key(prop.get("area")),
+        **area_prefix_fields(prop.get("area")),
+        "property_type": prop.get("property_type") or "",
+        "bedrooms": int(prop.get("bedrooms") or 0),
+        "bathrooms": int(prop.get("bathrooms") or 0),
+        "rent_price": float(prop.get("rent_price") or 0),
+        "is_available": bool(prop.get("is_available", True)),
+    }
+
+
+def text_hash(document: str) -> str:
+    """Hash of the embedded text - a listing is only re-embedded when it changes"""
+    return hashlib.sha256(document.encode("utf-8")).hexdigest()[:16]
+
+
+def listing_where(
+    area: Optional[str] = None,
+    property_type: Optional[str] = None,
+    bedrooms: Optional[int] = None,
+    bathrooms: Optional[int] = None,
+    min_rent: Optional[float] = None,
+    max_rent: Optional[float] = None,
+    is_available: Optional[bool] = True
+) -> Optional[Dict[str, Any]]:
+    """
+    ChromaDB where clause for structured listing filters
+
+    The area matches case-insensitive name prefixes ("Lekki" matches
+    "Lekki Phase 1"), the same set the backend's SQL filter returns.
+
+    Returns:
+        Where clause, or None when no filter is set
+    """
+    clauses: List[Dict[str, Any]] = []
+    key = area_key(area)
+    if key:
+        if len(key) <= AREA_PREFIX_MAX_CHARS:
+            clauses.append({f"area_prefix_{len(key)}": {"$eq": key}})
+        else:
+            clauses.append({"area_key": {"$eq": key}})  # Longer than any stored prefix
+    if property_type:
+        clauses.append({"property_type": {"$eq": property_type.lower()}})
+    if bedrooms is not None:
+        clauses.append({"bedrooms": {"$eq": int(bedrooms)}})
+    if bathrooms is not None:
+        clauses.append({"bathrooms": {"$eq": int(bathrooms)}})
+    # Range bounds are separate clauses - ChromaDB allows one operator per field clause
+    if min_rent is not None:
+        clauses.append({"rent_price": {"$gte": float(min_rent)}})
+    if max_rent is not None:
+        clauses.append({"rent_price": {"$lte": float(max_rent)}})
+    if is_available is not None:
+        clauses.append({"is_available": {"$eq": bool(is_available)}})
+
+    if not clauses:
+        return None
+    if len(clauses) == 1:
+        return clauses[0]
+    return {"$and": clauses}
+
+
+async def search_listings(
+    query: str,
+    filters: Optional[Dict[str, Any]] = None,
+    limit: int = 10
+) -> List[Dict[str, Any]]:
+    """
+    Rank listings matching the structured filters by semantic similarity
+
+    Args:
+        query: Free-text description of what the user wants
+        filters: Keyword arguments for listing_where()
+        limit: Maximum number of listings
+
+    Returns:
+        Hits ordered by score: {property_id, score, metadata}
+    """
+    from ..services.embedding_service import embedding_service
+
+    query_embedding = await embedding_service.aembed_text(query)
+    results = await listings_db.aquery(
+        query_embeddings=[query_embedding],
+        n_results=limit,
+        where=listing_where(**(filters or {}))
+    )
+
+    hits = listings_db.to_hits(results)
+    return [
+        {
+            "property_id": hit["metadata"].get("property_id"),
+            "score": round(hit["score"], 4),
+            "metadata": hit["metadata"],
+        }
+        for hit in (hits[0] if hits else [])
+    ]
@@ -0,0 +1,55 @@
+"""
+Maximal marginal relevance (MMR) re-ranking
+Picks results that are relevant to the query but not redundant with each
+other, so templated near-duplicate reviews don't crowd out other evidence.
+"""
+from typing import List, Sequence
+import numpy as np
+
+
+def mmr_rerank(
+    query_embedding: Sequence[float],
+    candidate_embeddings: Sequence[Sequence[float]],
+    k: int,
+    lambda_mult: float = 0.7
+) -> List[int]:
+    """
+    Select k diverse candidates by maximal marginal relevance
+
+    Each step picks the candidate maximising
+    lambda * sim(query, c) - (1 - lambda) * max(sim(c, selected)).
+    Similarities are cosine; the redundancy term is updated incrementally,
+    so the whole selection costs k matrix-vector products.
+
+    Args:
+        query_embedding: Query vector
+        candidate_embeddings: Candidate vectors, in retrieval order
+        k: Number of results to keep
+        lambda_mult: 1.0 = pure relevance, 0.0 = pure diversity
+
+    Returns:
+        Indices into candidate_embeddings, in selection order
+    """
+    if candidate_embeddings is None or len(candidate_embeddings) == 0 or k <= 0:
+        return []
+
+    candidates = np.asarray(candidate_embeddings, dtype=np.float32)
+    query = np.asarray(query_embedding, dtype=np.float32)
+
+    candidates = candidates / np.maximum(np.linalg.norm(candidates, axis=1, keepdims=True), 1e-12)
+    query = query / max(float(np.linalg.norm(query)), 1e-12)
+
+    relevance = candidates @ query
+    k = min(k, len(candidates))
+
+    selected = [int(np.argmax(relevance))]
+    redundancy = candidates @ candidates[selected[0]]
+
+    while len(selected) < k:
+        scores = lambda_mult * relevance - (1 - lambda_mult) * redundancy
+        scores[selected] = -np.inf
+        best = int(np.argmax(scores))
+        selected.append(best)
+        redundancy = np.maximum(redundancy, candidates @ candidates[best])
+
+    return selected
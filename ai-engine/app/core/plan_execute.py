@@ -0,0 +1,79 @@
+"""
+Plan-and-execute LangGraph agent for Housing Intelligence
+
+Alternative to the prebuilt ReAct loop that bounds LLM round-trips:
+1. plan       - one LLM call emits every tool call the turn needs
+2. execute    - all planned tool calls run in parallel
+3. synthesize - one LLM call writes the answer from the results
+If the synthesis step still asks for tools, those are executed and the
+turn falls back to a regular ReAct loop.
+"""
+from typing import Annotated, Sequence, TypedDict
+from langchain_core.messages import BaseMessage, SystemMessage
+from langgraph.graph import StateGraph, END
+from langgraph.graph.message import add_messages
+from langgraph.prebuilt import ToolNode, create_react_agent
+
+
+class PlanExecuteState(TypedDict):
+    """Graph state - same message channel as the prebuilt ReAct agent"""
+    messages: Annotated[Sequence[BaseMessage], add_messages]
+
+
+def _has_tool_calls(state: PlanExecuteState) -> bool:
+    """Whether the last message requests tools"""
+    last_message = state["messages"][-1]
+    return bool(getattr(last_message, "tool_calls", None))
+
+
+def create_plan_execute_agent(llm, tools, prompt: str, checkpointer=None):
+    """
+    Build the plan-and-execute graph
+
+    Args:
+        llm: Chat model
+        tools: Tools available to the agent
+        prompt: System prompt
+        checkpointer: Optional checkpointer for conversation memory
+
+    Returns:
+        Compiled graph with the same invoke/stream interface as create_react_agent
+    """
+    system_message = SystemMessage(content=prompt)
+    llm_with_tools = llm.bind_tools(tools)
+
+    async def plan(state: PlanExecuteState):
+        """Single planning call - emits all needed tool calls, or answers directly"""
+        response = await llm_with_tools.ainvoke([system_message] + list(state["messages"]))
+        return {"messages": [response]}
+
+    async def synthesize(state: PlanExecuteState):
+        """Single synthesis call over the executed tool results"""
+        response = await llm_with_tools.ainvoke([system_message] + list(state["messages"]))
+        return {"messages": [response]}
+
+    def route_after_plan(state: PlanExecuteState):
+        return "execute" if _has_tool_calls(state) else END
+
+    def route_after_synthesize(state: PlanExecuteState):
+        # Model wants to chain more tools - this turn is too complex for one plan
+        return "fallback_tools" if _has_tool_calls(state) else END
+
+    # ReAct loop used only for complex turns (no checkpointer - the outer graph owns memory)
+    react_agent = create_react_agent(llm, tools, prompt=prompt)
+
+    graph = StateGraph(PlanExecuteState)
+    graph.add_node("plan", plan)
+    graph.add_node("execute", ToolNode(tools))
+    graph.add_node("synthesize", synthesize)
+    graph.add_node("fallback_tools", ToolNode(tools))
+    graph.add_node("react", react_agent)
+
+    graph.set_entry_point("plan")
+    graph.add_conditional_edges("plan", route_after_plan, ["execute", END])
+    graph.add_edge("execute", "synthesize")
+    graph.add_conditional_edges("synthesize", route_after_synthesize, ["fallback_tools", END])
+    graph.add_edge("fallback_tools", "react")
+    graph.add_edge("react", END)
+
+    return graph.compile(checkpointer=checkpointer)
@@ -0,0 +1,194 @@
+"""
+Speculative tool prefetching
+Predicts the agent's first tool calls from the raw message and starts them
+while the first LLM call is still deciding what to do.
+"""
+import asyncio
+import functools
+import inspect
+import json
+from typing import Any, Callable, Dict, List, Optional, Tuple
+from .intent import ParsedQuery
+from .aspects import detect_aspects
+from .turn import current_turn
+
+# Tool name -> undecorated coroutine function, registered by @speculative
+_TOOL_FUNCTIONS: Dict[str, Callable] = {}
+
+
+class PrefetchStats:
+    """Process-wide prefetch counters"""
+
+    def __init__(self):
+        self.turns = 0
+        self.predicted = 0  # Speculative calls started
+        self.hits = 0  # Real tool calls served from a prefetch
+        self.misses = 0  # Real tool calls with no matching prefetch
+        self.wasted = 0  # Prefetches cancelled or never used
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Counters plus derived rates"""
+        calls = self.hits + self.misses
+        return {
+            "turns": self.turns,
+            "predicted": self.predicted,
+            "hits": self.hits,
+            "misses": self.misses,
+            "wasted": self.wasted,
+            "hit_rate": round(self.hits / calls, 3) if calls else 0.0,
+            "precision": round(self.hits / self.predicted, 3) if self.predicted else 0.0,
+        }
+
+
+prefetch_stats = PrefetchStats()
+
+
+def _bind_args(name: str, kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Apply the tool's defaults so equivalent calls produce the same key"""
+    fn = _TOOL_FUNCTIONS[name]
+    bound = inspect.signature(fn).bind_partial(**kwargs)
+    bound.apply_defaults()
+    return dict(bound.arguments)
+
+
+def tool_key(name: str, kwargs: Dict[str, Any]) -> str:
+    """
+    Cache key identifying a tool call
+
+    Strings are case-folded and None arguments dropped. Review searches are
+    keyed on (area, aspects) rather than the exact query wording, since
+    two phrasings of the same topic retrieve the same reviews.
+    """
+    args = _bind_args(name, kwargs)
+    normalized = {
+        k: v.strip().lower() if isinstance(v, str) else v
+        for k, v in args.items()
+        if v is not None
+    }
+
+    if name == "search_tenant_reviews":
+        aspects = detect_aspects(normalized.pop("query", ""))
+        if aspects:
+            normalized["aspects"] = aspects
+        else:
+            # No recognised topic - fall back to the literal query
+            normalized["query"] = args.get("query", "").strip().lower()
+
+    return name + ":" + json.dumps(normalized, sort_keys=True, default=str)
+
+
+def predict_tool_calls(parsed: ParsedQuery) -> List[Tuple[str, Dict[str, Any]]]:
+    """
+    Predict the tool calls the agent is likely to make first
+
+    Args:
+        parsed: Locally parsed message
+
+    Returns:
+        List of (tool name, arguments)
+    """
+    predictions = []
+
+    if parsed.intent == "properties" and parsed.property_filters():
+        predictions.append(("search_properties", parsed.property_filters()))
+
+    if parsed.intent == "compare" and len(parsed.areas) >= 2:
+        predictions.append(("compare_areas", {"area1": parsed.areas[0], "area2": parsed.areas[1]}))
+
+    if parsed.intent == "area_info" and parsed.area:
+        predictions.append(("get_area_statistics", {"area": parsed.area}))
+
+    if parsed.aspects and parsed.area:
+        predictions.append((
+            "search_tenant_reviews",
+            {"query": f"{' and '.join(parsed.aspects)} in {parsed.area}", "area": parsed.area}
+        ))
+
+    return [(name, args) for name, args in predictions if name in _TOOL_FUNCTIONS]
+
+
+class PrefetchScope:
+    """Speculative tool calls in flight for one turn"""
+
+    def __init__(self):
+        self.tasks: Dict[str, asyncio.Task] = {}
+        self.used: set = set()
+
+    def start(self, parsed: ParsedQuery) -> List[str]:
+        """
+        Fire the tool calls predicted from the parsed message
+
+        Must be called inside the turn scope so the tasks share its context.
+
+        Args:
+            parsed: Result of parse_message() for the user's message
+
+        Returns:
+            Keys of the calls started
+        """
+        prefetch_stats.turns += 1
+        for name, args in predict_tool_calls(parsed):
+            key = tool_key(name, args)
+            if key not in self.tasks:
+                self.tasks[key] = asyncio.create_task(_TOOL_FUNCTIONS[name](**args))
+                prefetch_stats.predicted += 1
+        return list(self.tasks)
+
+    async def take(self, name: str, kwargs: Dict[str, Any]) -> Tuple[bool, Any]:
+        """
+        Serve a real tool call from a matching prefetch
+
+        Returns:
+            (True, result) on a usable hit, (False, None) otherwise
+        """
+        key = tool_key(name, kwargs)
+        task = self.tasks.get(key)
+        if task is None or key in self.used:
+            prefetch_stats.misses += 1
+            return False, None
+
+        self.used.add(key)
+        try:
+            result = await task
+        except Exception:
+            # Speculative run failed - let the real call try again
+            prefetch_stats.misses += 1
+            return False, None
+
+        prefetch_stats.hits += 1
+        return True, result
+
+    def close(self):
+        """Cancel mispredictions at the end of the turn"""
+        for key, task in self.tasks.items():
+            if key not in self.used:
+                prefetch_stats.wasted += 1
+                if not task.done():
+                    task.cancel()
+                elif not task.cancelled():
+                    task.exception()  # Mark retrieved so failures aren't logged as unhandled
+        self.tasks.clear()
+
+
+def speculative(name: str):
+    """
+    Let a tool be served from the turn's prefetched results
+
+    Apply beneath @tool so the tool's schema still comes from the wrapped
+    function's signature and docstring.
+    """
+    def decorator(fn: Callable):
+        _TOOL_FUNCTIONS[name] = fn
+
+        @functools.wraps(fn)
+        async def wrapper(**kwargs):
+            turn = current_turn()
+            if turn is not None and turn.prefetch is not None:
+                hit, result = await turn.prefetch.take(name, kwargs)
+                if hit:
+                    return result
+            return await fn(**kwargs)
+
+        return wrapper
+
+    return decorator
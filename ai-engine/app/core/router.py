@@ -0,0 +1,86 @@
+"""
+Per-turn model routing
+Sends chit-chat and simple lookups to a fast model and multi-step
+reasoning to the larger one, using only cheap local features.
+"""
+import re
+from collections import deque
+from typing import Any, Dict
+from .intent import ParsedQuery
+from ..config import settings
+
+# Phrases that signal the user wants judgement, not just data
+_REASONING_CUES = re.compile(
+    r"\b(compare|comparison|versus|vs\.?|better|best|trade-?offs?|pros and cons|recommend|should i|"
+    r"advice|advise|worth it|which (one|area|is)|why|explain|plan|family|commute to)\b",
+    re.IGNORECASE
+)
+
+
+class RouteStats:
+    """Latency samples per route"""
+
+    def __init__(self, history_size: int = 500):
+        self.history_size = history_size
+        self.latencies: Dict[str, deque] = {}
+        self.counts: Dict[str, int] = {}
+
+    def record(self, route: str, latency_ms: float):
+        """Add one turn's latency"""
+        self.counts[route] = self.counts.get(route, 0) + 1
+        self.latencies.setdefault(route, deque(maxlen=self.history_size)).append(latency_ms)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Turn count and mean / p50 / p95 latency per route"""
+        stats = {}
+        for route, samples in self.latencies.items():
+            ordered = sorted(samples)
+            stats[route] = {
+                "turns": self.counts[route],
+                "model": settings.MODEL_ROUTES.get(route, settings.OPENAI_MODEL),
+                "mean_ms": round(sum(ordered) / len(ordered), 1),
+                "p50_ms": round(ordered[len(ordered) // 2], 1),
+                "p95_ms": round(ordered[min(len(ordered) - 1, int(len(ordered) * 0.95))], 1),
+            }
+        return stats
+
+
+route_stats = RouteStats()
+
+
+def classify_turn(message: str, parsed: ParsedQuery, prior_turns: int) -> str:
+    """
+    Classify how much reasoning a turn needs
+
+    Args:
+        message: Raw user message
+        parsed: Local parse of the message
+        prior_turns: Number of earlier user turns in the conversation
+
+    Returns:
+        Route name: "chit_chat", "lookup" or "reasoning"
+    """
+    if parsed.intent == "chit_chat":
+        return "chit_chat"
+
+    if parsed.intent == "compare" or _REASONING_CUES.search(message):
+        return "reasoning"
+
+    # Several areas or topics at once need the answers weighed against each other
+    if len(parsed.areas) > 1 or len(parsed.aspects) > 2:
+        return "reasoning"
+
+    if len(message) > settings.ROUTER_LONG_MESSAGE_CHARS:
+        return "reasoning"
+
+    # A follow-up with nothing to parse ("and the cheaper one?") has to be
+    # resolved against earlier turns; an opening message like that is a lookup
+    if parsed.intent == "general" and prior_turns > 0:
+        return "reasoning"
+
+    return "lookup"
+
+
+def model_for_route(route: str) -> str:
+    """Model configured for a route (falls back to OPENAI_MODEL)"""
+    return settings.MODEL_ROUTES.get(route, settings.OPENAI_MODEL)
@@ -0,0 +1,111 @@
+"""
+LLM usage telemetry
+Records prompt, cached and completion tokens plus latency for every LLM
+call, so the effect of provider-side prompt-prefix caching is measurable.
+"""
+import hashlib
+import json
+import time
+from collections import deque
+from typing import Any, Dict, List
+from uuid import UUID
+from langchain_core.callbacks import AsyncCallbackHandler
+from langchain_core.outputs import LLMResult
+from langchain_core.utils.function_calling import convert_to_openai_tool
+
+
+class LLMUsageStats:
+    """Process-wide LLM usage aggregates"""
+
+    def __init__(self, history_size: int = 200):
+        self.calls = 0
+        self.prompt_tokens = 0
+        self.cached_tokens = 0
+        self.completion_tokens = 0
+        self.recent = deque(maxlen=history_size)
+
+    def record(self, call: Dict[str, Any]):
+        """Add one LLM call"""
+        self.calls += 1
+        self.prompt_tokens += call["prompt_tokens"]
+        self.cached_tokens += call["cached_tokens"]
+        self.completion_tokens += call["completion_tokens"]
+        self.recent.append(call)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Totals, cache hit ratio and latency split by cache use"""
+        cached_latencies = [c["latency_ms"] for c in self.recent if c["cached_tokens"]]
+        uncached_latencies = [c["latency_ms"] for c in self.recent if not c["cached_tokens"]]
+        return {
+            "calls": self.calls,
+            "prompt_tokens": self.prompt_tokens,
+            "cached_tokens": self.cached_tokens,
+            "completion_tokens": self.completion_tokens,
+            "cached_ratio": round(self.cached_tokens / self.prompt_tokens, 3) if self.prompt_tokens else 0.0,
+            "avg_latency_ms_cached": round(sum(cached_latencies) / len(cached_latencies), 1) if cached_latencies else None,
+            "avg_latency_ms_uncached": round(sum(uncached_latencies) / len(uncached_latencies), 1) if uncached_latencies else None,
+            "recent": list(self.recent)[-20:],
+        }
+
+
+llm_usage_stats = LLMUsageStats()
+
+
+class LLMUsageTracker(AsyncCallbackHandler):
+    """Callback collecting token usage for the LLM calls of one turn"""
+
+    def __init__(self):
+        self.calls: List[Dict[str, Any]] = []
+        self._started: Dict[UUID, float] = {}
+
+    async def on_chat_model_start(self, serialized, messages, *, run_id: UUID, **kwargs):
+        self._started[run_id] = time.perf_counter()
+
+    async def on_llm_end(self, response: LLMResult, *, run_id: UUID, **kwargs):
+        started = self._started.pop(run_id, None)
+        latency_ms = (time.perf_counter() - started) * 1000 if started else 0.0
+
+        usage = {}
+        model = None
+        for generations in response.generations:
+            for generation in generations:
+                message = getattr(generation, "message", None)
+                if message is not None and getattr(message, "usage_metadata", None):
+                    usage = message.usage_metadata
+                    model = (message.response_metadata or {}).get("model_name")
+
+        details = usage.get("input_token_details") or {}
+        call = {
+            "model": model,
+            "prompt_tokens": usage.get("input_tokens", 0),
+            "cached_tokens": details.get("cache_read", 0) or 0,
+            "completion_tokens": usage.get("output_tokens", 0),
+            "latency_ms": round(latency_ms, 1),
+        }
+        self.calls.append(call)
+        llm_usage_stats.record(call)
+
+    def summary(self) -> Dict[str, Any]:
+        """Per-turn totals"""
+        return {
+            "llm_calls": len(self.calls),
+            "prompt_tokens": sum(c["prompt_tokens"] for c in self.calls),
+            "cached_tokens": sum(c["cached_tokens"] for c in self.calls),
+            "completion_tokens": sum(c["completion_tokens"] for c in self.calls),
+            "calls": self.calls,
+        }
+
+
+def prefix_fingerprint(system_prompt: str, tools: list) -> Dict[str, Any]:
+    """
+    Hash of the static request prefix (system prompt + tool schemas)
+
+    The provider can only reuse its prompt cache while this stays identical
+    between calls, so a changing fingerprint flags an unstable prefix.
+    """
+    tool_schemas = [convert_to_openai_tool(t) for t in tools]
+    payload = system_prompt + json.dumps(tool_schemas, sort_keys=True, ensure_ascii=False)
+    return {
+        "sha256": hashlib.sha256(payload.encode("utf-8")).hexdigest()[:16],
+        "chars": len(payload),
+    }
@@ -3,21 +3,51 @@ LangChain tools for the ReAct agent
 These tools allow the agent to search properties and reviews
 """
 from langchain_core.tools import tool
-from typing import Optional
+from typing import Optional, Tuple, Dict, Any
+import asyncio
 import httpx
 from .vector_db import vector_db
+from .area_profiles import area_profiles
+from .listings import search_listings
+from .aspect_index import aspect_index
+from .aspects import detect_aspects, sentiment_label
+from .turn import tool_slot
+from .prefetch import speculative
+from .formatting import budgeted, compact_table, excerpt, fit_lines, format_naira, tool_budget
 from ..config import settings
 
 
-@tool
-def search_properties(
+# Shared HTTP client for backend calls (keeps connections alive across tool calls)
+_http_client: Optional[httpx.AsyncClient] = None
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """Get the shared async HTTP client, creating it on first use"""
+    global _http_client
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(timeout=settings.BACKEND_TIMEOUT)
+    return _http_client
+
+
+async def close_http_client():
+    """Close the shared HTTP client (called on app shutdown)"""
+    global _http_client
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
+
+@tool(response_format="content_and_artifact")
+@budgeted
+@speculative("search_properties")
+async def search_properties(
     area: Optional[str] = None,
     property_type: Optional[str] = None,
     bedrooms: Optional[int] = None,
     min_rent: Optional[int] = None,
     max_rent: Optional[int] = None,
     limit: int = 10
-) -> str:
+) -> Tuple[str, Dict[str, Any]]:
     """
     Search for available rental properties in Lagos, Nigeria.
 
@@ -39,7 +69,8 @@ def search_properties(
         # Build query parameters
         params = {
             "is_available": True,
-            "page_size": limit
+            "page_size": limit,
+            "view": "card"  # Listing columns only - the agent never reads images or landlord
         }
 
         if area:
@@ -54,8 +85,8 @@ def search_properties(
             params["max_rent"] = max_rent
 
         # Call backend API
-        with httpx.Client(timeout=10.0) as client:
-            response = client.get(
+        async with tool_slot():
+            response = await get_http_client().get(
                 f"{settings.BACKEND_URL}/api/v1/properties",
                 params=params
             )
@@ -64,6 +95,14 @@ def search_properties(
 
         properties = data.get("properties", [])
 
+        # Structured artifact for the caller - never shown to the LLM
+        artifact = {
+            "params": {k: v for k, v in params.items() if k not in ("is_available", "page_size", "view")},
+            "property_ids": [prop.get("id") for prop in properties],
+            "properties": properties,
+            "total": data.get("total", len(properties))
+        }
+
         if not properties:
             filter_desc = []
             if property_type:
@@ -76,50 +115,182 @@ def search_properties(
                 filter_desc.append(f"under ₦{max_rent:,.0f}")
 
             filters = " ".join(filter_desc) if filter_desc else "matching your criteria"
-            return f"No properties found {filters}. Try adjusting your search criteria."
-
-        # Format results for AI
-        formatted_properties = []
-        for i, prop in enumerate(properties, 1):
-            prop_type = prop.get("property_type", "Property")
-            title = prop.get("title", "Untitled")
-            prop_area = prop.get("area", "Unknown")
-            price = float(prop.get("rent_price", 0))  # Convert string to float
-            beds = prop.get("bedrooms", 0)
-            baths = prop.get("bathrooms", 0)
-
-            formatted_properties.append(
-                f"{i}. {title}\n"
-                f"   Type: {prop_type} | Area: {prop_area}\n"
-                f"   Bedrooms: {beds} | Bathrooms: {baths}\n"
-                f"   Annual Rent: ₦{price:,.0f}\n"
-            )
+            return f"No properties found {filters}. Try adjusting your search criteria.", artifact
+
+        # Compact table for the AI - one row per property, shared fields hoisted
+        rows = [
+            {
+                "title": prop.get("title", "Untitled"),
+                "type": prop.get("property_type", "property"),
+                "area": prop.get("area", "Unknown"),
+                "beds": prop.get("bedrooms", 0),
+                "baths": prop.get("bathrooms", 0),
+                "rent/yr": format_naira(prop.get("rent_price", 0)),
+            }
+            for prop in properties
+        ]
 
-        result = f"Found {len(properties)} properties:\n\n" + "\n".join(formatted_properties)
+        total = artifact["total"]
+        header = f"Found {total} properties" + (f" (showing {len(properties)})" if total > len(properties) else "") + ":"
+        lines = [header] + compact_table(rows, ["title", "type", "area", "beds", "baths", "rent/yr"])
 
-        if len(properties) >= limit:
-            result += f"\n\n(Showing first {limit} results. There may be more available.)"
+        result = fit_lines(lines, tool_budget("search_properties"), keep=3)
 
-        return result
+        return result, artifact
 
     except httpx.HTTPError as e:
         error_msg = f"HTTP Error: {type(e).__name__}: {str(e)}"
         print(f"🔴 search_properties HTTP error: {error_msg}")
-        return f"Error connecting to property database: {error_msg}"
+        return f"Error connecting to property database: {error_msg}", {}
     except Exception as e:
         error_msg = f"{type(e).__name__}: {str(e)}"
         print(f"🔴 search_properties error: {error_msg}")
         import traceback
         traceback.print_exc()
-        return f"Error searching properties: {error_msg}"
+        return f"Error searching properties: {error_msg}", {}
 
 
-@tool
-def search_tenant_reviews(
+@tool(response_format="content_and_artifact")
+@budgeted
+async def search_properties_semantic(
+    query: str,
+    area: Optional[str] = None,
+    property_type: Optional[str] = None,
+    bedrooms: Optional[int] = None,
+    min_rent: Optional[int] = None,
+    max_rent: Optional[int] = None,
+    limit: int = 10
+) -> Tuple[str, Dict[str, Any]]:
+    """
+    Find rental properties matching a free-text description, ranked by relevance.
+
+    Use this tool instead of search_properties when the user describes qualities
+    the structured filters can't express, e.g. "quiet flat near the lagoon with
+    parking", "serviced apartment with 24/7 power", "family house with a big compound".
+    Any structured filters given are applied in the same search.
+
+    Args:
+        query: Description of the property the user wants
+        area: Area/neighborhood in Lagos (e.g., "Lekki", "Yaba")
+        property_type: One of "apartment", "house", "duplex", "room"
+        bedrooms: Number of bedrooms
+        min_rent: Minimum annual rent in Naira
+        max_rent: Maximum annual rent in Naira
+        limit: Maximum number of results to return (default: 10)
+
+    Returns:
+        Matching properties, most relevant first
+    """
+    try:
+        params = {
+            "area": area,
+            "property_type": property_type,
+            "bedrooms": bedrooms,
+            "min_rent": min_rent,
+            "max_rent": max_rent,
+        }
+        params = {k: v for k, v in params.items() if v is not None}
+
+        async with tool_slot():
+            hits = await search_listings(query, filters=params, limit=limit)
+
+        # Cards are hydrated by ID on the backend, like search_properties results
+        artifact = {
+            "query": query,
+            "params": params,
+            "property_ids": [hit["property_id"] for hit in hits],
+            "properties": [],
+            "total": len(hits)
+        }
+
+        if not hits:
+            return f"No properties found matching '{query}'. Try fewer filters or a broader description.", artifact
+
+        rows = [
+            {
+                "title": hit["metadata"].get("title", "Untitled"),
+                "type": hit["metadata"].get("property_type", "property"),
+                "area": hit["metadata"].get("area", "Unknown"),
+                "beds": hit["metadata"].get("bedrooms", 0),
+                "baths": hit["metadata"].get("bathrooms", 0),
+                "rent/yr": format_naira(hit["metadata"].get("rent_price", 0)),
+                "match": f"{hit['score']:.2f}",
+            }
+            for hit in hits
+        ]
+        lines = [f"Found {len(hits)} properties for '{query}' (best match first):"]
+        lines += compact_table(rows, ["title", "type", "area", "beds", "baths", "rent/yr", "match"])
+
+        return fit_lines(lines, tool_budget("search_properties_semantic"), keep=3), artifact
+
+    except Exception as e:
+        return f"Error searching properties: {type(e).__name__}: {str(e)}", {}
+
+
+def _indexed_reviews(query: str, area: str, n_results: int) -> Optional[Tuple[str, Dict[str, Any]]]:
+    """
+    Answer a topic question for one area from the aspect index
+
+    Returns:
+        (content, artifact) like search_tenant_reviews, or None when the
+        query names no known aspect or the area is not indexed
+    """
+    aspects = detect_aspects(query)
+    if not aspects:
+        return None
+
+    per_aspect = max(1, n_results // len(aspects))
+    entries = [aspect_index.lookup(area, aspect, per_aspect) for aspect in aspects]
+    if any(entry is None for entry in entries):
+        return None
+
+    lines, rows, hits = [], [], []
+    for entry in entries:
+        lines.append(
+            f"{entry['aspect']} in {entry['area']}: {sentiment_label(entry['score'])} across "
+            f"{entry['mentions']} reviews ({entry['positive']} positive, {entry['negative']} negative)"
+        )
+        for posting in entry["postings"]:
+            rows.append({
+                "aspect": entry["aspect"],
+                "rating": posting["rating"] if posting["rating"] is not None else "-",
+                "sentiment": f"{posting['sentiment']:+.1f}",
+                "review": posting["snippet"],
+            })
+            hits.append({
+                "id": posting["id"],
+                "text": posting["snippet"],
+                "metadata": {
+                    "review_id": posting["review_id"],
+                    "area": entry["area"],
+                    "rating": posting["rating"],
+                    "rent_paid": posting["rent_paid"],
+                    "aspect": entry["aspect"],
+                },
+                "score": 1.0
+            })
+
+    lines += compact_table(rows, ["aspect", "rating", "sentiment", "review"])
+    content = fit_lines(lines, tool_budget("search_tenant_reviews"), keep=len(entries) + 1)
+
+    artifact = {
+        "query": query,
+        "area": area,
+        "aspects": aspects,
+        "source": "aspect_index",
+        "hits": hits
+    }
+    return content, artifact
+
+
+@tool(response_format="content_and_artifact")
+@budgeted
+@speculative("search_tenant_reviews")
+async def search_tenant_reviews(
     query: str,
     area: Optional[str] = None,
     n_results: int = 5
-) -> str:
+) -> Tuple[str, Dict[str, Any]]:
     """
     Search tenant reviews and experiences about living in different areas of Lagos.
 
@@ -138,51 +309,129 @@ def search_tenant_reviews(
         Formatted string with relevant tenant reviews
     """
     try:
-        # Generate embedding for the query
+        # Topic questions about one area are a posting-list lookup - no embedding needed
+        if settings.ASPECT_INDEX_ENABLED and area:
+            indexed = _indexed_reviews(query, area, n_results)
+            if indexed is not None:
+                return indexed
+
         from ..services.embedding_service import embedding_service
-        query_embedding = embedding_service.embed_text(query)
 
         # Build metadata filter
         where_filter = None
         if area:
             where_filter = {"area": {"$eq": area}}
 
-        # Query ChromaDB
-        results = vector_db.query(
-            query_embeddings=[query_embedding],
-            n_results=n_results,
-            where=where_filter
-        )
+        async with tool_slot():
+            # Generate embedding for the query
+            query_embedding = await embedding_service.aembed_text(query)
+
+            # Query ChromaDB (MMR re-ranked so near-duplicate reviews don't crowd the results)
+            results = await vector_db.asearch(
+                query_embeddings=[query_embedding],
+                n_results=n_results,
+                where=where_filter
+            )
 
         # Format results
         if not results or not results.get('documents') or not results['documents'][0]:
-            return f"No reviews found for query: '{query}'" + (f" in {area}" if area else "")
+            return f"No reviews found for query: '{query}'" + (f" in {area}" if area else ""), {"query": query, "area": area, "hits": []}
+
+        hits = vector_db.to_hits(results)[0]
+
+        # Compact table for the AI - templated reviews often repeat, keep each text once
+        rows = []
+        seen = set()
+        for hit in hits:
+            text = excerpt(hit["text"], settings.REVIEW_EXCERPT_CHARS)
+            if text in seen:
+                continue
+            seen.add(text)
+            rows.append({
+                "area": hit["metadata"].get("area", "Unknown"),
+                "rating": hit["metadata"].get("rating", "-"),
+                "rent": format_naira(hit["metadata"].get("rent_paid")),
+                "review": text,
+            })
+
+        lines = [f"{len(rows)} reviews for '{query}':"] + compact_table(rows, ["area", "rating", "rent", "review"])
+        content = fit_lines(lines, tool_budget("search_tenant_reviews"), keep=3)
+
+        artifact = {
+            "query": query,
+            "area": area,
+            "hits": hits
+        }
 
-        documents = results['documents'][0]
-        metadatas = results['metadatas'][0] if results.get('metadatas') else []
-        distances = results['distances'][0] if results.get('distances') else []
+        return content, artifact
 
-        formatted_reviews = []
-        for i, doc in enumerate(documents):
-            metadata = metadatas[i] if i < len(metadatas) else {}
-            relevance = 1 - distances[i] if i < len(distances) else 0
+    except Exception as e:
+        return f"Error searching reviews: {str(e)}", {}
 
-            review_area = metadata.get("area", "Unknown")
-            rating = metadata.get("rating", "N/A")
-            rent = metadata.get("rent_paid", "N/A")
 
-            formatted_reviews.append(
-                f"Review {i+1} (Area: {review_area}, Rating: {rating}/5, Rent: ₦{rent:,.0f}):\n{doc}\n"
-            )
+async def _area_statistics(area: str, sample_reviews: int) -> str:
+    """Build the statistical summary for one area (shared by the area tools)"""
+    # Precomputed profile covers the whole corpus and needs no embedding call
+    if settings.AREA_PROFILES_ENABLED:
+        profile = area_profiles.render(area)
+        if profile is not None:
+            return profile
 
-        return "\n".join(formatted_reviews)
+    from ..services.embedding_service import embedding_service
 
-    except Exception as e:
-        return f"Error searching reviews: {str(e)}"
+    # Search for general reviews about the area
+    query = f"living in {area}"
+
+    async with tool_slot():
+        query_embedding = await embedding_service.aembed_text(query)
+
+        results = await vector_db.aquery(
+            query_embeddings=[query_embedding],
+            n_results=20,  # Get more for statistics
+            where={"area": {"$eq": area}}
+        )
+
+    if not results or not results.get('metadatas') or not results['metadatas'][0]:
+        return f"No data available for {area}"
+
+    metadatas = results['metadatas'][0]
+
+    # Calculate statistics
+    total_reviews = len(metadatas)
+    ratings = [m.get("rating", 0) for m in metadatas if m.get("rating")]
+    rents = [m.get("rent_paid", 0) for m in metadatas if m.get("rent_paid")]
+
+    avg_rating = sum(ratings) / len(ratings) if ratings else 0
+    avg_rent = sum(rents) / len(rents) if rents else 0
+    min_rent = min(rents) if rents else 0
+    max_rent = max(rents) if rents else 0
+
+    # Also include short review excerpts for the agent to analyze
+    documents = results['documents'][0] if results.get('documents') else []
+
+    lines = [
+        f"{area}: {total_reviews} reviews, avg rating {avg_rating:.1f}/5, "
+        f"avg rent {format_naira(avg_rent)} (range {format_naira(min_rent)}-{format_naira(max_rent)})",
+        "rating|excerpt",
+    ]
+    seen = set()
+    for i, doc in enumerate(documents):
+        if len(seen) >= sample_reviews:
+            break
+        text = excerpt(doc, settings.AREA_STATS_EXCERPT_CHARS)
+        if text in seen:
+            continue
+        seen.add(text)
+        rating = metadatas[i].get("rating", "-") if i < len(metadatas) else "-"
+        lines.append(f"{rating}|{text}")
+
+    return "\n".join(lines)
 
 
 @tool
-def get_area_statistics(area: str) -> str:
+@budgeted
+@speculative("get_area_statistics")
+async def get_area_statistics(area: str) -> str:
     """
     Get statistical summary of reviews for a specific area.
 
@@ -196,59 +445,17 @@ def get_area_statistics(area: str) -> str:
         Statistical summary of reviews for that area
     """
     try:
-        from ..services.embedding_service import embedding_service
-
-        # Search for general reviews about the area
-        query = f"living in {area}"
-        query_embedding = embedding_service.embed_text(query)
-
-        results = vector_db.query(
-            query_embeddings=[query_embedding],
-            n_results=20,  # Get more for statistics
-            where={"area": {"$eq": area}}
-        )
-
-        if not results or not results.get('metadatas') or not results['metadatas'][0]:
-            return f"No data available for {area}"
-
-        metadatas = results['metadatas'][0]
-
-        # Calculate statistics
-        total_reviews = len(metadatas)
-        ratings = [m.get("rating", 0) for m in metadatas if m.get("rating")]
-        rents = [m.get("rent_paid", 0) for m in metadatas if m.get("rent_paid")]
-
-        avg_rating = sum(ratings) / len(ratings) if ratings else 0
-        avg_rent = sum(rents) / len(rents) if rents else 0
-        min_rent = min(rents) if rents else 0
-        max_rent = max(rents) if rents else 0
-
-        # Also include actual review text for the agent to analyze
-        documents = results['documents'][0] if results.get('documents') else []
-
-        summary = f"""
-Statistics for {area}:
-- Total Reviews: {total_reviews}
-- Average Rating: {avg_rating:.1f}/5
-- Average Rent: ₦{avg_rent:,.0f}
-- Rent Range: ₦{min_rent:,.0f} - ₦{max_rent:,.0f}
-
-Sample Reviews (most relevant):
-"""
-        # Add top 10 reviews for context
-        for i, doc in enumerate(documents[:10], 1):
-            metadata = metadatas[i-1] if i-1 < len(metadatas) else {}
-            rating = metadata.get("rating", "N/A")
-            summary += f"\n{i}. [Rating: {rating}/5] {doc[:400]}...\n"
-
-        return summary.strip()
+        summary = await _area_statistics(area, settings.AREA_STATS_SAMPLE_REVIEWS)
+        return fit_lines(summary.split("\n"), tool_budget("get_area_statistics"), keep=2)
 
     except Exception as e:
         return f"Error getting statistics for {area}: {str(e)}"
 
 
 @tool
-def compare_areas(area1: str, area2: str) -> str:
+@budgeted
+@speculative("compare_areas")
+async def compare_areas(area1: str, area2: str) -> str:
     """
     Compare two areas based on tenant reviews.
 
@@ -263,19 +470,18 @@ def compare_areas(area1: str, area2: str) -> str:
         Comparison of the two areas based on reviews
     """
     try:
-        stats1 = get_area_statistics(area1)
-        stats2 = get_area_statistics(area2)
-
-        comparison = f"""
-Comparison between {area1} and {area2}:
-
-{area1}:
-{stats1}
+        # Both areas are looked up concurrently, with half the samples each
+        sample_reviews = max(1, settings.AREA_STATS_SAMPLE_REVIEWS // 2)
+        stats1, stats2 = await asyncio.gather(
+            _area_statistics(area1, sample_reviews),
+            _area_statistics(area2, sample_reviews)
+        )
 
-{area2}:
-{stats2}
-"""
-        return comparison.strip()
+        half_budget = tool_budget("compare_areas") // 2
+        return "\n\n".join([
+            fit_lines(stats1.split("\n"), half_budget, keep=2),
+            fit_lines(stats2.split("\n"), half_budget, keep=2),
+        ])
 
     except Exception as e:
         return f"Error comparing areas: {str(e)}"
@@ -284,6 +490,7 @@ Comparison between {area1} and {area2}:
 # Export all tools
 AGENT_TOOLS = [
     search_properties,
+    search_properties_semantic,
     search_tenant_reviews,
     get_area_statistics,
     compare_areas,
@@ -0,0 +1,59 @@
+"""
+Per-turn execution context for the agent
+Carries state shared by all tool calls of a single chat turn
+"""
+import asyncio
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from typing import Any, Optional
+
+
+@dataclass
+class TurnContext:
+    """State scoped to one agent invocation"""
+    semaphore: asyncio.Semaphore  # Caps concurrent tool executions within the turn
+    prefetch: Optional[Any] = None  # PrefetchScope with speculative tool calls, if enabled
+    tool_tokens_remaining: Optional[int] = None  # Tool output tokens left this turn (None = unlimited)
+
+
+_current_turn: ContextVar[Optional[TurnContext]] = ContextVar("current_turn", default=None)
+
+
+def current_turn() -> Optional[TurnContext]:
+    """Get the context of the turn being executed, if any"""
+    return _current_turn.get()
+
+
+@contextmanager
+def turn_scope(max_parallel_tools: int, tool_token_budget: Optional[int] = None):
+    """
+    Open a turn context for the duration of an agent invocation
+
+    LangGraph runs tool calls in tasks created inside the invocation, so
+    they inherit this context automatically.
+
+    Args:
+        max_parallel_tools: Maximum number of tools allowed to run at once
+        tool_token_budget: Total tokens of tool output allowed this turn
+    """
+    token = _current_turn.set(TurnContext(
+        semaphore=asyncio.Semaphore(max_parallel_tools),
+        tool_tokens_remaining=tool_token_budget
+    ))
+    try:
+        yield _current_turn.get()
+    finally:
+        _current_turn.reset(token)
+
+
+@asynccontextmanager
+async def tool_slot():
+    """Acquire one of the turn's tool execution slots (no-op outside a turn)"""
+    turn = current_turn()
+    if turn is None:
+        yield
+        return
+
+    async with turn.semaphore:
+        yield
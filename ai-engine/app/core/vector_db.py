@@ -1,17 +1,25 @@
 """
 ChromaDB connection and management
 """
+import asyncio
 import chromadb
 from chromadb.config import Settings
 from pathlib import Path
+from .mmr import mmr_rerank
 from ..config import settings
 
 
 class VectorDB:
     """ChromaDB client wrapper"""
 
-    def __init__(self):
-        """Initialize ChromaDB client (embedded mode)"""
+    def __init__(self, collection_name=None, description="Tenant reviews and experiences for Lagos housing"):
+        """
+        Initialize ChromaDB client (embedded mode)
+
+        Args:
+            collection_name: Collection to wrap (default: CHROMADB_COLLECTION)
+            description: Collection description stored on creation
+        """
         # Store ChromaDB data locally in ai-engine/chroma_data
         chroma_path = Path(__file__).parent.parent.parent / "chroma_data"
         chroma_path.mkdir(exist_ok=True)
@@ -20,13 +28,14 @@ class VectorDB:
             path=str(chroma_path),
             settings=Settings(anonymized_telemetry=False)
         )
-        self.collection_name = settings.CHROMADB_COLLECTION
+        self.collection_name = collection_name or settings.CHROMADB_COLLECTION
+        self.description = description
 
     def get_or_create_collection(self):
-        """Get or create the reviews collection"""
+        """Get or create the wrapped collection"""
         return self.client.get_or_create_collection(
             name=self.collection_name,
-            metadata={"description": "Tenant reviews and experiences for Lagos housing"}
+            metadata={"description": self.description}
         )
 
     def add_documents(self, documents, embeddings, metadatas, ids):
@@ -39,6 +48,21 @@ class VectorDB:
             ids=ids
         )
 
+    def upsert_documents(self, documents, embeddings, metadatas, ids):
+        """Add documents, replacing any stored under the same ids"""
+        collection = self.get_or_create_collection()
+        collection.upsert(
+            documents=documents,
+            embeddings=embeddings,
+            metadatas=metadatas,
+            ids=ids
+        )
+
+    def delete_documents(self, ids):
+        """Delete documents by id"""
+        collection = self.get_or_create_collection()
+        collection.delete(ids=ids)
+
     def query(self, query_embeddings, n_results=10, where=None):
         """
         Query the collection
@@ -58,6 +82,166 @@ class VectorDB:
             where=where
         )
 
+    async def aquery(self, query_embeddings, n_results=10, where=None):
+        """
+        Query the collection from async code
+
+        ChromaDB's embedded client is synchronous, so the query runs in a
+        worker thread to keep the event loop free.
+        """
+        return await asyncio.to_thread(self.query, query_embeddings, n_results, where)
+
+    def query_mmr(self, query_embeddings, n_results=10, where=None, fetch_k=None, lambda_mult=None):
+        """
+        Query the collection and re-rank each result set for diversity
+
+        Fetches fetch_k candidates with their embeddings, then keeps the
+        n_results picked by maximal marginal relevance.
+
+        Args:
+            query_embeddings: List of query embedding vectors
+            n_results: Number of results to return per query
+            where: Optional metadata filter
+            fetch_k: Candidates to consider (default: n_results * MMR_FETCH_MULTIPLIER)
+            lambda_mult: Relevance / diversity trade-off (default: MMR_LAMBDA)
+
+        Returns:
+            Query results in the same shape as query()
+        """
+        fetch_k = fetch_k or n_results * settings.MMR_FETCH_MULTIPLIER
+        lambda_mult = settings.MMR_LAMBDA if lambda_mult is None else lambda_mult
+
+        collection = self.get_or_create_collection()
+        results = collection.query(
+            query_embeddings=query_embeddings,
+            n_results=fetch_k,
+            where=where,
+            include=["documents", "metadatas", "distances", "embeddings"]
+        )
+
+        reranked = {"ids": [], "documents": [], "metadatas": [], "distances": []}
+        for q, query_embedding in enumerate(query_embeddings):
+            order = mmr_rerank(query_embedding, results["embeddings"][q], n_results, lambda_mult)
+            for key in reranked:
+                reranked[key].append([results[key][q][i] for i in order])
+        return reranked
+
+    async def aquery_mmr(self, query_embeddings, n_results=10, where=None, fetch_k=None, lambda_mult=None):
+        """Diversity re-ranked query from async code (runs in a worker thread)"""
+        return await asyncio.to_thread(self.query_mmr, query_embeddings, n_results, where, fetch_k, lambda_mult)
+
+    async def asearch(self, query_embeddings, n_results=10, where=None, diversify=None):
+        """
+        Query with MMR re-ranking when enabled (MMR_ENABLED), plain otherwise
+
+        Args:
+            query_embeddings: List of query embedding vectors
+            n_results: Number of results to return per query
+            where: Optional metadata filter
+            diversify: Override MMR_ENABLED for this call
+        """
+        diversify = settings.MMR_ENABLED if diversify is None else diversify
+        if diversify:
+            return await self.aquery_mmr(query_embeddings, n_results, where)
+        return await self.aquery(query_embeddings, n_results, where)
+
+    @staticmethod
+    def build_where(filters=None):
+        """
+        Convert a flat filter dict into a ChromaDB where clause
+
+        Plain values become $eq, lists become $in and operator dicts
+        (e.g. {"rating": {"$gte": 4}}) are passed through unchanged.
+
+        Args:
+            filters: Metadata filters keyed by field name
+
+        Returns:
+            ChromaDB where clause or None
+        """
+        if not filters:
+            return None
+
+        clauses = []
+        for field, value in filters.items():
+            if value is None:
+                continue
+            if isinstance(value, dict):
+                clauses.append({field: value})
+            elif isinstance(value, (list, tuple)):
+                clauses.append({field: {"$in": list(value)}})
+            else:
+                clauses.append({field: {"$eq": value}})
+
+        if not clauses:
+            return None
+        if len(clauses) == 1:
+            return clauses[0]
+        return {"$and": clauses}
+
+    @staticmethod
+    def to_hits(results):
+        """
+        Flatten a ChromaDB query result into per-query lists of hits
+
+        Args:
+            results: Raw result from query()
+
+        Returns:
+            One list per query embedding, each hit being a dict with
+            id, text, metadata and score (1 - distance)
+        """
+        if not results or not results.get("ids"):
+            return []
+
+        all_hits = []
+        for q, ids in enumerate(results["ids"]):
+            documents = results["documents"][q] if results.get("documents") else []
+            metadatas = results["metadatas"][q] if results.get("metadatas") else []
+            distances = results["distances"][q] if results.get("distances") else []
+
+            hits = []
+            for i, doc_id in enumerate(ids):
+                hits.append({
+                    "id": doc_id,
+                    "text": documents[i] if i < len(documents) else "",
+                    "metadata": metadatas[i] if i < len(metadatas) else {},
+                    "score": 1 - distances[i] if i < len(distances) else 0
+                })
+            all_hits.append(hits)
+
+        return all_hits
+
+    def get_documents(self, where=None, ids=None, include=("documents", "metadatas")):
+        """
+        Fetch stored documents without a similarity query
+
+        Args:
+            where: Optional metadata filter
+            ids: Optional list of document ids
+            include: Fields to return
+
+        Returns:
+            ChromaDB get() result (flat lists of ids, documents, metadatas)
+        """
+        collection = self.get_or_create_collection()
+        return collection.get(where=where, ids=ids, include=list(include))
+
+    async def aget_documents(self, where=None, ids=None, include=("documents", "metadatas")):
+        """Fetch stored documents from async code (in a worker thread, like aquery)"""
+        return await asyncio.to_thread(self.get_documents, where, ids, include)
+
+    def update_metadatas(self, ids, metadatas):
+        """
+        Replace the metadata of existing documents (embeddings untouched)
+
+        Args:
+            ids: Document ids
+            metadatas: Full metadata dict per document
+        """
+        collection = self.get_or_create_collection()
+        collection.update(ids=ids, metadatas=metadatas)
+
     def delete_collection(self):
         """Delete the collection (use with caution!)"""
         try:
@@ -76,5 +260,9 @@ class VectorDB:
             return 0
 
 
-# Global instance
+# Global instances
 vector_db = VectorDB()
+listings_db = VectorDB(
+    collection_name=settings.CHROMADB_LISTINGS_COLLECTION,
+    description="Property listing titles and descriptions for semantic search"
+)
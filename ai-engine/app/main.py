@@ -22,6 +22,24 @@ app.add_middleware(
 )
 
 
+@app.on_event("startup")
+async def startup():
+    """Load precomputed artifacts"""
+    if settings.AREA_PROFILES_ENABLED:
+        from .core.area_profiles import area_profiles
+        area_profiles.load()
+    if settings.ASPECT_INDEX_ENABLED:
+        from .core.aspect_index import aspect_index
+        aspect_index.load()
+
+
+@app.on_event("shutdown")
+async def shutdown():
+    """Release shared clients"""
+    from .core.tools import close_http_client
+    await close_http_client()
+
+
 @app.get("/")
 async def root():
     """Health check endpoint"""
@@ -52,6 +70,8 @@ async def health_check():
 
 
 # Import and include routers
-from .api import chat
+from .api import chat, search, metrics
 
 app.include_router(chat.router, prefix="/ai/v1", tags=["Chat"])
+app.include_router(search.router, prefix="/ai/v1", tags=["Search"])
+app.include_router(metrics.router, prefix="/ai/v1", tags=["Metrics"])
@@ -1,7 +1,7 @@
 """
 Text embedding service using OpenAI
 """
-from openai import OpenAI
+from openai import OpenAI, AsyncOpenAI
 from typing import List
 from ..config import settings
 
@@ -10,8 +10,9 @@ class EmbeddingService:
     """Service for generating text embeddings"""
 
     def __init__(self):
-        """Initialize OpenAI client"""
+        """Initialize OpenAI clients"""
         self.client = OpenAI(api_key=settings.OPENAI_API_KEY)
+        self.async_client = AsyncOpenAI(api_key=settings.OPENAI_API_KEY)
         self.model = settings.OPENAI_EMBEDDING_MODEL
 
     def embed_text(self, text: str) -> List[float]:
@@ -47,6 +48,38 @@ class EmbeddingService:
         )
         return [item.embedding for item in response.data]
 
+    async def aembed_text(self, text: str) -> List[float]:
+        """
+        Generate embedding for a single text without blocking the event loop
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector as list of floats
+        """
+        response = await self.async_client.embeddings.create(
+            model=self.model,
+            input=text
+        )
+        return response.data[0].embedding
+
+    async def aembed_texts(self, texts: List[str]) -> List[List[float]]:
+        """
+        Generate embeddings for multiple texts (batch) without blocking the event loop
+
+        Args:
+            texts: List of texts to embed
+
+        Returns:
+            List of embedding vectors
+        """
+        response = await self.async_client.embeddings.create(
+            model=self.model,
+            input=texts
+        )
+        return [item.embedding for item in response.data]
+
 
 # Global instance
 embedding_service = EmbeddingService()
@@ -0,0 +1,125 @@
+"""
+Review ingestion into ChromaDB
+Collapses near-duplicate reviews into one canonical vector, tags aspects
+and only embeds documents that are new or changed since the last run.
+"""
+from typing import Any, Dict, List
+from ..config import settings
+from ..core.vector_db import vector_db
+from ..core.dedup import find_duplicate_clusters
+from ..core.aspect_index import tag_review
+from .embedding_service import embedding_service
+
+
+def _mean(values: List[float]) -> float:
+    return round(sum(values) / len(values), 2) if values else 0
+
+
+class ReviewIngestionService:
+    """Service for writing reviews into the vector store"""
+
+    def __init__(self, batch_size: int = 50):
+        self.batch_size = batch_size
+
+    def collapse(self, reviews: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Collapse near-duplicate reviews into canonical documents
+
+        Reviews are only merged within the same area, so area filters keep
+        working. The canonical document keeps its own text and metadata plus
+        duplicate_count, the ids of the reviews it stands for and the
+        cluster's mean rating and rent.
+
+        Args:
+            reviews: Dicts with id, text and metadata
+
+        Returns:
+            Canonical documents (id, text, metadata), one per cluster
+        """
+        if settings.DEDUP_ENABLED:
+            clusters = find_duplicate_clusters(
+                [review["text"] for review in reviews],
+                threshold=settings.DEDUP_THRESHOLD,
+                keys=[review["metadata"].get("area") or "" for review in reviews]
+            )
+        else:
+            clusters = [[i] for i in range(len(reviews))]
+
+        canonical = []
+        for cluster in clusters:
+            members = [reviews[i] for i in cluster]
+            review = members[0]
+            ratings = [m["metadata"]["rating"] for m in members if m["metadata"].get("rating")]
+            rents = [m["metadata"]["rent_paid"] for m in members if m["metadata"].get("rent_paid")]
+            canonical.append({
+                "id": review["id"],
+                "text": review["text"],
+                "metadata": {
+                    **review["metadata"],
+                    **tag_review(review["text"]),
+                    "duplicate_count": len(members),
+                    "duplicate_ids": ",".join(m["id"] for m in members[1:]),
+                    "cluster_avg_rating": _mean(ratings),
+                    "cluster_avg_rent": _mean(rents),
+                },
+            })
+        return canonical
+
+    def ingest(self, reviews: List[Dict[str, Any]], prune: bool = False) -> Dict[str, int]:
+        """
+        Upsert reviews, embedding only canonical documents that changed
+
+        Args:
+            reviews: Dicts with id, text and metadata
+            prune: Delete stored documents not in this batch (set when
+                ingesting the full corpus, so collapsed duplicates and
+                removed reviews leave the index)
+
+        Returns:
+            Counts: reviews, canonical, duplicates, embedded, metadata_only, deleted
+        """
+        canonical = self.collapse(reviews)
+
+        stored = vector_db.get_documents(include=("documents",))
+        stored_texts = dict(zip(stored["ids"], stored["documents"]))
+
+        changed = [doc for doc in canonical if stored_texts.get(doc["id"]) != doc["text"]]
+        unchanged = [doc for doc in canonical if stored_texts.get(doc["id"]) == doc["text"]]
+
+        for start in range(0, len(changed), self.batch_size):
+            batch = changed[start:start + self.batch_size]
+            print(f"  Embedding batch {start // self.batch_size + 1}/{(len(changed) + self.batch_size - 1) // self.batch_size}...")
+            vector_db.upsert_documents(
+                documents=[doc["text"] for doc in batch],
+                embeddings=embedding_service.embed_texts([doc["text"] for doc in batch]),
+                metadatas=[doc["metadata"] for doc in batch],
+                ids=[doc["id"] for doc in batch]
+            )
+
+        # Text unchanged - refresh metadata (duplicate counts, tags) without re-embedding
+        for start in range(0, len(unchanged), self.batch_size):
+            batch = unchanged[start:start + self.batch_size]
+            vector_db.update_metadatas(
+                ids=[doc["id"] for doc in batch],
+                metadatas=[doc["metadata"] for doc in batch]
+            )
+
+        stale = []
+        if prune:
+            keep = {doc["id"] for doc in canonical}
+            stale = [doc_id for doc_id in stored_texts if doc_id not in keep]
+            if stale:
+                vector_db.delete_documents(stale)
+
+        return {
+            "reviews": len(reviews),
+            "canonical": len(canonical),
+            "duplicates": len(reviews) - len(canonical),
+            "embedded": len(changed),
+            "metadata_only": len(unchanged),
+            "deleted": len(stale),
+        }
+
+
+# Global instance
+review_ingestion = ReviewIngestionService()
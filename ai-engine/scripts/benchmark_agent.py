@@ -0,0 +1,113 @@
+"""
+Benchmark the ReAct and plan-and-execute agent graphs
+
+Runs the same chat turns through both graphs and reports LLM calls per
+turn, end-to-end latency (mean / p50 / p95), prompt tokens per turn and
+the share of prompt tokens served from the provider's prefix cache.
+
+Usage:
+    python scripts/benchmark_agent.py --runs 3
+"""
+import sys
+import time
+import asyncio
+import argparse
+import statistics
+from pathlib import Path
+from langchain_core.callbacks import AsyncCallbackHandler
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.agent import HousingAgent
+
+# Representative turns: chit-chat, single lookup, multi-tool and comparison
+SAMPLE_MESSAGES = [
+    "Hi, what can you help me with?",
+    "I need 2 rooms in Ikeja for 500k",
+    "Show me flats in VI and tell me how the power supply is there",
+    "How is the water supply in Yaba?",
+    "Compare Lekki and Surulere for a young family",
+    "What's it like to live in Gbagada? Any 3 bedroom apartments under 3M?",
+]
+
+
+class LLMCallCounter(AsyncCallbackHandler):
+    """Counts chat model calls made during a turn"""
+
+    def __init__(self):
+        self.calls = 0
+
+    async def on_chat_model_start(self, serialized, messages, **kwargs):
+        self.calls += 1
+
+
+def percentile(values, pct):
+    """Nearest-rank percentile"""
+    ordered = sorted(values)
+    index = max(0, int(round(pct / 100 * len(ordered))) - 1)
+    return ordered[index]
+
+
+async def run_graph(graph: str, runs: int):
+    """Run every sample message `runs` times through one graph"""
+    agent = HousingAgent(graph=graph)
+    latencies = []
+    llm_calls = []
+    prompt_tokens = []
+    cached_tokens = []
+
+    for run in range(runs):
+        for i, message in enumerate(SAMPLE_MESSAGES):
+            counter = LLMCallCounter()
+            start = time.perf_counter()
+            result = await agent.ainvoke(
+                user_message=message,
+                thread_id=f"bench-{graph}-{run}-{i}",
+                callbacks=[counter]
+            )
+            latencies.append(time.perf_counter() - start)
+            llm_calls.append(counter.calls)
+            prompt_tokens.append(result["usage"]["prompt_tokens"])
+            cached_tokens.append(result["usage"]["cached_tokens"])
+            print(f"  [{graph}] run {run + 1} msg {i + 1}: {counter.calls} LLM calls, {latencies[-1]:.2f}s")
+
+    return {
+        "graph": graph,
+        "turns": len(latencies),
+        "llm_calls_mean": statistics.mean(llm_calls),
+        "llm_calls_max": max(llm_calls),
+        "latency_mean": statistics.mean(latencies),
+        "latency_p50": percentile(latencies, 50),
+        "latency_p95": percentile(latencies, 95),
+        "prompt_tokens_mean": statistics.mean(prompt_tokens),
+        "cached_ratio": sum(cached_tokens) / sum(prompt_tokens) if sum(prompt_tokens) else 0.0,
+    }
+
+
+async def main(runs: int):
+    print("=" * 60)
+    print("Agent Graph Benchmark")
+    print("=" * 60)
+
+    results = []
+    for graph in ("react", "plan_execute"):
+        print(f"\nRunning {graph}...")
+        results.append(await run_graph(graph, runs))
+
+    print("\n" + "=" * 60)
+    print(f"{'graph':<14}{'turns':>6}{'calls/turn':>12}{'max calls':>11}{'mean s':>9}{'p50 s':>8}{'p95 s':>8}{'prompt tok':>12}{'cached':>8}")
+    for r in results:
+        print(
+            f"{r['graph']:<14}{r['turns']:>6}{r['llm_calls_mean']:>12.2f}{r['llm_calls_max']:>11}"
+            f"{r['latency_mean']:>9.2f}{r['latency_p50']:>8.2f}{r['latency_p95']:>8.2f}"
+            f"{r['prompt_tokens_mean']:>12.0f}{r['cached_ratio']:>8.0%}"
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Benchmark agent graphs")
+    parser.add_argument("--runs", type=int, default=3, help="Repetitions of the sample set per graph")
+    args = parser.parse_args()
+
+    asyncio.run(main(args.runs))
@@ -0,0 +1,118 @@
+"""
+Build precomputed area profiles from the review corpus in ChromaDB
+
+Reads every stored review, groups them by area and writes one compact
+profile per area (aggregates, top pros / cons, aspect scores) to a
+versioned JSON artifact that the AI engine loads at startup.
+
+Rebuilds are incremental: an area is only recomputed when the hash of
+its reviews differs from the one recorded in the existing artifact.
+
+Usage:
+    python scripts/build_area_profiles.py
+    python scripts/build_area_profiles.py --force
+"""
+import sys
+import json
+import os
+import argparse
+from datetime import datetime, timezone
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.vector_db import vector_db
+from app.core.area_profiles import (
+    SCHEMA_VERSION,
+    AreaProfileStore,
+    build_area_profile,
+    reviews_fingerprint,
+)
+
+
+def load_artifact(path: Path) -> dict:
+    """Existing artifact, or an empty one if missing / from another schema"""
+    if path.exists():
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            if data.get("schema_version") == SCHEMA_VERSION:
+                return data
+            print("Existing artifact uses another schema - rebuilding all areas")
+        except ValueError:
+            print("Existing artifact is unreadable - rebuilding all areas")
+    return {"schema_version": SCHEMA_VERSION, "version": 0, "areas": {}}
+
+
+def group_by_area(results: dict) -> dict:
+    """Group a ChromaDB get() result into {area: (ids, documents, metadatas)}"""
+    grouped = {}
+    for doc_id, document, metadata in zip(results["ids"], results["documents"], results["metadatas"]):
+        area = (metadata or {}).get("area")
+        if not area:
+            continue
+        ids, documents, metadatas = grouped.setdefault(area, ([], [], []))
+        ids.append(doc_id)
+        documents.append(document)
+        metadatas.append(metadata)
+    return grouped
+
+
+def build_area_profiles(force: bool = False, path: Path = None):
+    """Rebuild the profiles of areas whose reviews changed"""
+    print("=" * 60)
+    print("Building area profiles...")
+    print("=" * 60)
+
+    path = AreaProfileStore(path).path
+    artifact = load_artifact(path)
+    existing = artifact["areas"]
+
+    results = vector_db.get_documents()
+    grouped = group_by_area(results)
+    print(f"\nFound {len(results['ids'])} reviews across {len(grouped)} areas")
+
+    areas = {}
+    rebuilt = []
+    for area, (ids, documents, metadatas) in sorted(grouped.items()):
+        source_hash = reviews_fingerprint(ids, documents, metadatas)
+        previous = existing.get(area)
+        if not force and previous and previous.get("source_hash") == source_hash:
+            areas[area] = previous
+            continue
+        areas[area] = build_area_profile(area, ids, documents, metadatas)
+        rebuilt.append(area)
+
+    removed = sorted(set(existing) - set(areas))
+
+    if not rebuilt and not removed:
+        print(f"\nAll {len(areas)} profiles are up to date (v{artifact['version']})")
+        return
+
+    artifact = {
+        "schema_version": SCHEMA_VERSION,
+        "version": artifact["version"] + 1,
+        "built_at": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "areas": areas,
+    }
+
+    # Write to a temp file and swap so a running engine never reads a partial file
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_suffix(".json.tmp")
+    tmp_path.write_text(json.dumps(artifact, indent=2, ensure_ascii=False), encoding="utf-8")
+    os.replace(tmp_path, path)
+
+    print(f"\nRebuilt: {', '.join(rebuilt) or '-'}")
+    print(f"Removed: {', '.join(removed) or '-'}")
+    print(f"Kept:    {len(areas) - len(rebuilt)} unchanged")
+    print(f"\nSUCCESS: wrote v{artifact['version']} to {path}")
+    print("Restart the AI engine (or call area_profiles.load()) to serve the new profiles")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build precomputed area profiles")
+    parser.add_argument("--force", action="store_true", help="Rebuild every area even if unchanged")
+    parser.add_argument("--path", type=Path, default=None, help="Artifact path (default: AREA_PROFILES_PATH)")
+    args = parser.parse_args()
+
+    build_area_profiles(force=args.force, path=args.path)
@@ -1,5 +1,8 @@
 """
 Seed ChromaDB with review embeddings from MySQL
+
+Safe to re-run: near-duplicate reviews are collapsed into one vector and
+only new or changed reviews are embedded.
 """
 import sys
 from pathlib import Path
@@ -13,7 +16,7 @@ from dotenv import load_dotenv
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from app.core.vector_db import vector_db
-from app.services.embedding_service import embedding_service
+from app.services.review_ingestion import review_ingestion
 
 # Load backend .env for database connection
 backend_env_path = Path(__file__).parent.parent.parent / "backend" / ".env"
@@ -59,8 +62,8 @@ def seed_chromadb():
     db = SessionLocal()
 
     try:
-        # Fetch all reviews from MySQL
-        reviews = db.query(Review).all()
+        # Fetch all reviews from MySQL (id order keeps the canonical member of each duplicate cluster stable)
+        reviews = db.query(Review).order_by(Review.id).all()
         total_reviews = len(reviews)
 
         if total_reviews == 0:
@@ -69,59 +72,33 @@ def seed_chromadb():
             return
 
         print(f"\nFound {total_reviews} reviews in MySQL")
-        print(f"Generating embeddings and storing in ChromaDB...\n")
+        print(f"Collapsing near-duplicates and embedding new or changed reviews...\n")
 
         # Prepare data for ChromaDB
-        documents = []
-        embeddings_list = []
-        metadatas = []
-        ids = []
-
-        # Process in batches for efficiency
-        batch_size = 50
-        for i in range(0, total_reviews, batch_size):
-            batch = reviews[i:i + batch_size]
-            batch_texts = []
-            batch_metadatas = []
-            batch_ids = []
-
-            for review in batch:
-                # Combine review text with pros and cons
-                full_text = review.review_text
-                if review.pros:
-                    full_text += f" Pros: {review.pros}"
-                if review.cons:
-                    full_text += f" Cons: {review.cons}"
-
-                batch_texts.append(full_text)
-                batch_metadatas.append({
+        records = []
+        for review in reviews:
+            # Combine review text with pros and cons
+            full_text = review.review_text
+            if review.pros:
+                full_text += f" Pros: {review.pros}"
+            if review.cons:
+                full_text += f" Cons: {review.cons}"
+
+            records.append({
+                "id": f"review_{review.id}",
+                "text": full_text,
+                "metadata": {
                     "review_id": review.id,
                     "area": review.area,
                     "property_type": review.property_type or "unknown",
                     "rent_paid": float(review.rent_paid) if review.rent_paid else 0,
                     "rating": review.rating if review.rating else 0,
                     "property_id": review.property_id if review.property_id else 0
-                })
-                batch_ids.append(f"review_{review.id}")
-
-            # Generate embeddings for batch
-            print(f"  Processing batch {i//batch_size + 1}/{(total_reviews + batch_size - 1)//batch_size}...")
-            batch_embeddings = embedding_service.embed_texts(batch_texts)
-
-            # Add to main lists
-            documents.extend(batch_texts)
-            embeddings_list.extend(batch_embeddings)
-            metadatas.extend(batch_metadatas)
-            ids.extend(batch_ids)
-
-        # Add all to ChromaDB
-        print(f"\nStoring {len(documents)} embeddings in ChromaDB...")
-        vector_db.add_documents(
-            documents=documents,
-            embeddings=embeddings_list,
-            metadatas=metadatas,
-            ids=ids
-        )
+                }
+            })
+
+        # Full corpus - prune vectors for reviews that were removed or are now duplicates
+        stats = review_ingestion.ingest(records, prune=True)
 
         print("\n" + "=" * 60)
         print("SUCCESS: ChromaDB seeding completed successfully!")
@@ -130,9 +107,13 @@ def seed_chromadb():
         # Verify
         count = vector_db.get_collection_count()
         print(f"\nSummary:")
+        print(f"  Reviews in MySQL: {stats['reviews']}")
+        print(f"  Near-duplicates collapsed: {stats['duplicates']}")
+        print(f"  Embedded this run: {stats['embedded']} (metadata-only: {stats['metadata_only']}, deleted: {stats['deleted']})")
         print(f"  Total documents in ChromaDB: {count}")
         print(f"  Collection: {vector_db.collection_name}")
         print(f"  Data stored in: ai-engine/chroma_data/")
+        print(f"\nNext: python scripts/tag_review_aspects.py to rebuild the aspect index")
 
     except Exception as e:
         print(f"\nERROR during seeding: {e}")
@@ -0,0 +1,152 @@
+"""
+Sync property listings from MySQL into the listings vector collection
+
+Incremental and safe to run on a schedule: a listing is only re-embedded
+when its text (title, description, type, area, address) changes; price or
+availability changes only update metadata; listings deleted from MySQL
+are removed from the collection.
+
+Usage:
+    python scripts/sync_property_listings.py
+    python scripts/sync_property_listings.py --full
+"""
+import sys
+import argparse
+from pathlib import Path
+from sqlalchemy import create_engine, Column, Integer, String, Text, Numeric, Boolean
+from sqlalchemy.ext.declarative import declarative_base
+from sqlalchemy.orm import sessionmaker
+import os
+from dotenv import load_dotenv
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.vector_db import listings_db
+from app.core.listings import listing_document, listing_metadata, text_hash
+from app.services.embedding_service import embedding_service
+
+# Load backend .env for database connection
+backend_env_path = Path(__file__).parent.parent.parent / "backend" / ".env"
+load_dotenv(backend_env_path)
+
+# Database connection
+MYSQL_USER = os.getenv("MYSQL_USER", "root")
+MYSQL_PASSWORD = os.getenv("MYSQL_PASSWORD")
+MYSQL_HOST = os.getenv("MYSQL_HOST", "localhost")
+MYSQL_PORT = os.getenv("MYSQL_PORT", "3306")
+MYSQL_DATABASE = os.getenv("MYSQL_DATABASE", "housing_intelligence")
+
+DATABASE_URL = f"mysql+pymysql://{MYSQL_USER}:{MYSQL_PASSWORD}@{MYSQL_HOST}:{MYSQL_PORT}/{MYSQL_DATABASE}"
+
+# Create engine and session
+engine = create_engine(DATABASE_URL)
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+Base = declarative_base()
+
+
+# Define Property model locally
+class Property(Base):
+    """Property model (columns needed for listing search)"""
+    __tablename__ = "properties"
+
+    id = Column(Integer, primary_key=True)
+    title = Column(String(255))
+    description = Column(Text)
+    area = Column(String(100))
+    address = Column(String(500))
+    property_type = Column(String(50))
+    bedrooms = Column(Integer)
+    bathrooms = Column(Integer)
+    rent_price = Column(Numeric(12, 2))
+    is_available = Column(Boolean)
+
+
+def sync_property_listings(full: bool = False):
+    """Bring the listings collection in line with the properties table"""
+    print("=" * 60)
+    print("Syncing property listings...")
+    print("=" * 60)
+
+    db = SessionLocal()
+
+    try:
+        properties = db.query(Property).order_by(Property.id).all()
+        print(f"\nFound {len(properties)} properties in MySQL")
+
+        stored = listings_db.get_documents(include=("metadatas",))
+        stored_meta = dict(zip(stored["ids"], stored["metadatas"]))
+
+        to_embed, to_update = [], []
+        for prop in properties:
+            record = {
+                "id": prop.id,
+                "title": prop.title,
+                "description": prop.description,
+                "area": prop.area,
+                "address": prop.address,
+                # Stored by the backend as the enum name (APARTMENT) - match the API value
+                "property_type": (prop.property_type or "").lower(),
+                "bedrooms": prop.bedrooms,
+                "bathrooms": prop.bathrooms,
+                "rent_price": prop.rent_price,
+                "is_available": prop.is_available,
+            }
+            document = listing_document(record)
+            metadata = {**listing_metadata(record), "text_hash": text_hash(document)}
+            doc_id = f"property_{prop.id}"
+
+            previous = stored_meta.get(doc_id)
+            if full or previous is None or previous.get("text_hash") != metadata["text_hash"]:
+                to_embed.append((doc_id, document, metadata))
+            elif previous != metadata:
+                to_update.append((doc_id, metadata))
+
+        batch_size = 50
+        for start in range(0, len(to_embed), batch_size):
+            batch = to_embed[start:start + batch_size]
+            print(f"  Embedding batch {start // batch_size + 1}/{(len(to_embed) + batch_size - 1) // batch_size}...")
+            listings_db.upsert_documents(
+                documents=[document for _, document, _ in batch],
+                embeddings=embedding_service.embed_texts([document for _, document, _ in batch]),
+                metadatas=[metadata for _, _, metadata in batch],
+                ids=[doc_id for doc_id, _, _ in batch]
+            )
+
+        for start in range(0, len(to_update), batch_size):
+            batch = to_update[start:start + batch_size]
+            listings_db.update_metadatas(
+                ids=[doc_id for doc_id, _ in batch],
+                metadatas=[metadata for _, metadata in batch]
+            )
+
+        current_ids = {f"property_{prop.id}" for prop in properties}
+        removed = [doc_id for doc_id in stored_meta if doc_id not in current_ids]
+        if removed:
+            listings_db.delete_documents(removed)
+
+        print("\n" + "=" * 60)
+        print("SUCCESS: listings collection is in sync")
+        print("=" * 60)
+        print(f"\nSummary:")
+        print(f"  Embedded: {len(to_embed)}")
+        print(f"  Metadata updated: {len(to_update)}")
+        print(f"  Removed: {len(removed)}")
+        print(f"  Total listings in ChromaDB: {listings_db.get_collection_count()}")
+        print(f"  Collection: {listings_db.collection_name}")
+
+    except Exception as e:
+        print(f"\nERROR during sync: {e}")
+        import traceback
+        traceback.print_exc()
+        raise
+    finally:
+        db.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Sync property listings into ChromaDB")
+    parser.add_argument("--full", action="store_true", help="Re-embed every listing")
+    args = parser.parse_args()
+
+    sync_property_listings(full=args.full)
@@ -0,0 +1,80 @@
+"""
+Tag stored reviews with aspects and rebuild the (area, aspect) index
+
+Runs fully offline (no embedding calls): every review in ChromaDB whose
+tags are missing or were produced by an older tagger gets aspect labels
+and per-aspect sentiment written into its metadata, then the posting
+lists per (area, aspect) are rebuilt into a versioned JSON artifact that
+the AI engine loads at startup.
+
+Usage:
+    python scripts/tag_review_aspects.py
+    python scripts/tag_review_aspects.py --retag
+"""
+import sys
+import argparse
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.core.vector_db import vector_db
+from app.core.aspect_index import (
+    TAGGER_VERSION,
+    build_aspect_index,
+    tag_review,
+    write_aspect_index,
+)
+
+
+def retag_metadata(metadata: dict, document: str) -> dict:
+    """Metadata with previous aspect tags replaced by fresh ones"""
+    untagged = {
+        k: v for k, v in (metadata or {}).items()
+        if k not in ("aspects", "aspect_tagger") and not k.startswith("aspect_")
+    }
+    return {**untagged, **tag_review(document)}
+
+
+def tag_review_aspects(retag: bool = False, path: Path = None):
+    """Tag untagged reviews and write the aspect index"""
+    print("=" * 60)
+    print("Tagging review aspects...")
+    print("=" * 60)
+
+    results = vector_db.get_documents()
+    ids, documents, metadatas = results["ids"], results["documents"], results["metadatas"]
+    print(f"\nFound {len(ids)} reviews in ChromaDB")
+
+    updated_ids, updated_metadatas = [], []
+    for i, (doc_id, document, metadata) in enumerate(zip(ids, documents, metadatas)):
+        if not retag and (metadata or {}).get("aspect_tagger") == TAGGER_VERSION:
+            continue
+        metadatas[i] = retag_metadata(metadata, document)
+        updated_ids.append(doc_id)
+        updated_metadatas.append(metadatas[i])
+
+    batch_size = 100
+    for start in range(0, len(updated_ids), batch_size):
+        vector_db.update_metadatas(
+            ids=updated_ids[start:start + batch_size],
+            metadatas=updated_metadatas[start:start + batch_size]
+        )
+    print(f"Tagged {len(updated_ids)} reviews ({len(ids) - len(updated_ids)} already up to date)")
+
+    index = build_aspect_index(ids, documents, metadatas)
+    version = write_aspect_index(index, path)
+
+    postings = sum(len(entry["postings"]) for aspects in index.values() for entry in aspects.values())
+    print(f"\nIndex: {len(index)} areas, {postings} postings")
+    print(f"SUCCESS: aspect index is at v{version}")
+    print("Restart the AI engine (or call aspect_index.load()) to serve the new index")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Tag review aspects and build the aspect index")
+    parser.add_argument("--retag", action="store_true", help="Re-tag every review, not just untagged ones")
+    parser.add_argument("--path", type=Path, default=None, help="Index path (default: ASPECT_INDEX_PATH)")
+    args = parser.parse_args()
+
+    tag_review_aspects(retag=args.retag, path=args.path)
@@ -1,6 +1,6 @@
 """
 API routes
 """
-from . import chat, properties
+from . import chat, properties, metrics
 
-__all__ = ["chat", "properties"]
+__all__ = ["chat", "properties", "metrics"]
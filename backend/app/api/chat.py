@@ -1,11 +1,13 @@
 """
 Chat API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+import json
 import uuid
 
-from ..database import get_db
+from ..database import AsyncSessionLocal, get_async_db
 from ..schemas.chat import ChatMessageRequest, ChatMessageResponse
 from ..services.ai_engine_client import ai_engine_client
 from ..services.property_service import PropertyService
@@ -16,7 +18,7 @@ router = APIRouter()
 @router.post("/message", response_model=ChatMessageResponse)
 async def send_chat_message(
     request: ChatMessageRequest,
-    db: Session = Depends(get_db)
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Process a chat message and return AI response
@@ -24,8 +26,8 @@ async def send_chat_message(
     Flow:
     1. Send message to AI-Engine (agent decides what tools to use)
     2. AI agent uses search_properties tool if needed
-    3. Extract search params used by the agent
-    4. Query properties based on agent's search params
+    3. Take the property IDs the agent's tool actually returned
+    4. Hydrate those properties by primary key (no second filter search)
     5. Return AI response with property data for frontend display
     """
     try:
@@ -36,20 +38,15 @@ async def send_chat_message(
             conversation_id=request.conversation_id
         )
 
-        # Extract search parameters used by the agent's search_properties tool
-        search_params = ai_response.get("search_params", {})
+        # Property IDs returned by the agent's search_properties tool, in rank order
+        property_ids = ai_response.get("property_ids") or []
 
-        # Query properties if the agent searched for them
+        # Hydrate exactly the properties the agent saw
         property_context = []
-        if search_params:
-            property_context = PropertyService.get_properties_context_for_ai(
+        if property_ids:
+            property_context = await PropertyService.get_properties_context_by_ids(
                 db=db,
-                area=search_params.get("area"),
-                property_type=search_params.get("property_type"),
-                bedrooms=search_params.get("bedrooms"),
-                min_rent=search_params.get("min_rent"),
-                max_rent=search_params.get("max_rent"),
-                limit=search_params.get("limit", 10)
+                property_ids=property_ids
             )
 
         # Generate conversation ID if not provided
@@ -69,6 +66,82 @@ async def send_chat_message(
         )
 
 
+def sse(event: str, data) -> str:
+    """Format one server-sent event"""
+    return f"event: {event}\ndata: {json.dumps(data, ensure_ascii=False, default=str)}\n\n"
+
+
+def parse_sse(block: str) -> tuple:
+    """Event name and decoded data of one server-sent event block"""
+    event, data = "message", []
+    for line in block.splitlines():
+        if line.startswith("event:"):
+            event = line[len("event:"):].strip()
+        elif line.startswith("data:"):
+            data.append(line[len("data:"):].lstrip())
+    try:
+        return event, json.loads("\n".join(data)) if data else {}
+    except ValueError:
+        return event, {}
+
+
+@router.post("/stream")
+async def stream_chat_message(request: ChatMessageRequest, http_request: Request):
+    """
+    Process a chat message and stream the AI response as server-sent events
+
+    The AI-Engine's events (token, tool_call, tool_result, done, error) are
+    relayed as they arrive, unbuffered. As soon as a property search result
+    names its property IDs, a "properties" event with the hydrated cards
+    follows it, so cards render while the agent is still writing.
+
+    If the client disconnects, the upstream stream is closed and the
+    AI-Engine cancels the turn.
+    """
+    conversation_id = request.conversation_id or str(uuid.uuid4())
+
+    async def events():
+        """Relay upstream events, inserting property cards"""
+        try:
+            async with ai_engine_client.stream_chat(request.message, conversation_id) as upstream:
+                block = []
+                async for line in upstream.aiter_lines():
+                    if line:
+                        block.append(line)
+                        continue
+                    if not block:
+                        continue
+
+                    raw, block = "\n".join(block), []
+                    yield raw + "\n\n"
+
+                    if await http_request.is_disconnected():
+                        print(f"🔌 Client disconnected - closing AI-Engine stream for {conversation_id}")
+                        break
+
+                    event, data = parse_sse(raw)
+                    if event == "tool_result" and data.get("property_ids"):
+                        async with AsyncSessionLocal() as db:
+                            cards = await PropertyService.get_properties_context_by_ids(
+                                db=db,
+                                property_ids=data["property_ids"]
+                            )
+                        yield sse("properties", {
+                            "type": "properties",
+                            "tool_call_id": data.get("id"),
+                            "properties": cards
+                        })
+
+        except Exception as e:
+            yield sse("error", {"type": "error", "detail": f"Error processing chat message: {str(e)}"})
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/health")
 async def chat_health():
     """Check chat endpoint and AI-Engine connectivity"""
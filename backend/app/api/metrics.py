@@ -0,0 +1,33 @@
+"""
+Metrics API endpoints - Runtime counters for the backend read path
+"""
+from fastapi import APIRouter
+from ..services.ai_engine_client import ai_engine_client
+from ..services.count_cache import count_cache
+from ..services.property_service import search_flights
+from ..services.response_cache import response_cache
+from ..services.similarity_index import refresh_flights, similarity_index
+
+router = APIRouter()
+
+
+@router.get("/metrics")
+async def metrics():
+    """
+    Backend metrics
+
+    - property_search: listing searches run vs. coalesced into one in flight
+    - count_cache: cached listing totals, hits and misses
+    - response_cache: cached GET responses, hits, misses and 304s
+    - similar_properties: size and freshness of the similar-listings index
+    - similarity_refresh: index refreshes run vs. requests that waited on one
+    - ai_engine_client: connection pool use and per-endpoint latency to the AI-Engine
+    """
+    return {
+        "property_search": search_flights.snapshot(),
+        "count_cache": count_cache.snapshot(),
+        "response_cache": await response_cache.snapshot(),
+        "similar_properties": similarity_index.snapshot(),
+        "similarity_refresh": refresh_flights.snapshot(),
+        "ai_engine_client": ai_engine_client.snapshot()
+    }
@@ -1,24 +1,32 @@
 """
 Properties API endpoints
 """
-from fastapi import APIRouter, Depends, HTTPException, Query
-from sqlalchemy.orm import Session
-from typing import Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request
+from sqlalchemy.ext.asyncio import AsyncSession
+from typing import Optional, Union
 from decimal import Decimal
 
-from ..database import get_db
+from ..config import settings
+from ..database import get_async_db
 from ..schemas.property import (
     PropertyResponse,
     PropertyListResponse,
-    PropertySearchFilters
+    PropertyCardListResponse,
+    PropertySearchFilters,
+    SemanticPropertySearchResponse,
+    SimilarPropertiesResponse
 )
 from ..services.property_service import PropertyService
+from ..services.ai_engine_client import ai_engine_client
+from ..services.similarity_index import similarity_index, ensure_fresh
+from ..services.response_cache import response_cache
 
 router = APIRouter()
 
 
-@router.get("", response_model=PropertyListResponse)
+@router.get("", response_model=Union[PropertyListResponse, PropertyCardListResponse])
 async def get_properties(
+    request: Request,
     area: Optional[str] = Query(None, description="Filter by area (e.g., Lekki, Ikeja)"),
     min_rent: Optional[Decimal] = Query(None, ge=0, description="Minimum rent price"),
     max_rent: Optional[Decimal] = Query(None, ge=0, description="Maximum rent price"),
@@ -28,13 +36,16 @@ async def get_properties(
     is_available: bool = Query(True, description="Filter by availability"),
     page: int = Query(1, ge=1, description="Page number"),
     page_size: int = Query(20, ge=1, le=100, description="Items per page"),
-    db: Session = Depends(get_db)
+    sort: str = Query("id", pattern="^(id|price_asc|price_desc|newest)$", description="Sort order"),
+    cursor: Optional[str] = Query(None, description="next_cursor from the previous page"),
+    count_mode: str = Query("exact", pattern="^(exact|none)$", description="exact, or none to skip counting"),
+    view: str = Query("full", pattern="^(full|card)$", description="full, or card for lightweight listing cards")
 ):
     """
     Get list of properties with filtering and pagination
 
     Query Parameters:
-    - area: Filter by area name (case-insensitive partial match)
+    - area: Filter by area name (case-insensitive, matches names starting with it)
     - min_rent: Minimum annual rent in Naira
     - max_rent: Maximum annual rent in Naira
     - bedrooms: Number of bedrooms
@@ -43,7 +54,25 @@ async def get_properties(
     - is_available: Only show available properties (default: true)
     - page: Page number (default: 1)
     - page_size: Items per page (default: 20, max: 100)
+    - sort: id, price_asc, price_desc or newest (default: id)
+    - cursor: Continue after the previous page (keyset pagination; page is ignored)
+    - count_mode: exact (default, cached briefly per filter set) or none -
+      total is null and scroll clients rely on has_more
+    - view: full (default) or card - listing columns plus the primary image,
+      one row per property; fetch GET /{property_id} for images and landlord
+
+    Deep pages are cheapest with cursors: each response carries next_cursor,
+    and following it costs the same at any depth. Page numbers still work
+    for jumping to a page.
+
+    Responses carry an ETag and are cached for RESPONSE_CACHE_TTL_SECONDS
+    (less if listings are rewritten first - see services/response_cache.py);
+    send If-None-Match to get a 304 when nothing changed.
     """
+    cached, version = await response_cache.lookup(request)
+    if cached is not None:
+        return cached
+
     try:
         # Create filters object
         filters = PropertySearchFilters(
@@ -55,38 +84,128 @@ async def get_properties(
             property_type=property_type,
             is_available=is_available,
             page=page,
-            page_size=page_size
+            page_size=page_size,
+            sort=sort,
+            cursor=cursor,
+            count_mode=count_mode,
+            view=view
+        )
+
+        # Get properties from database (identical concurrent searches share one query)
+        properties, total, next_cursor = await PropertyService.search_properties(
+            filters, as_rows=settings.FAST_READ_PATH, generation=version
         )
 
-        # Get properties from database
-        properties, total = PropertyService.get_properties(db, filters)
+        page_fields = {
+            "total": total,
+            "has_more": next_cursor is not None,
+            "page": None if cursor else page,
+            "page_size": page_size,
+            "sort": sort,
+            "next_cursor": next_cursor,
+        }
+        if settings.FAST_READ_PATH:
+            # Rows are already in the response shape - encode them directly
+            return await response_cache.respond(request, {**page_fields, "properties": properties}, version)
 
-        return PropertyListResponse(
+        page_model = PropertyCardListResponse if view == "card" else PropertyListResponse
+        return await response_cache.respond(request, page_model(properties=properties, **page_fields), version)
+
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching properties: {str(e)}"
+        )
+
+
+# Declared before /{property_id} so "semantic" isn't parsed as an ID
+@router.get("/semantic", response_model=SemanticPropertySearchResponse)
+async def search_properties_semantic(
+    q: str = Query(..., min_length=1, description="Free-text description, e.g. 'quiet flat near the lagoon with parking'"),
+    area: Optional[str] = Query(None, description="Filter by area (e.g., Lekki, Ikeja)"),
+    min_rent: Optional[Decimal] = Query(None, ge=0, description="Minimum rent price"),
+    max_rent: Optional[Decimal] = Query(None, ge=0, description="Maximum rent price"),
+    bedrooms: Optional[int] = Query(None, ge=0, description="Number of bedrooms"),
+    bathrooms: Optional[int] = Query(None, ge=0, description="Number of bathrooms"),
+    property_type: Optional[str] = Query(None, description="Property type (apartment, house, duplex, room)"),
+    is_available: bool = Query(True, description="Filter by availability"),
+    limit: int = Query(10, ge=1, le=50, description="Maximum number of results"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Natural-language property search
+
+    Structured filters and semantic ranking run in one vector query on the
+    AI-Engine's listings collection; the ranked IDs are then loaded from
+    MySQL with the same filters re-applied, so stale index entries never
+    surface. Results are ordered by relevance.
+    """
+    try:
+        filters = PropertySearchFilters(
+            area=area,
+            min_rent=min_rent,
+            max_rent=max_rent,
+            bedrooms=bedrooms,
+            bathrooms=bathrooms,
+            property_type=property_type,
+            is_available=is_available,
+            page_size=limit
+        )
+
+        result = await ai_engine_client.search_properties_semantic(
+            query=q,
+            filters={
+                "area": area,
+                "property_type": property_type,
+                "bedrooms": bedrooms,
+                "bathrooms": bathrooms,
+                "min_rent": float(min_rent) if min_rent is not None else None,
+                "max_rent": float(max_rent) if max_rent is not None else None,
+                "is_available": is_available,
+            },
+            limit=limit
+        )
+        scores = {hit["property_id"]: hit["score"] for hit in result.get("hits", [])}
+
+        properties = await PropertyService.get_properties_by_ids(db, list(scores), filters)
+
+        return SemanticPropertySearchResponse(
+            query=q,
             properties=properties,
-            total=total,
-            page=page,
-            page_size=page_size
+            scores=[scores[prop.id] for prop in properties],
+            total=len(properties)
         )
 
     except Exception as e:
         raise HTTPException(
             status_code=500,
-            detail=f"Error fetching properties: {str(e)}"
+            detail=f"Error searching properties: {str(e)}"
         )
 
 
 @router.get("/{property_id}", response_model=PropertyResponse)
 async def get_property_by_id(
     property_id: int,
-    db: Session = Depends(get_db)
+    request: Request,
+    db: AsyncSession = Depends(get_async_db)
 ):
     """
     Get a single property by ID
 
-    Returns full property details including images
+    Returns full property details including images (cached with an ETag,
+    like the list)
     """
+    cached, version = await response_cache.lookup(request)
+    if cached is not None:
+        return cached
+
     try:
-        property_obj = PropertyService.get_property_by_id(db, property_id)
+        if settings.FAST_READ_PATH:
+            property_obj = await PropertyService.get_property_row_by_id(db, property_id)
+        else:
+            property_obj = await PropertyService.get_property_by_id(db, property_id)
 
         if not property_obj:
             raise HTTPException(
@@ -94,7 +213,9 @@ async def get_property_by_id(
                 detail=f"Property with ID {property_id} not found"
             )
 
-        return property_obj
+        if not settings.FAST_READ_PATH:
+            property_obj = PropertyResponse.model_validate(property_obj)
+        return await response_cache.respond(request, property_obj, version)
 
     except HTTPException:
         raise
@@ -103,3 +224,45 @@ async def get_property_by_id(
             status_code=500,
             detail=f"Error fetching property: {str(e)}"
         )
+
+
+@router.get("/{property_id}/similar", response_model=SimilarPropertiesResponse)
+async def get_similar_properties(
+    property_id: int,
+    limit: int = Query(6, ge=1, le=20, description="Number of similar listings"),
+    available_only: bool = Query(True, description="Only return available listings"),
+    db: AsyncSession = Depends(get_async_db)
+):
+    """
+    Listings similar to a property
+
+    Nearest neighbours by area, type, bedrooms, bathrooms, rent and
+    location from an in-memory index that picks up listing changes
+    incrementally - no LLM involved.
+    """
+    try:
+        await ensure_fresh()
+
+        if property_id not in similarity_index.row_of:
+            raise HTTPException(
+                status_code=404,
+                detail=f"Property with ID {property_id} not found"
+            )
+
+        neighbours = similarity_index.similar(property_id, limit=limit, available_only=available_only)
+        scores = dict(neighbours)
+        properties = await PropertyService.get_properties_by_ids(db, [pid for pid, _ in neighbours])
+
+        return SimilarPropertiesResponse(
+            property_id=property_id,
+            properties=properties,
+            scores=[scores[prop.id] for prop in properties]
+        )
+
+    except HTTPException:
+        raise
+    except Exception as e:
+        raise HTTPException(
+            status_code=500,
+            detail=f"Error fetching similar properties: {str(e)}"
+        )
@@ -21,8 +21,40 @@ class Settings(BaseSettings):
     MYSQL_PASSWORD: str
     MYSQL_DATABASE: str = "housing_intelligence"
 
+    # Database Pool Config (async engine, per worker)
+    DB_POOL_SIZE: int = 20  # Connections kept open
+    DB_MAX_OVERFLOW: int = 30  # Extra connections allowed under burst load
+    DB_POOL_TIMEOUT: float = 10.0  # Seconds to wait for a free connection
+    DB_POOL_RECYCLE: int = 3600  # Reconnect before MySQL's wait_timeout drops idle connections
+
+    # Listing Count Cache Config
+    COUNT_CACHE_TTL_SECONDS: float = 30.0  # How long a filtered total is reused (0 disables caching)
+    COUNT_CACHE_MAX_ENTRIES: int = 1024  # Distinct filter sets kept
+
+    # Read Path Config
+    FAST_READ_PATH: bool = True  # Serve list/detail from Core rows encoded with orjson (false: ORM + Pydantic)
+
+    # Response Cache Config (GET /properties and /properties/{id})
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_BACKEND: str = "memory"  # memory (per worker) or sqlite (shared by workers on the host)
+    RESPONSE_CACHE_PATH: str = ""  # SQLite file (defaults to backend/data/response_cache.sqlite3)
+    RESPONSE_CACHE_TTL_SECONDS: float = 60.0  # Staleness bound for script writes with the memory backend (sqlite is cleared by the scripts)
+    RESPONSE_CACHE_MAX_ENTRIES: int = 2048
+
     # AI-Engine Config
     AI_ENGINE_URL: str = "http://localhost:8001"
+    AI_ENGINE_CHAT_TIMEOUT: float = 30.0  # Seconds - chat runs the LLM agent
+    AI_ENGINE_SEARCH_TIMEOUT: float = 10.0  # Seconds - review/listing search and embeddings
+    AI_ENGINE_HEALTH_TIMEOUT: float = 5.0
+    AI_ENGINE_CONNECT_TIMEOUT: float = 2.0
+    AI_ENGINE_MAX_CONNECTIONS: int = 100  # Pooled connections (per worker)
+    AI_ENGINE_MAX_KEEPALIVE_CONNECTIONS: int = 20  # Idle connections kept open for reuse
+    AI_ENGINE_KEEPALIVE_EXPIRY: float = 30.0  # Seconds an idle connection is kept
+    AI_ENGINE_HTTP2: bool = False  # Needs httpx[http2]
+
+    # Similar Properties Config
+    SIMILAR_REFRESH_SECONDS: int = 60  # How often the index checks for changed listings
+    SIMILAR_USE_DESCRIPTION_EMBEDDINGS: bool = False  # Add listing description embeddings from the AI-Engine
 
     # Cloudinary Config
     CLOUDINARY_CLOUD_NAME: str
@@ -37,6 +69,11 @@ class Settings(BaseSettings):
         """Construct MySQL database URL"""
         return f"mysql+pymysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
 
+    @property
+    def ASYNC_DATABASE_URL(self) -> str:
+        """Construct async MySQL database URL"""
+        return f"mysql+aiomysql://{self.MYSQL_USER}:{self.MYSQL_PASSWORD}@{self.MYSQL_HOST}:{self.MYSQL_PORT}/{self.MYSQL_DATABASE}"
+
     class Config:
         env_file = ".env"
         case_sensitive = True
@@ -1,16 +1,31 @@
 """
 Main FastAPI application for Backend API
 """
+from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import Response
 from .config import settings
+from .database import async_engine
+from .services.ai_engine_client import ai_engine_client
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Open shared clients on startup and close them on shutdown"""
+    ai_engine_client.start()
+    yield
+    await ai_engine_client.close()
+    await async_engine.dispose()
+    print("👋 Backend shutdown complete")
+
 
 # Create FastAPI app
 app = FastAPI(
     title=settings.APP_NAME,
     version=settings.VERSION,
-    description="Main API server for Housing Intelligence Platform"
+    description="Main API server for Housing Intelligence Platform",
+    lifespan=lifespan
 )
 
 # Custom CORS middleware that runs BEFORE everything
@@ -69,7 +84,8 @@ async def cors_debug():
 
 
 # Import and include routers
-from .api import chat, properties
+from .api import chat, properties, metrics
 
 app.include_router(chat.router, prefix="/api/v1/chat", tags=["Chat"])
 app.include_router(properties.router, prefix="/api/v1/properties", tags=["Properties"])
+app.include_router(metrics.router, prefix="/api/v1", tags=["Metrics"])
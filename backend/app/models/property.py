@@ -1,7 +1,7 @@
 """
 Property model for housing listings
 """
-from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, Enum, ForeignKey
+from sqlalchemy import Column, Integer, String, Text, Numeric, Boolean, DateTime, Enum, ForeignKey, Index
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 import enum
@@ -19,6 +19,19 @@ class PropertyType(str, enum.Enum):
 class Property(Base):
     """Property model"""
     __tablename__ = "properties"
+    __table_args__ = (
+        # Composite indexes for the listing filters (equality columns first,
+        # then the range/sort column). InnoDB appends the primary key to every
+        # secondary index, but that only yields the (..., id) keyset order when
+        # every column before the sort column is an equality match. A range
+        # earlier in the index (the area prefix LIKE, or rent_price when
+        # sorting by id or newest) still narrows the rows, but MySQL sorts them.
+        # Apply to an existing database with scripts/add_property_indexes.py
+        Index("ix_properties_available_area_rent", "is_available", "area", "rent_price"),
+        Index("ix_properties_available_type_bedrooms_rent", "is_available", "property_type", "bedrooms", "rent_price"),
+        Index("ix_properties_available_rent", "is_available", "rent_price"),
+        Index("ix_properties_available_created", "is_available", "created_at"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     landlord_id = Column(Integer, ForeignKey("users.id"), nullable=True)
@@ -38,7 +51,9 @@ class Property(Base):
 
     # Relationships
     landlord = relationship("User", back_populates="properties")
-    images = relationship("PropertyImage", back_populates="property", cascade="all, delete-orphan")
+    images = relationship(
+        "PropertyImage", back_populates="property", cascade="all, delete-orphan", order_by="PropertyImage.id"
+    )
     reviews = relationship("Review", back_populates="property")
 
     def __repr__(self):
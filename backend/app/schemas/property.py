@@ -57,12 +57,53 @@ class PropertyResponse(PropertyBase):
         from_attributes = True
 
 
-class PropertyListResponse(BaseModel):
+class PropertyCardSchema(BaseModel):
+    """Schema for a listing card (list/chat view; full detail via GET /properties/{id})"""
+    id: int
+    title: str
+    area: str
+    address: Optional[str] = None
+    property_type: str
+    bedrooms: int
+    bathrooms: int
+    rent_price: float
+    is_available: bool = True
+    image_url: Optional[str] = None  # Primary image, else the first uploaded
+
+
+class PropertyPage(BaseModel):
+    """Pagination fields shared by the property list views"""
+    total: Optional[int] = None  # None when count_mode=none
+    has_more: bool = False  # Whether another page follows
+    page: Optional[int] = None  # None when paging by cursor
+    page_size: int
+    sort: str = "id"
+    next_cursor: Optional[str] = None  # Pass back as ?cursor= for the next page; None on the last page
+
+
+class PropertyListResponse(PropertyPage):
     """Schema for paginated property list"""
     properties: List[PropertyResponse]
+
+
+class PropertyCardListResponse(PropertyPage):
+    """Schema for paginated property list in card view"""
+    properties: List[PropertyCardSchema]
+
+
+class SemanticPropertySearchResponse(BaseModel):
+    """Schema for semantic property search results (most relevant first)"""
+    query: str
+    properties: List[PropertyResponse]
+    scores: List[float]  # Relevance score per property, same order
     total: int
-    page: int
-    page_size: int
+
+
+class SimilarPropertiesResponse(BaseModel):
+    """Schema for similar listings (most similar first)"""
+    property_id: int
+    properties: List[PropertyResponse]
+    scores: List[float]  # Similarity per property, same order
 
 
 class PropertySearchFilters(BaseModel):
@@ -76,3 +117,7 @@ class PropertySearchFilters(BaseModel):
     is_available: bool = True
     page: int = Field(1, ge=1)
     page_size: int = Field(20, ge=1, le=100)
+    sort: str = Field("id", pattern="^(id|price_asc|price_desc|newest)$")
+    cursor: Optional[str] = None  # Keyset pagination; takes precedence over page
+    count_mode: str = Field("exact", pattern="^(exact|none)$")  # none skips counting
+    view: str = Field("full", pattern="^(full|card)$")  # card: listing columns + primary image only
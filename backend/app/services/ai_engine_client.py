@@ -1,17 +1,108 @@
 """
 AI-Engine client for communicating with the AI/RAG service
+One long-lived httpx client (opened and closed in the app lifespan) keeps
+pooled keep-alive connections to the AI-Engine, so calls don't pay TCP
+setup each time.
 """
+import time
+from contextlib import asynccontextmanager
 import httpx
-from typing import Dict, List, Any, Optional
+from typing import AsyncIterator, Dict, List, Any, Optional, Union
 from ..config import settings
 
+# Property IDs per listing-embeddings request (the AI-Engine's limit)
+LISTING_EMBEDDINGS_BATCH = 5000
+
 
 class AIEngineClient:
     """Client for AI-Engine service"""
 
     def __init__(self):
         self.base_url = settings.AI_ENGINE_URL
-        self.timeout = 30.0  # 30 seconds timeout for LLM calls
+        # Per-endpoint read timeouts - LLM calls take far longer than lookups
+        self.timeouts = {
+            "chat": settings.AI_ENGINE_CHAT_TIMEOUT,
+            "search": settings.AI_ENGINE_SEARCH_TIMEOUT,
+            "health": settings.AI_ENGINE_HEALTH_TIMEOUT,
+        }
+        self._client: Optional[httpx.AsyncClient] = None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.stats: Dict[str, Dict[str, float]] = {}
+
+    # -- lifecycle --------------------------------------------------------
+
+    def start(self) -> httpx.AsyncClient:
+        """Open the pooled client (called on app startup, or lazily on first use)"""
+        if self._client is None or self._client.is_closed:
+            http2 = settings.AI_ENGINE_HTTP2
+            if http2:
+                try:
+                    import h2  # noqa: F401 - httpx needs it for HTTP/2
+                except ImportError:
+                    print("⚠️  AI_ENGINE_HTTP2 is set but h2 is not installed (pip install 'httpx[http2]') - using HTTP/1.1")
+                    http2 = False
+
+            self._client = httpx.AsyncClient(
+                base_url=self.base_url,
+                http2=http2,
+                timeout=httpx.Timeout(self.timeouts["chat"], connect=settings.AI_ENGINE_CONNECT_TIMEOUT),
+                limits=httpx.Limits(
+                    max_connections=settings.AI_ENGINE_MAX_CONNECTIONS,
+                    max_keepalive_connections=settings.AI_ENGINE_MAX_KEEPALIVE_CONNECTIONS,
+                    keepalive_expiry=settings.AI_ENGINE_KEEPALIVE_EXPIRY
+                )
+            )
+            print(f"✅ AI-Engine client ready: {self.base_url} (HTTP/{'2' if http2 else '1.1'}, "
+                  f"{settings.AI_ENGINE_MAX_CONNECTIONS} connections)")
+        return self._client
+
+    async def close(self):
+        """Close the pooled client (called on app shutdown)"""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+    # -- requests ---------------------------------------------------------
+
+    async def _request(self, endpoint: str, method: str, path: str, **kwargs) -> Dict[str, Any]:
+        """
+        Send a request on the shared client and record its stats
+
+        Args:
+            endpoint: Timeout group ("chat", "search" or "health")
+            method: HTTP method
+            path: Path on the AI-Engine
+            **kwargs: Passed to httpx (json, params)
+
+        Returns:
+            Decoded JSON response
+        """
+        async with self._tracked(path):
+            timeout = httpx.Timeout(self.timeouts[endpoint], connect=settings.AI_ENGINE_CONNECT_TIMEOUT)
+            response = await self.start().request(method, path, timeout=timeout, **kwargs)
+            response.raise_for_status()
+            return response.json()
+
+    @asynccontextmanager
+    async def _tracked(self, path: str):
+        """Count a request (in flight, errors, latency) for the metrics"""
+        stats = self.stats.setdefault(path, {"requests": 0, "errors": 0, "total_ms": 0.0, "max_ms": 0.0})
+        stats["requests"] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        start = time.perf_counter()
+
+        try:
+            yield
+        except Exception:
+            stats["errors"] += 1
+            raise
+        finally:
+            self.in_flight -= 1
+            elapsed_ms = (time.perf_counter() - start) * 1000
+            stats["total_ms"] += elapsed_ms
+            stats["max_ms"] = max(stats["max_ms"], elapsed_ms)
 
     async def chat(
         self,
@@ -30,50 +121,114 @@ class AIEngineClient:
         Returns:
             AI response with sources and conversation_id
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {
-                "message": message,
-                "context": context or {},
-                "conversation_id": conversation_id
-            }
+        payload = {
+            "message": message,
+            "context": context or {},
+            "conversation_id": conversation_id
+        }
+        return await self._request("chat", "POST", "/ai/v1/chat", json=payload)
 
-            response = await client.post(
-                f"{self.base_url}/ai/v1/chat",
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+    @asynccontextmanager
+    async def stream_chat(
+        self,
+        message: str,
+        conversation_id: Optional[str] = None
+    ) -> AsyncIterator[httpx.Response]:
+        """
+        Open the AI-Engine's server-sent event stream for a chat turn
+
+        Leaving the context closes the upstream connection; the AI-Engine
+        treats that as a disconnect and cancels the turn.
+
+        Args:
+            message: User message
+            conversation_id: Optional conversation ID
+
+        Yields:
+            Streaming response - read it with aiter_lines()
+        """
+        path = "/ai/v1/chat/stream"
+        payload = {"message": message, "conversation_id": conversation_id}
+        # The read timeout applies between events, not to the whole turn
+        timeout = httpx.Timeout(self.timeouts["chat"], connect=settings.AI_ENGINE_CONNECT_TIMEOUT)
+
+        async with self._tracked(path):
+            async with self.start().stream("POST", path, json=payload, timeout=timeout) as response:
+                response.raise_for_status()
+                yield response
 
     async def search_reviews(
         self,
-        query: str,
+        query: Union[str, List[str]],
         filters: Optional[Dict[str, Any]] = None,
         limit: int = 5
-    ) -> List[Dict[str, Any]]:
+    ) -> Dict[str, Any]:
         """
         Search for relevant reviews in ChromaDB
 
         Args:
-            query: Search query
+            query: Search query, or a list of queries for a batched search
             filters: Metadata filters (area, property_type, etc.)
+            limit: Maximum number of results per query
+
+        Returns:
+            {"results": [{"query": ..., "hits": [{id, text, metadata, score}]}]}
+        """
+        payload = {
+            "filters": filters or {},
+            "limit": limit
+        }
+        if isinstance(query, str):
+            payload["query"] = query
+        else:
+            payload["queries"] = list(query)
+
+        return await self._request("search", "POST", "/ai/v1/search/reviews", json=payload)
+
+    async def search_properties_semantic(
+        self,
+        query: str,
+        filters: Optional[Dict[str, Any]] = None,
+        limit: int = 10
+    ) -> Dict[str, Any]:
+        """
+        Rank property listings by semantic similarity within structured filters
+
+        Args:
+            query: Free-text description of the wanted property
+            filters: area, property_type, bedrooms, bathrooms, min_rent, max_rent, is_available
             limit: Maximum number of results
 
         Returns:
-            List of relevant reviews
-        """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {
-                "query": query,
-                "filters": filters or {},
-                "limit": limit
-            }
-
-            response = await client.post(
-                f"{self.base_url}/ai/v1/search/reviews",
-                json=payload
+            {"query": ..., "hits": [{property_id, score, metadata}]}
+        """
+        payload = {
+            "query": query,
+            "filters": filters or {},
+            "limit": limit
+        }
+        return await self._request("search", "POST", "/ai/v1/search/properties", json=payload)
+
+    async def get_listing_embeddings(self, property_ids: List[int]) -> Dict[str, Any]:
+        """
+        Fetch stored description embeddings for property listings
+
+        Requested in batches of LISTING_EMBEDDINGS_BATCH IDs.
+
+        Args:
+            property_ids: Property IDs
+
+        Returns:
+            {"embeddings": {"<property_id>": [floats]}} for listings that are indexed
+        """
+        embeddings = {}
+        for start in range(0, len(property_ids), LISTING_EMBEDDINGS_BATCH):
+            result = await self._request(
+                "search", "POST", "/ai/v1/search/properties/embeddings",
+                json={"property_ids": property_ids[start:start + LISTING_EMBEDDINGS_BATCH]}
             )
-            response.raise_for_status()
-            return response.json()
+            embeddings.update(result.get("embeddings", {}))
+        return {"embeddings": embeddings}
 
     async def analyze_intent(
         self,
@@ -88,15 +243,8 @@ class AIEngineClient:
         Returns:
             Intent classification and extracted entities
         """
-        async with httpx.AsyncClient(timeout=self.timeout) as client:
-            payload = {"message": message}
-
-            response = await client.post(
-                f"{self.base_url}/ai/v1/analyze/intent",
-                json=payload
-            )
-            response.raise_for_status()
-            return response.json()
+        payload = {"message": message}
+        return await self._request("chat", "POST", "/ai/v1/analyze/intent", json=payload)
 
     async def health_check(self) -> Dict[str, Any]:
         """
@@ -105,10 +253,29 @@ class AIEngineClient:
         Returns:
             Health status information
         """
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            response = await client.get(f"{self.base_url}/health")
-            response.raise_for_status()
-            return response.json()
+        return await self._request("health", "GET", "/health")
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Pool limits, requests in flight and per-endpoint request stats"""
+        # httpx has no public API for open/idle connections, so only the
+        # configured limits and our own in-flight count are reported
+        return {
+            "open": self._client is not None and not self._client.is_closed,
+            "max_connections": settings.AI_ENGINE_MAX_CONNECTIONS,
+            "max_keepalive_connections": settings.AI_ENGINE_MAX_KEEPALIVE_CONNECTIONS,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight,
+            "utilization": round(self.in_flight / settings.AI_ENGINE_MAX_CONNECTIONS, 3),
+            "endpoints": {
+                path: {
+                    "requests": int(stats["requests"]),
+                    "errors": int(stats["errors"]),
+                    "avg_ms": round(stats["total_ms"] / stats["requests"], 1) if stats["requests"] else 0.0,
+                    "max_ms": round(stats["max_ms"], 1),
+                }
+                for path, stats in self.stats.items()
+            },
+        }
 
 
 # Singleton instance
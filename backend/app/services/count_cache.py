@@ -0,0 +1,100 @@
+"""
+Listing count cache
+Total counts for the property list are cached per normalized filter set
+for a short TTL, so paging through one search counts the matching rows
+once instead of on every page. Any flush that writes a property clears
+the cache; writes from other processes (seeding scripts, other workers)
+show up when the TTL expires.
+"""
+import time
+from typing import Any, Dict, Optional, Tuple
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from ..config import settings
+from ..models.property import Property
+from ..schemas.property import PropertySearchFilters
+
+
+def count_key(filters: PropertySearchFilters) -> Tuple[Any, ...]:
+    """
+    Cache key for the filters that affect the count
+
+    Pagination and sort fields are left out, and values are normalized the
+    way MySQL compares them (area matching is case-insensitive).
+    """
+    return (
+        (filters.area or "").strip().lower() or None,
+        (filters.property_type or "").strip().lower() or None,
+        filters.bedrooms,
+        filters.bathrooms,
+        str(filters.min_rent.normalize()) if filters.min_rent is not None else None,
+        str(filters.max_rent.normalize()) if filters.max_rent is not None else None,
+        filters.is_available,
+    )
+
+
+class CountCache:
+    """TTL cache of listing counts, cleared on property writes"""
+
+    def __init__(self, ttl_seconds: float, max_entries: int):
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.version = 0
+        self._counts: Dict[Tuple[Any, ...], Tuple[int, float]] = {}
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, filters: PropertySearchFilters) -> Optional[int]:
+        """Cached count, or None if missing or expired"""
+        entry = self._counts.get(count_key(filters))
+        if entry is None or time.monotonic() - entry[1] > self.ttl_seconds:
+            self.misses += 1
+            return None
+        self.hits += 1
+        return entry[0]
+
+    def set(self, filters: PropertySearchFilters, count: int, version: int):
+        """
+        Store a count
+
+        Args:
+            filters: Filters the count was computed for
+            count: Number of matching properties
+            version: Cache version read before counting - a count that
+                raced with a write is dropped instead of cached
+        """
+        if version != self.version or self.ttl_seconds <= 0:
+            return
+        if len(self._counts) >= self.max_entries:
+            # Drop the oldest entry (dicts keep insertion order)
+            self._counts.pop(next(iter(self._counts)))
+        self._counts[count_key(filters)] = (count, time.monotonic())
+
+    def invalidate(self):
+        """Forget every cached count"""
+        self.version += 1
+        self._counts.clear()
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Cache size and hit rate"""
+        return {
+            "entries": len(self._counts),
+            "version": self.version,
+            "hits": self.hits,
+            "misses": self.misses,
+        }
+
+
+# Global instance
+count_cache = CountCache(
+    ttl_seconds=settings.COUNT_CACHE_TTL_SECONDS,
+    max_entries=settings.COUNT_CACHE_MAX_ENTRIES
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _invalidate_on_property_write(session, flush_context):
+    """Clear cached counts when a flush inserts, updates or deletes a property"""
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, Property) for obj in changed):
+        count_cache.invalidate()
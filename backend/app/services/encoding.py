@@ -0,0 +1,24 @@
+"""
+Fast JSON responses
+Hot read endpoints build plain dictionaries from Core rows and encode them
+with orjson (via the response cache), skipping ORM hydration, Pydantic
+validation and the standard JSON encoder. The dictionaries match the
+declared response models (scripts/check_response_parity.py compares the
+two paths).
+"""
+from decimal import Decimal
+from typing import Any
+import orjson
+
+
+def _default(value: Any) -> Any:
+    """Encode types orjson doesn't handle natively, the way Pydantic does"""
+    if isinstance(value, Decimal):
+        return str(value)
+    raise TypeError(f"Type is not JSON serializable: {type(value).__name__}")
+
+
+def dumps(payload: Any) -> bytes:
+    """Encode a payload to JSON bytes (UTC datetimes end in Z, like Pydantic)"""
+    return orjson.dumps(payload, default=_default, option=orjson.OPT_UTC_Z)
+
@@ -1,19 +1,193 @@
 """
 Property service for database operations
 """
-from sqlalchemy.orm import Session, joinedload
-from typing import List, Optional
+import base64
+import json
+from datetime import datetime
+from sqlalchemy import select, func, and_, or_
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import joinedload
+from typing import Any, List, Optional
 from decimal import Decimal
 from ..models.property import Property, PropertyType
 from ..models.property_image import PropertyImage
+from ..models.user import User
 from ..schemas.property import PropertySearchFilters
+from ..database import AsyncSessionLocal
+from .count_cache import count_cache, count_key
+from .singleflight import SingleFlight
+
+# Concurrent identical listing searches share one query
+search_flights = SingleFlight("property_search")
+
+
+# Listing sort orders as (column, descending) keys. Each ends with the
+# primary key so every row has a unique position a cursor can point at.
+SORT_ORDERS = {
+    "id": ((Property.id, False),),
+    "price_asc": ((Property.rent_price, False), (Property.id, False)),
+    "price_desc": ((Property.rent_price, True), (Property.id, True)),
+    "newest": ((Property.created_at, True), (Property.id, True)),
+}
+
+# How cursor values are read back into column types
+_CURSOR_TYPES = {
+    "id": int,
+    "rent_price": Decimal,
+    "created_at": datetime.fromisoformat,
+}
+
+
+def area_matches(area: str):
+    """
+    Case-insensitive prefix match on the area name
+
+    A prefix LIKE (no leading wildcard, no LOWER() around the column) can
+    seek the area indexes; the column's collation makes it case-insensitive.
+    """
+    prefix = area.strip().replace("!", "!!").replace("%", "!%").replace("_", "!_")
+    return Property.area.like(f"{prefix}%", escape="!")
+
+
+# Columns a listing card shows - full detail comes from GET /properties/{id}
+CARD_COLUMNS = (
+    Property.id,
+    Property.title,
+    Property.area,
+    Property.address,
+    Property.property_type,
+    Property.bedrooms,
+    Property.bathrooms,
+    Property.rent_price,
+    Property.is_available,
+)
+
+
+# Columns of a full property response, read as Core rows (no ORM entities)
+DETAIL_COLUMNS = (
+    Property.id,
+    Property.title,
+    Property.description,
+    Property.area,
+    Property.address,
+    Property.property_type,
+    Property.bedrooms,
+    Property.bathrooms,
+    Property.rent_price,
+    Property.is_available,
+    Property.landlord_id,
+    Property.latitude,
+    Property.longitude,
+    Property.created_at,
+    Property.updated_at,
+    User.id.label("landlord_user_id"),
+    User.full_name.label("landlord_full_name"),
+    User.phone_number.label("landlord_phone_number"),
+    User.email.label("landlord_email"),
+)
+
+IMAGE_COLUMNS = (
+    PropertyImage.id,
+    PropertyImage.property_id,
+    PropertyImage.image_url,
+    PropertyImage.is_primary,
+    PropertyImage.uploaded_at,
+)
+
+
+def _primary_image():
+    """Correlated subquery for a card's image: the primary one, else the first uploaded"""
+    return (
+        select(PropertyImage.image_url)
+        .where(PropertyImage.property_id == Property.id)
+        .order_by(PropertyImage.is_primary.desc(), PropertyImage.id)
+        .limit(1)
+        .correlate(Property)
+        .scalar_subquery()
+        .label("image_url")
+    )
+
+
+def _cards():
+    """Select of card columns - one row per property, no joins"""
+    return select(*CARD_COLUMNS, _primary_image())
+
+
+def _with_relations(stmt):
+    """Eager-load images and landlord (lazy loads are not allowed on async sessions)"""
+    return stmt.options(joinedload(Property.images), joinedload(Property.landlord))
+
+
+def encode_cursor(sort: str, row: Any) -> str:
+    """
+    Opaque cursor pointing just past a row in the given sort order
+
+    Args:
+        sort: Key of SORT_ORDERS
+        row: Last property (or row of its sort-key columns) of the current page
+
+    Returns:
+        URL-safe cursor string
+    """
+    values = []
+    for column, _ in SORT_ORDERS[sort]:
+        value = getattr(row, column.key)
+        values.append(value.isoformat() if isinstance(value, datetime) else str(value))
+    payload = json.dumps({"sort": sort, "after": values}, separators=(",", ":"))
+    return base64.urlsafe_b64encode(payload.encode("utf-8")).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, sort: str) -> List[Any]:
+    """
+    Sort-key values stored in a cursor
+
+    Args:
+        cursor: Cursor from a previous response
+        sort: Sort order of the current request
+
+    Returns:
+        Values for the columns of SORT_ORDERS[sort]
+
+    Raises:
+        ValueError: If the cursor is malformed or was issued for another sort
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        payload = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        order = SORT_ORDERS[payload["sort"]]
+        values = [_CURSOR_TYPES[column.key](value) for (column, _), value in zip(order, payload["after"])]
+    except (ValueError, KeyError, TypeError, ArithmeticError):
+        raise ValueError("Invalid cursor")
+
+    if payload["sort"] != sort:
+        raise ValueError(f"Cursor was issued for sort '{payload['sort']}', not '{sort}'")
+    if len(values) != len(order):
+        raise ValueError("Invalid cursor")
+    return values
+
+
+def _after(sort: str, values: List[Any]):
+    """
+    Seek condition for rows after the cursor position
+
+    (a, b) > (x, y) is expanded to a > x OR (a = x AND b > y), with the
+    comparison flipped for descending keys, so MySQL can range-scan the
+    sort index instead of skipping rows.
+    """
+    order = SORT_ORDERS[sort]
+    clauses = []
+    for i, (column, descending) in enumerate(order):
+        beyond = column < values[i] if descending else column > values[i]
+        ties = [prev == value for (prev, _), value in zip(order[:i], values[:i])]
+        clauses.append(and_(*ties, beyond))
+    return or_(*clauses)
 
 
 class PropertyService:
     """Service for property-related database operations"""
 
     @staticmethod
-    def get_property_by_id(db: Session, property_id: int) -> Optional[Property]:
+    async def get_property_by_id(db: AsyncSession, property_id: int) -> Optional[Property]:
         """
         Get a single property by ID with images and landlord
 
@@ -24,34 +198,25 @@ class PropertyService:
         Returns:
             Property object or None
         """
-        return (
-            db.query(Property)
-            .options(joinedload(Property.images), joinedload(Property.landlord))
-            .filter(Property.id == property_id)
-            .first()
+        result = await db.execute(
+            _with_relations(select(Property)).where(Property.id == property_id)
         )
+        return result.unique().scalar_one_or_none()
 
     @staticmethod
-    def get_properties(
-        db: Session,
-        filters: PropertySearchFilters
-    ) -> tuple[List[Property], int]:
+    def apply_filters(query, filters: PropertySearchFilters):
         """
-        Get properties with filters and pagination
+        Apply the structured search filters to a Property select
 
         Args:
-            db: Database session
-            filters: Search filters
+            query: Select statement over Property
+            filters: Search filters (pagination fields are ignored)
 
         Returns:
-            Tuple of (list of properties, total count)
+            Filtered statement
         """
-        # Base query with images and landlord
-        query = db.query(Property).options(joinedload(Property.images), joinedload(Property.landlord))
-
-        # Apply filters
         if filters.area:
-            query = query.filter(Property.area.ilike(f"%{filters.area}%"))
+            query = query.filter(area_matches(filters.area))
 
         if filters.property_type:
             query = query.filter(Property.property_type == filters.property_type)
@@ -71,18 +236,269 @@ class PropertyService:
         if filters.is_available is not None:
             query = query.filter(Property.is_available == filters.is_available)
 
-        # Get total count before pagination
-        total_count = query.count()
+        return query
+
+    @staticmethod
+    async def get_properties_by_ids(
+        db: AsyncSession,
+        property_ids: List[int],
+        filters: Optional[PropertySearchFilters] = None
+    ) -> List[Property]:
+        """
+        Load properties by primary key in the given order
+
+        Filters are re-applied in SQL so listings that changed since the
+        vector index was last synced (price, availability) are dropped.
+
+        Args:
+            db: Database session
+            property_ids: Property IDs in rank order
+            filters: Optional search filters
+
+        Returns:
+            Properties that exist and still match, in rank order
+        """
+        if not property_ids:
+            return []
+
+        stmt = _with_relations(select(Property)).where(Property.id.in_(property_ids))
+        if filters is not None:
+            stmt = PropertyService.apply_filters(stmt, filters)
+
+        result = await db.execute(stmt)
+        by_id = {prop.id: prop for prop in result.unique().scalars().all()}
+        return [by_id[property_id] for property_id in property_ids if property_id in by_id]
+
+    @staticmethod
+    async def get_property_rows_by_ids(
+        db: AsyncSession,
+        property_ids: List[int],
+        filters: Optional[PropertySearchFilters] = None
+    ) -> List[dict]:
+        """
+        Load full properties as plain dictionaries in the given order
+
+        Same data as get_properties_by_ids, but from two Core selects (one
+        row per property with its landlord, then the images) with no ORM
+        hydration - for the fast JSON read path.
+
+        Args:
+            db: Database session
+            property_ids: Property IDs in display order
+            filters: Optional search filters
+
+        Returns:
+            Dictionaries shaped like PropertyResponse, in order
+        """
+        if not property_ids:
+            return []
+
+        stmt = (
+            select(*DETAIL_COLUMNS)
+            .outerjoin(User, Property.landlord_id == User.id)
+            .where(Property.id.in_(property_ids))
+        )
+        if filters is not None:
+            stmt = PropertyService.apply_filters(stmt, filters)
+        by_id = {row.id: row for row in (await db.execute(stmt)).all()}
+        if not by_id:
+            return []
+
+        images: dict = {property_id: [] for property_id in by_id}
+        image_rows = await db.execute(
+            select(*IMAGE_COLUMNS)
+            .where(PropertyImage.property_id.in_(list(by_id)))
+            .order_by(PropertyImage.id)
+        )
+        for image in image_rows.all():
+            images[image.property_id].append({
+                "id": image.id,
+                "property_id": image.property_id,
+                "image_url": image.image_url,
+                "is_primary": image.is_primary,
+                "uploaded_at": image.uploaded_at,
+            })
+
+        return [
+            PropertyService.format_property_row(by_id[property_id], images[property_id])
+            for property_id in property_ids if property_id in by_id
+        ]
+
+    @staticmethod
+    async def get_property_row_by_id(db: AsyncSession, property_id: int) -> Optional[dict]:
+        """Single property as a plain dictionary (see get_property_rows_by_ids)"""
+        rows = await PropertyService.get_property_rows_by_ids(db, [property_id])
+        return rows[0] if rows else None
+
+    @staticmethod
+    async def get_property_cards_by_ids(
+        db: AsyncSession,
+        property_ids: List[int],
+        filters: Optional[PropertySearchFilters] = None
+    ) -> List[dict]:
+        """
+        Load listing cards by primary key in the given order
+
+        Args:
+            db: Database session
+            property_ids: Property IDs in display order
+            filters: Optional search filters (re-applied like get_properties_by_ids)
+
+        Returns:
+            Card dictionaries for properties that exist and still match, in order
+        """
+        if not property_ids:
+            return []
+
+        stmt = _cards().where(Property.id.in_(property_ids))
+        if filters is not None:
+            stmt = PropertyService.apply_filters(stmt, filters)
+
+        by_id = {row.id: row for row in (await db.execute(stmt)).all()}
+        return [
+            PropertyService.format_card(by_id[property_id])
+            for property_id in property_ids if property_id in by_id
+        ]
+
+    @staticmethod
+    def count_statement(filters: PropertySearchFilters):
+        """Count over IDs only - no joins or eager loads"""
+        return select(func.count()).select_from(
+            PropertyService.apply_filters(select(Property.id), filters).subquery()
+        )
+
+    @staticmethod
+    def page_statement(filters: PropertySearchFilters):
+        """
+        Sort keys of one listing page, plus one look-ahead row
+
+        Only the sort-key columns are selected, so LIMIT applies to
+        properties rather than joined image rows.
+
+        Raises:
+            ValueError: If the cursor is invalid for the requested sort
+        """
+        order = SORT_ORDERS[filters.sort]
+        stmt = PropertyService.apply_filters(select(*[column for column, _ in order]), filters).order_by(
+            *[column.desc() if descending else column.asc() for column, descending in order]
+        )
+        if filters.cursor:
+            stmt = stmt.where(_after(filters.sort, decode_cursor(filters.cursor, filters.sort)))
+        else:
+            stmt = stmt.offset((filters.page - 1) * filters.page_size)
+        return stmt.limit(filters.page_size + 1)
+
+    @staticmethod
+    async def count_properties(db: AsyncSession, filters: PropertySearchFilters) -> int:
+        """
+        Count properties matching the filters (cached per filter set)
+
+        Args:
+            db: Database session
+            filters: Search filters (pagination fields are ignored)
+
+        Returns:
+            Number of matching properties
+        """
+        cached = count_cache.get(filters)
+        if cached is not None:
+            return cached
+
+        version = count_cache.version
+        total_count = (await db.execute(PropertyService.count_statement(filters))).scalar_one()
+        count_cache.set(filters, total_count, version)
+        return total_count
+
+    @staticmethod
+    async def get_properties(
+        db: AsyncSession,
+        filters: PropertySearchFilters,
+        as_rows: bool = False
+    ) -> tuple[List[Any], Optional[int], Optional[str]]:
+        """
+        Get properties with filters and pagination
+
+        With filters.cursor set, the page starts right after the cursor
+        position (keyset pagination - constant cost at any depth);
+        otherwise filters.page is used with an offset. filters.view "card"
+        loads card dictionaries instead of full properties.
+
+        Args:
+            db: Database session
+            filters: Search filters
+            as_rows: Return full properties as plain dictionaries (fast path)
+
+        Returns:
+            Tuple of (list of properties or cards, total count or None when
+            filters.count_mode is "none", cursor for the next page or None
+            on the last page)
+
+        Raises:
+            ValueError: If the cursor is invalid for the requested sort
+        """
+        page_stmt = PropertyService.page_statement(filters)
+
+        total_count = None
+        if filters.count_mode == "exact":
+            total_count = await PropertyService.count_properties(db, filters)
+
+        # One extra row tells whether a next page exists
+        rows = (await db.execute(page_stmt)).all()
+        page = rows[:filters.page_size]
+        page_ids = [row.id for row in page]
+        if filters.view == "card":
+            properties = await PropertyService.get_property_cards_by_ids(db, page_ids)
+        elif as_rows:
+            properties = await PropertyService.get_property_rows_by_ids(db, page_ids)
+        else:
+            properties = await PropertyService.get_properties_by_ids(db, page_ids)
+
+        next_cursor = encode_cursor(filters.sort, page[-1]) if len(rows) > len(page) else None
+        return properties, total_count, next_cursor
+
+    @staticmethod
+    def search_key(filters: PropertySearchFilters, as_rows: bool = False) -> tuple:
+        """Normalized identity of a listing search (filters, page position and view)"""
+        position = filters.cursor if filters.cursor else filters.page
+        return count_key(filters) + (
+            filters.sort, position, filters.page_size, filters.view, filters.count_mode, as_rows
+        )
+
+    @staticmethod
+    async def search_properties(
+        filters: PropertySearchFilters,
+        as_rows: bool = False,
+        generation: Any = None
+    ) -> tuple[List[Any], Optional[int], Optional[str]]:
+        """
+        get_properties, coalesced across concurrent identical searches
+
+        The shared call opens its own session, so it keeps running for the
+        other waiters if the request that started it is cancelled. Results
+        are read-only for callers - they may be shared.
+
+        Args:
+            filters: Search filters
+            as_rows: Return full properties as plain dictionaries (fast path)
+            generation: Only share calls started at the same generation
+                (the response cache version), so a caller never joins a
+                search that began before a write it has already seen
+
+        Returns:
+            Same as get_properties
 
-        # Apply pagination
-        offset = (filters.page - 1) * filters.page_size
-        properties = query.offset(offset).limit(filters.page_size).all()
+        Raises:
+            ValueError: If the cursor is invalid for the requested sort
+        """
+        async def run():
+            async with AsyncSessionLocal() as db:
+                return await PropertyService.get_properties(db, filters, as_rows=as_rows)
 
-        return properties, total_count
+        return await search_flights.do(PropertyService.search_key(filters, as_rows) + (generation,), run)
 
     @staticmethod
-    def search_properties_by_area(
-        db: Session,
+    async def search_properties_by_area(
+        db: AsyncSession,
         area: str,
         limit: int = 10
     ) -> List[Property]:
@@ -97,18 +513,17 @@ class PropertyService:
         Returns:
             List of properties
         """
-        return (
-            db.query(Property)
-            .options(joinedload(Property.images), joinedload(Property.landlord))
-            .filter(Property.area.ilike(f"%{area}%"))
-            .filter(Property.is_available == True)
+        result = await db.execute(
+            _with_relations(select(Property))
+            .where(area_matches(area))
+            .where(Property.is_available == True)
             .limit(limit)
-            .all()
         )
+        return list(result.unique().scalars().all())
 
     @staticmethod
-    def get_properties_context_for_ai(
-        db: Session,
+    async def get_properties_context_for_ai(
+        db: AsyncSession,
         area: Optional[str] = None,
         property_type: Optional[str] = None,
         min_rent: Optional[Decimal] = None,
@@ -129,49 +544,113 @@ class PropertyService:
             limit: Maximum number of results
 
         Returns:
-            List of property dictionaries with essential info
+            List of listing card dictionaries
         """
-        query = db.query(Property).options(joinedload(Property.images), joinedload(Property.landlord)).filter(Property.is_available == True)
+        stmt = _cards().where(Property.is_available == True)
 
         if area:
-            query = query.filter(Property.area.ilike(f"%{area}%"))
+            stmt = stmt.where(area_matches(area))
 
         if property_type:
             # Convert string to PropertyType enum
             try:
                 prop_type_enum = PropertyType[property_type.upper()]
-                query = query.filter(Property.property_type == prop_type_enum)
+                stmt = stmt.where(Property.property_type == prop_type_enum)
             except KeyError:
                 pass  # Invalid property type, skip filter
 
         if min_rent is not None:
-            query = query.filter(Property.rent_price >= min_rent)
+            stmt = stmt.where(Property.rent_price >= min_rent)
 
         if max_rent is not None:
-            query = query.filter(Property.rent_price <= max_rent)
+            stmt = stmt.where(Property.rent_price <= max_rent)
 
         if bedrooms is not None:
-            query = query.filter(Property.bedrooms == bedrooms)
+            stmt = stmt.where(Property.bedrooms == bedrooms)
 
-        properties = query.limit(limit).all()
+        result = await db.execute(stmt.limit(limit))
+        return [PropertyService.format_card(row) for row in result.all()]
 
-        # Format for AI
-        return [
-            {
-                "id": prop.id,
-                "title": prop.title,
-                "area": prop.area,
-                "property_type": prop.property_type.value,
-                "bedrooms": prop.bedrooms,
-                "bathrooms": prop.bathrooms,
-                "rent_price": float(prop.rent_price),
-                "address": prop.address,
-                "images": [{"image_url": img.image_url} for img in prop.images] if prop.images else [],
-                "landlord": {
-                    "full_name": prop.landlord.full_name,
-                    "phone_number": prop.landlord.phone_number,
-                    "email": prop.landlord.email
-                } if prop.landlord else None,
-            }
-            for prop in properties
-        ]
+    @staticmethod
+    async def get_properties_context_by_ids(
+        db: AsyncSession,
+        property_ids: List[int]
+    ) -> List[dict]:
+        """
+        Hydrate property cards by primary key, preserving the given order
+
+        Used when the AI-Engine already knows which properties it showed,
+        so no filter search has to be repeated.
+
+        Args:
+            db: Database session
+            property_ids: Property IDs in display order
+
+        Returns:
+            List of listing card dictionaries
+        """
+        return await PropertyService.get_property_cards_by_ids(db, property_ids)
+
+    @staticmethod
+    def format_property_row(row, images: List[dict]) -> dict:
+        """
+        Format a DETAIL_COLUMNS row as a PropertyResponse-shaped dictionary
+
+        Keys follow the schema's field order; Decimal and datetime values are
+        left for the JSON encoder.
+
+        Args:
+            row: Row of DETAIL_COLUMNS
+            images: Image dictionaries for the property
+
+        Returns:
+            Property dictionary
+        """
+        return {
+            "title": row.title,
+            "description": row.description,
+            "area": row.area,
+            "address": row.address,
+            "property_type": row.property_type.value,
+            "bedrooms": row.bedrooms,
+            "bathrooms": row.bathrooms,
+            "rent_price": row.rent_price,
+            "is_available": row.is_available,
+            "id": row.id,
+            "landlord_id": row.landlord_id,
+            "landlord": {
+                "full_name": row.landlord_full_name,
+                "phone_number": row.landlord_phone_number,
+                "email": row.landlord_email,
+            } if row.landlord_user_id is not None else None,
+            "latitude": row.latitude,
+            "longitude": row.longitude,
+            "created_at": row.created_at,
+            "updated_at": row.updated_at,
+            "images": images,
+        }
+
+    @staticmethod
+    def format_card(row) -> dict:
+        """
+        Format a card row as a dictionary for list and chat responses
+
+        Args:
+            row: Row of CARD_COLUMNS plus image_url
+
+        Returns:
+            Card dictionary (open GET /properties/{id} for images, landlord
+            and description)
+        """
+        return {
+            "id": row.id,
+            "title": row.title,
+            "area": row.area,
+            "address": row.address,
+            "property_type": row.property_type.value,
+            "bedrooms": row.bedrooms,
+            "bathrooms": row.bathrooms,
+            "rent_price": float(row.rent_price),
+            "is_available": row.is_available,
+            "image_url": row.image_url,
+        }
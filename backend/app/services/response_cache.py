@@ -0,0 +1,323 @@
+"""
+Response cache for property reads
+Encoded GET responses are cached per normalized path and query string and
+served with a strong ETag, so repeat requests skip MySQL and clients that
+send If-None-Match get a bodyless 304.
+
+Entries are keyed by a data version, so bumping it makes all earlier
+entries unreachable at once. It is bumped when a transaction that wrote a
+property or image commits, and by the seeding and image scripts after they
+commit. A response is stored under the version read before its rows were,
+so a body that raced with a write is never cached as current. Backends are pluggable: an in-process LRU (per worker),
+or a SQLite file shared by all workers on the host.
+
+The API has no listing write endpoints, so listings change through the
+scripts. With the SQLite backend their version bump reaches every worker
+immediately. With the memory backend it can't reach the API process, and
+staleness is bounded by RESPONSE_CACHE_TTL_SECONDS.
+"""
+import asyncio
+import hashlib
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Dict, Optional, Tuple
+from urllib.parse import urlencode
+from fastapi import Request
+from fastapi.responses import Response
+from pydantic import BaseModel
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from .encoding import dumps
+from ..config import settings
+from ..models.property import Property
+from ..models.property_image import PropertyImage
+
+# (etag, body, expires_at)
+Entry = Tuple[str, bytes, float]
+
+DEFAULT_CACHE_PATH = Path(__file__).parent.parent.parent / "data" / "response_cache.sqlite3"
+
+
+class MemoryBackend:
+    """In-process LRU - fastest, but each worker has its own copy and version"""
+
+    blocking = False  # Dictionary operations - called directly on the event loop
+
+    def __init__(self, max_entries: int):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[str, Entry]" = OrderedDict()
+        self._version = 0
+
+    def get(self, key: str) -> Optional[Entry]:
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+    def set(self, key: str, entry: Entry, version: int):
+        if version != self._version:
+            return  # Read before a write - don't cache it
+        self._entries[key] = entry
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def version(self) -> int:
+        return self._version
+
+    def bump_version(self):
+        self._version += 1
+        self._entries.clear()
+
+    def size(self) -> int:
+        return len(self._entries)
+
+
+class SQLiteBackend:
+    """SQLite file shared by every worker on the host, version included"""
+
+    blocking = True  # File I/O - ResponseCache calls it from worker threads
+
+    def __init__(self, path: Path, max_entries: int):
+        self.path = Path(path)
+        self.max_entries = max_entries
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS entries "
+                "(key TEXT PRIMARY KEY, etag TEXT, body BLOB, expires_at REAL)"
+            )
+            conn.execute("CREATE TABLE IF NOT EXISTS meta (name TEXT PRIMARY KEY, value INTEGER)")
+            conn.execute("INSERT OR IGNORE INTO meta VALUES ('version', 0)")
+
+    def _connect(self) -> sqlite3.Connection:
+        """This thread's connection (opened once per thread, then reused)"""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = self._local.conn = sqlite3.connect(self.path, timeout=1.0)
+        return conn
+
+    def get(self, key: str) -> Optional[Entry]:
+        with self._connect() as conn:
+            row = conn.execute("SELECT etag, body, expires_at FROM entries WHERE key = ?", (key,)).fetchone()
+        return (row[0], bytes(row[1]), row[2]) if row else None
+
+    def set(self, key: str, entry: Entry, version: int):
+        with self._connect() as conn:
+            # Only stored if no write bumped the version since the rows were read
+            conn.execute(
+                "INSERT OR REPLACE INTO entries SELECT ?, ?, ?, ? "
+                "WHERE (SELECT value FROM meta WHERE name = 'version') = ?",
+                (key, *entry, version)
+            )
+            if conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0] > self.max_entries:
+                # Expired first, then the ones closest to expiring
+                conn.execute(
+                    "DELETE FROM entries WHERE key IN "
+                    "(SELECT key FROM entries ORDER BY expires_at LIMIT ?)",
+                    (max(1, self.max_entries // 10),)
+                )
+
+    def version(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT value FROM meta WHERE name = 'version'").fetchone()[0]
+
+    def bump_version(self):
+        with self._connect() as conn:
+            conn.execute("UPDATE meta SET value = value + 1 WHERE name = 'version'")
+            conn.execute("DELETE FROM entries")
+
+    def size(self) -> int:
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM entries").fetchone()[0]
+
+
+def cache_key(request: Request, version: int) -> str:
+    """Data version + path + query parameters sorted, blanks dropped"""
+    params = sorted((k, v) for k, v in request.query_params.multi_items() if v != "")
+    # Encoded, so a value containing & or = can't read as another query
+    return f"v{version}:{request.url.path}?{urlencode(params)}"
+
+
+def _etag(body: bytes) -> str:
+    """Strong ETag from the response body"""
+    return '"' + hashlib.sha1(body).hexdigest() + '"'
+
+
+def _matches(request: Request, etag: str) -> bool:
+    """Whether If-None-Match lists the ETag (or *)"""
+    header = request.headers.get("if-none-match")
+    if not header:
+        return False
+    tags = {tag.strip().removeprefix("W/") for tag in header.split(",")}
+    return etag in tags or "*" in tags
+
+
+class ResponseCache:
+    """Cached, ETag-validated JSON responses for GET endpoints"""
+
+    def __init__(self, backend, ttl_seconds: float, enabled: bool = True):
+        self.backend = backend
+        self.ttl_seconds = ttl_seconds
+        self.enabled = enabled
+        self.hits = 0
+        self.misses = 0
+        self.not_modified = 0
+
+    def _response(self, request: Request, etag: str, body: bytes) -> Response:
+        """200 with the body, or 304 if the client already has it"""
+        headers = {"ETag": etag, "Cache-Control": "no-cache"}  # Clients revalidate with If-None-Match
+        if _matches(request, etag):
+            self.not_modified += 1
+            return Response(status_code=304, headers=headers)
+        return Response(content=body, media_type="application/json", headers=headers)
+
+    async def _run(self, fn, *args):
+        """Call a backend operation, in a worker thread if it blocks"""
+        if self.backend.blocking:
+            return await asyncio.to_thread(fn, *args)
+        return fn(*args)
+
+    def _load(self, request: Request) -> Tuple[int, Optional[Entry]]:
+        """Current data version and the request's entry at that version"""
+        version = self.backend.version()
+        return version, self.backend.get(cache_key(request, version))
+
+    def _store(self, request: Request, entry: Entry, version: int):
+        """Store an entry under the version its rows were read at"""
+        self.backend.set(cache_key(request, version), entry, version)
+
+    async def lookup(self, request: Request) -> Tuple[Optional[Response], Optional[int]]:
+        """
+        Cached response for the request
+
+        Call before reading the database, and pass the version on to
+        respond(): a body read while a write commits is then never cached
+        under the newer version.
+
+        Args:
+            request: Incoming GET request
+
+        Returns:
+            (200/304 response or None on a miss, data version read - None
+            when the cache is off or unavailable)
+        """
+        if not self.enabled:
+            return None, None
+        try:
+            version, entry = await self._run(self._load, request)
+        except sqlite3.Error as e:
+            print(f"⚠️  Response cache unavailable: {e}")
+            return None, None
+
+        if entry is None or entry[2] < time.time():
+            self.misses += 1
+            return None, version
+        self.hits += 1
+        return self._response(request, entry[0], entry[1]), version
+
+    async def respond(self, request: Request, payload: Any, version: Optional[int]) -> Response:
+        """
+        Encode a payload, cache it and answer with an ETag
+
+        Args:
+            request: Incoming GET request
+            payload: Response-shaped dict/list, or a Pydantic model
+            version: Data version lookup() returned before the rows were
+                read (None: don't cache)
+
+        Returns:
+            200 response with the body, or 304 if the client's copy is current
+        """
+        if isinstance(payload, BaseModel):
+            payload = payload.model_dump(mode="json")
+        body = dumps(payload)
+        etag = _etag(body)
+
+        if self.enabled and version is not None:
+            try:
+                await self._run(self._store, request, (etag, body, time.time() + self.ttl_seconds), version)
+            except sqlite3.Error as e:
+                print(f"⚠️  Response cache unavailable: {e}")
+
+        return self._response(request, etag, body)
+
+    def invalidate(self):
+        """
+        Make every cached response stale (after property or image writes)
+
+        Called from sync code (ORM events, scripts). On the event loop a
+        blocking backend is bumped from a worker thread instead.
+        """
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            loop = None
+
+        if loop is not None and self.backend.blocking:
+            loop.run_in_executor(None, self._bump_version)
+        else:
+            self._bump_version()
+
+    def _bump_version(self):
+        """Bump the backend's data version"""
+        try:
+            self.backend.bump_version()
+        except sqlite3.Error as e:
+            print(f"⚠️  Could not invalidate response cache: {e}")
+
+    async def snapshot(self) -> Dict[str, Any]:
+        """Backend, size and hit counts"""
+        return {
+            "enabled": self.enabled,
+            "backend": type(self.backend).__name__,
+            "entries": await self._run(self.backend.size),
+            "version": await self._run(self.backend.version),
+            "hits": self.hits,
+            "misses": self.misses,
+            "not_modified": self.not_modified,
+        }
+
+
+def _create_backend():
+    """Backend named by RESPONSE_CACHE_BACKEND"""
+    if settings.RESPONSE_CACHE_BACKEND == "sqlite":
+        return SQLiteBackend(
+            settings.RESPONSE_CACHE_PATH or DEFAULT_CACHE_PATH,
+            settings.RESPONSE_CACHE_MAX_ENTRIES
+        )
+    return MemoryBackend(settings.RESPONSE_CACHE_MAX_ENTRIES)
+
+
+# Global instance
+response_cache = ResponseCache(
+    _create_backend(),
+    ttl_seconds=settings.RESPONSE_CACHE_TTL_SECONDS,
+    enabled=settings.RESPONSE_CACHE_ENABLED
+)
+
+
+@event.listens_for(Session, "after_flush")
+def _note_listing_write(session, flush_context):
+    """Remember that the transaction writes a property or one of its images"""
+    changed = (*session.new, *session.dirty, *session.deleted)
+    if any(isinstance(obj, (Property, PropertyImage)) for obj in changed):
+        session.info["listings_changed"] = True
+
+
+@event.listens_for(Session, "after_commit")
+def _invalidate_on_listing_commit(session):
+    """Bump the data version once the write is visible to other sessions"""
+    if session.info.pop("listings_changed", False):
+        response_cache.invalidate()
+
+
+@event.listens_for(Session, "after_rollback")
+def _forget_listing_write(session):
+    """A rolled-back write changed nothing"""
+    session.info.pop("listings_changed", None)
@@ -0,0 +1,341 @@
+"""
+Similar-properties index
+In-memory feature matrix (area, type, size, rent, location and optionally
+the listing's description embedding) answering "similar listings" with a
+vectorized nearest-neighbour search instead of an LLM round-trip.
+"""
+import asyncio
+import math
+import time
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from ..config import settings
+from ..database import AsyncSessionLocal
+from ..models.property import Property
+from .ai_engine_client import ai_engine_client
+from .singleflight import SingleFlight
+
+# Relative weight of each feature group in the distance
+FEATURE_WEIGHTS = {
+    "area": 1.5,
+    "property_type": 1.0,
+    "bedrooms": 1.0,
+    "bathrooms": 0.5,
+    "rent": 1.5,
+    "location": 1.0,
+    "description": 1.0,
+}
+
+_COLUMNS = (
+    Property.id,
+    Property.area,
+    Property.property_type,
+    Property.bedrooms,
+    Property.bathrooms,
+    Property.rent_price,
+    Property.latitude,
+    Property.longitude,
+    Property.is_available,
+    func.coalesce(Property.updated_at, Property.created_at).label("changed_at"),
+)
+
+
+def _zscore(value: Optional[float], mean: float, std: float) -> float:
+    """Standardize a value; missing values sit at the mean"""
+    if value is None:
+        return 0.0
+    return (value - mean) / std
+
+
+def _stats(values: List[float]) -> Tuple[float, float]:
+    """Mean and (non-zero) standard deviation"""
+    if not values:
+        return 0.0, 1.0
+    array = np.asarray(values, dtype=np.float64)
+    return float(array.mean()), float(array.std()) or 1.0
+
+
+class SimilarPropertyIndex:
+    """kNN index over property feature vectors"""
+
+    def __init__(self):
+        self.ids: List[int] = []
+        self.row_of: Dict[int, int] = {}
+        self.matrix: Optional[np.ndarray] = None
+        self.available: Optional[np.ndarray] = None
+        self.areas: List[str] = []
+        self.types: List[str] = []
+        self.stats: Dict[str, Tuple[float, float]] = {}
+        self.embeddings: Dict[int, List[float]] = {}
+        self.last_changed_at: Optional[datetime] = None
+        self.last_checked = 0.0
+        self.built_at: Optional[float] = None
+
+    # -- features ---------------------------------------------------------
+
+    def _vector(self, row) -> np.ndarray:
+        """Feature vector for one property row"""
+        area = np.zeros(len(self.areas))
+        key = (row.area or "").strip().lower()
+        if key in self.areas:
+            area[self.areas.index(key)] = 1.0
+
+        property_type = np.zeros(len(self.types))
+        type_key = getattr(row.property_type, "value", row.property_type)
+        if type_key in self.types:
+            property_type[self.types.index(type_key)] = 1.0
+
+        rent = math.log1p(float(row.rent_price)) if row.rent_price is not None else None
+        lat = float(row.latitude) if row.latitude is not None else None
+        lon = float(row.longitude) if row.longitude is not None else None
+
+        parts = [
+            area * FEATURE_WEIGHTS["area"],
+            property_type * FEATURE_WEIGHTS["property_type"],
+            [_zscore(row.bedrooms, *self.stats["bedrooms"]) * FEATURE_WEIGHTS["bedrooms"]],
+            [_zscore(row.bathrooms, *self.stats["bathrooms"]) * FEATURE_WEIGHTS["bathrooms"]],
+            [_zscore(rent, *self.stats["rent"]) * FEATURE_WEIGHTS["rent"]],
+            [
+                _zscore(lat, *self.stats["latitude"]) * FEATURE_WEIGHTS["location"],
+                _zscore(lon, *self.stats["longitude"]) * FEATURE_WEIGHTS["location"],
+            ],
+        ]
+
+        if settings.SIMILAR_USE_DESCRIPTION_EMBEDDINGS and self.embeddings:
+            dims = len(next(iter(self.embeddings.values())))
+            embedding = np.asarray(self.embeddings.get(row.id, np.zeros(dims)), dtype=np.float64)
+            norm = np.linalg.norm(embedding)
+            parts.append(embedding / norm * FEATURE_WEIGHTS["description"] if norm else embedding)
+
+        return np.concatenate([np.asarray(p, dtype=np.float64) for p in parts])
+
+    # -- building ---------------------------------------------------------
+
+    async def build(self, db: AsyncSession, embeddings: Optional[Dict[int, List[float]]] = None):
+        """
+        Build the index from every property
+
+        Args:
+            db: Database session
+            embeddings: Optional description embeddings by property ID
+        """
+        rows = (await db.execute(select(*_COLUMNS).order_by(Property.id))).all()
+        fresh = await asyncio.to_thread(
+            self._encode_all, rows, self.embeddings if embeddings is None else embeddings
+        )
+
+        # Swapped in without awaiting, so queries never see a half-built index
+        self.__dict__.update(fresh.__dict__)
+        self.built_at = time.time()
+        self.last_checked = time.time()
+        print(f"✅ Similar-properties index built: {len(self.ids)} properties, {self.matrix.shape[1] if rows else 0} features")
+
+    @classmethod
+    def _encode_all(cls, rows, embeddings: Dict[int, List[float]]) -> "SimilarPropertyIndex":
+        """
+        Encode every row into a new index (CPU-bound - runs in a worker thread)
+
+        Args:
+            rows: Rows of _COLUMNS for every property
+            embeddings: Description embeddings by property ID
+
+        Returns:
+            Index whose state replaces the current one
+        """
+        fresh = cls()
+        fresh.embeddings = embeddings
+
+        # Vocabularies and normalization stats are fixed per full build
+        fresh.areas = sorted({(r.area or "").strip().lower() for r in rows})
+        fresh.types = sorted({getattr(r.property_type, "value", r.property_type) for r in rows})
+        fresh.stats = {
+            "bedrooms": _stats([r.bedrooms for r in rows if r.bedrooms is not None]),
+            "bathrooms": _stats([r.bathrooms for r in rows if r.bathrooms is not None]),
+            "rent": _stats([math.log1p(float(r.rent_price)) for r in rows if r.rent_price is not None]),
+            "latitude": _stats([float(r.latitude) for r in rows if r.latitude is not None]),
+            "longitude": _stats([float(r.longitude) for r in rows if r.longitude is not None]),
+        }
+
+        fresh.ids = [r.id for r in rows]
+        fresh.row_of = {property_id: i for i, property_id in enumerate(fresh.ids)}
+        fresh.matrix = np.vstack([fresh._vector(r) for r in rows]) if rows else None
+        fresh.available = np.asarray([bool(r.is_available) for r in rows])
+        fresh.last_changed_at = max((r.changed_at for r in rows if r.changed_at), default=None)
+        return fresh
+
+    async def refresh(self, db: AsyncSession, embeddings: Optional[Dict[int, List[float]]] = None) -> int:
+        """
+        Apply listing changes since the last build or refresh
+
+        Changed rows are re-encoded in place. New areas or property types
+        and deleted listings change the feature layout, so they trigger a
+        full rebuild instead.
+
+        Args:
+            db: Database session
+            embeddings: Optional description embeddings for changed properties
+
+        Returns:
+            Number of rows updated (-1 for a full rebuild)
+        """
+        self.last_checked = time.time()
+        if self.matrix is None:
+            await self.build(db, embeddings)
+            return -1
+
+        # >= so rows sharing the last timestamp are never skipped (re-encoding is idempotent)
+        stmt = select(*_COLUMNS)
+        if self.last_changed_at is not None:
+            stmt = stmt.where(func.coalesce(Property.updated_at, Property.created_at) >= self.last_changed_at)
+        changed = (await db.execute(stmt)).all()
+
+        total = (await db.execute(select(func.count(Property.id)))).scalar_one()
+        new_ids = [r.id for r in changed if r.id not in self.row_of]
+        needs_rebuild = (
+            total != len(self.ids) + len(new_ids)
+            or any((r.area or "").strip().lower() not in self.areas for r in changed)
+            or any(getattr(r.property_type, "value", r.property_type) not in self.types for r in changed)
+            # First description embeddings add feature columns
+            or bool(embeddings and not self.embeddings)
+        )
+        if embeddings:
+            self.embeddings.update(embeddings)
+        if needs_rebuild:
+            await self.build(db)
+            return -1
+        if not changed:
+            return 0
+
+        # Tuple assignment without awaiting - queries see the old arrays or the new ones
+        self.ids, self.row_of, self.matrix, self.available = await asyncio.to_thread(self._apply_changes, changed)
+        self.last_changed_at = max([self.last_changed_at] + [r.changed_at for r in changed if r.changed_at])
+        return len(changed)
+
+    def _apply_changes(self, changed) -> Tuple[List[int], Dict[int, int], np.ndarray, np.ndarray]:
+        """
+        Re-encode changed rows into copies of the arrays (runs in a worker thread)
+
+        Args:
+            changed: Rows of _COLUMNS changed since the last refresh
+
+        Returns:
+            (ids, row_of, matrix, available) to swap in
+        """
+        ids, row_of = list(self.ids), dict(self.row_of)
+        matrix, available = self.matrix.copy(), self.available.copy()
+
+        new_rows = []
+        for r in changed:
+            vector = self._vector(r)
+            if r.id in row_of:
+                matrix[row_of[r.id]] = vector
+                available[row_of[r.id]] = bool(r.is_available)
+            else:
+                row_of[r.id] = len(ids)
+                ids.append(r.id)
+                new_rows.append((vector, bool(r.is_available)))
+        if new_rows:
+            matrix = np.vstack([matrix] + [v for v, _ in new_rows])
+            available = np.concatenate([available, [a for _, a in new_rows]])
+        return ids, row_of, matrix, available
+
+    async def changed_ids(self, db: AsyncSession) -> List[int]:
+        """IDs of properties changed since the last build (for fetching their embeddings)"""
+        stmt = select(Property.id)
+        if self.last_changed_at is not None:
+            stmt = stmt.where(func.coalesce(Property.updated_at, Property.created_at) >= self.last_changed_at)
+        return list((await db.execute(stmt)).scalars().all())
+
+    def is_stale(self) -> bool:
+        """Whether the refresh interval has passed"""
+        return self.matrix is None or time.time() - self.last_checked >= settings.SIMILAR_REFRESH_SECONDS
+
+    # -- querying ---------------------------------------------------------
+
+    def similar(self, property_id: int, limit: int = 6, available_only: bool = True) -> List[Tuple[int, float]]:
+        """
+        Nearest neighbours of a property
+
+        Args:
+            property_id: Property to find neighbours for
+            limit: Number of neighbours
+            available_only: Skip listings that are not available
+
+        Returns:
+            (property_id, similarity in (0, 1]) pairs, most similar first;
+            empty if the property is not indexed
+        """
+        row = self.row_of.get(property_id)
+        if row is None or self.matrix is None:
+            return []
+
+        distances = np.linalg.norm(self.matrix - self.matrix[row], axis=1)
+        distances[row] = np.inf
+        if available_only:
+            distances[~self.available] = np.inf
+
+        candidates = int(np.isfinite(distances).sum())
+        limit = min(limit, candidates)
+        if limit <= 0:
+            return []
+
+        nearest = np.argpartition(distances, limit - 1)[:limit]
+        nearest = nearest[np.argsort(distances[nearest])]
+        return [(self.ids[i], round(float(1 / (1 + distances[i])), 4)) for i in nearest]
+
+    def snapshot(self) -> Dict[str, object]:
+        """Index size and freshness"""
+        return {
+            "properties": len(self.ids),
+            "features": int(self.matrix.shape[1]) if self.matrix is not None else 0,
+            "description_embeddings": len(self.embeddings),
+            "last_changed_at": self.last_changed_at.isoformat() if self.last_changed_at else None,
+        }
+
+
+# Global instance
+similarity_index = SimilarPropertyIndex()
+
+
+# Concurrent requests that find the index stale share one refresh
+refresh_flights = SingleFlight("similarity_refresh")
+
+
+async def ensure_fresh():
+    """
+    Refresh the global index if SIMILAR_REFRESH_SECONDS have passed
+
+    Description embeddings (when enabled) are fetched from the AI-Engine
+    for changed listings only; if it is unreachable the index is refreshed
+    without them. The refresh runs once for all concurrent callers, in its
+    own session so a disconnecting caller doesn't close it mid-refresh.
+    """
+    if not similarity_index.is_stale():
+        return
+    await refresh_flights.do("refresh", _refresh)
+
+
+async def _refresh():
+    """Fetch embeddings for changed listings and refresh the index"""
+    # A refresh that finished just before this one started already did the work
+    if not similarity_index.is_stale():
+        return
+
+    async with AsyncSessionLocal() as db:
+        embeddings = None
+        if settings.SIMILAR_USE_DESCRIPTION_EMBEDDINGS:
+            try:
+                # All listings the first time, then only the ones that changed
+                property_ids = (
+                    await similarity_index.changed_ids(db) if similarity_index.embeddings
+                    else list((await db.execute(select(Property.id))).scalars().all())
+                )
+                result = await ai_engine_client.get_listing_embeddings(property_ids)
+                embeddings = {int(k): v for k, v in result.get("embeddings", {}).items()}
+            except Exception as e:
+                print(f"⚠️  Could not fetch listing embeddings: {e}")
+
+        await similarity_index.refresh(db, embeddings)
@@ -0,0 +1,64 @@
+"""
+Request coalescing (singleflight)
+Concurrent callers asking for the same key share one in-flight call and
+its result instead of each running an identical query. Nothing is cached:
+once the call finishes, the next caller starts a fresh one.
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable
+
+
+class SingleFlight:
+    """Deduplicates concurrent async calls by key"""
+
+    def __init__(self, name: str):
+        self.name = name
+        self._calls: Dict[Hashable, asyncio.Task] = {}
+        self._waiters: Dict[Hashable, int] = {}
+        self.calls = 0  # Calls that ran
+        self.coalesced = 0  # Callers that joined a call already in flight
+        self.max_waiters = 0
+
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[Any]]) -> Any:
+        """
+        Run fn() once per key at a time
+
+        The call runs as its own task, so a caller that is cancelled (client
+        disconnect) doesn't cancel it for the others still waiting.
+
+        Args:
+            key: Hashable identity of the call
+            fn: Zero-argument coroutine function doing the work
+
+        Returns:
+            fn()'s result (its exception is raised to every waiter)
+        """
+        task = self._calls.get(key)
+        if task is None:
+            self.calls += 1
+            task = asyncio.ensure_future(fn())
+            self._calls[key] = task
+            self._waiters[key] = 1
+            task.add_done_callback(lambda _: self._forget(key))
+        else:
+            self.coalesced += 1
+            self._waiters[key] += 1
+            self.max_waiters = max(self.max_waiters, self._waiters[key])
+
+        return await asyncio.shield(task)
+
+    def _forget(self, key: Hashable):
+        """Drop a finished call so the next caller starts a fresh one"""
+        self._calls.pop(key, None)
+        self._waiters.pop(key, None)
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Calls run, callers coalesced into them and current in-flight keys"""
+        requests = self.calls + self.coalesced
+        return {
+            "calls": self.calls,
+            "coalesced": self.coalesced,
+            "coalesced_rate": round(self.coalesced / requests, 3) if requests else 0.0,
+            "max_waiters": self.max_waiters,
+            "in_flight": len(self._calls),
+        }
@@ -0,0 +1,50 @@
+"""
+Migration: add the composite listing indexes to an existing database
+Creates every index declared on the Property model that the properties
+table does not have yet. Safe to re-run; init_db.py creates them for new
+databases.
+
+Usage:
+    python scripts/add_property_indexes.py
+    python scripts/add_property_indexes.py --dry-run
+"""
+import sys
+import argparse
+from pathlib import Path
+from sqlalchemy import inspect, text
+from sqlalchemy.schema import CreateIndex
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import engine
+from app.models.property import Property
+
+
+def add_property_indexes(dry_run: bool = False):
+    """Create the missing indexes on the properties table"""
+    existing = {index["name"] for index in inspect(engine).get_indexes(Property.__tablename__)}
+    missing = [index for index in Property.__table__.indexes if index.name not in existing]
+
+    if not missing:
+        print("✅ All property indexes already exist")
+        return
+
+    for index in sorted(missing, key=lambda i: i.name):
+        print(f"{'Would create' if dry_run else 'Creating'}: {CreateIndex(index).compile(engine)}")
+        if not dry_run:
+            index.create(bind=engine)
+
+    if not dry_run:
+        # Refresh the optimizer's statistics so the new indexes get picked
+        with engine.begin() as conn:
+            conn.execute(text(f"ANALYZE TABLE {Property.__tablename__}"))
+        print(f"✅ Created {len(missing)} indexes")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Add composite indexes to the properties table")
+    parser.add_argument("--dry-run", action="store_true", help="Print the DDL without running it")
+    args = parser.parse_args()
+
+    add_property_indexes(dry_run=args.dry_run)
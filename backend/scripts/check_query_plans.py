@@ -0,0 +1,125 @@
+"""
+Query-plan regression check for property search
+Runs EXPLAIN on the query shapes PropertyService issues for listing pages
+and counts (the agent's search_properties tool goes through the same
+endpoint) and fails if one of them scans the whole properties table.
+
+Any full scan fails: a table scan (type=ALL) or a full index scan
+(type=index). Unfiltered pages are allow-listed for full index scans - they
+read the sort index in order and stop at the LIMIT. Other shapes can be
+allow-listed with --allow (e.g. on a small dev table where MySQL prefers a
+scan); they are then reported as warnings.
+
+Usage:
+    python scripts/check_query_plans.py
+    python scripts/check_query_plans.py --allow "list: rent range"
+
+Exits with status 1 when a query shape fails.
+"""
+import sys
+import argparse
+from datetime import datetime
+from decimal import Decimal
+from pathlib import Path
+from types import SimpleNamespace
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.database import engine
+from app.models.property import Property
+from app.schemas.property import PropertySearchFilters
+from app.services.property_service import PropertyService, encode_cursor
+
+# Access types that read the whole table or a whole index
+FULL_SCAN_TYPES = ("ALL", "index")
+
+# Unfiltered pages walk the sort index and stop at the LIMIT (type=index is expected)
+ORDERED_INDEX_SCANS = ("list: default", "list: cheapest first", "list: newest first")
+
+# A position deep in each sort order, for the keyset shapes
+_LAST_ROW = SimpleNamespace(id=1000, rent_price=Decimal("1500000"), created_at=datetime(2024, 1, 1))
+
+
+def query_shapes():
+    """(name, statement) pairs for the filter combinations the API serves"""
+    shapes = {
+        "list: default": PropertySearchFilters(),
+        "list: area": PropertySearchFilters(area="Lekki"),
+        "list: area + rent range": PropertySearchFilters(area="Lekki", min_rent=500000, max_rent=3000000),
+        "list: type + bedrooms": PropertySearchFilters(property_type="apartment", bedrooms=2),
+        "list: type + bedrooms + max rent": PropertySearchFilters(property_type="apartment", bedrooms=2, max_rent=2000000),
+        "list: rent range": PropertySearchFilters(min_rent=500000, max_rent=3000000),
+        "list: cheapest first": PropertySearchFilters(sort="price_asc"),
+        "list: newest first": PropertySearchFilters(sort="newest"),
+    }
+    for sort in ("id", "price_asc", "price_desc", "newest"):
+        shapes[f"list: {sort} cursor"] = PropertySearchFilters(sort=sort, cursor=encode_cursor(sort, _LAST_ROW))
+    shapes["list: area + price_asc cursor"] = PropertySearchFilters(
+        area="Lekki", sort="price_asc", cursor=encode_cursor("price_asc", _LAST_ROW)
+    )
+
+    statements = [(name, PropertyService.page_statement(filters)) for name, filters in shapes.items()]
+    for name in ("list: area", "list: area + rent range", "list: type + bedrooms", "list: rent range"):
+        statements.append((name.replace("list:", "count:"), PropertyService.count_statement(shapes[name])))
+    return statements
+
+
+def explain(conn, statement):
+    """EXPLAIN rows (as dicts) for one statement"""
+    sql = statement.compile(dialect=engine.dialect, compile_kwargs={"literal_binds": True})
+    return [dict(row._mapping) for row in conn.exec_driver_sql(f"EXPLAIN {sql}")]
+
+
+def check_query_plans(allow=()) -> bool:
+    """
+    Explain every query shape and report its access path
+
+    Args:
+        allow: Shape names whose full scans only warn
+
+    Returns:
+        True if no shape fails
+    """
+    failures, warnings = [], []
+
+    with engine.connect() as conn:
+        for name, statement in query_shapes():
+            for row in explain(conn, statement):
+                if row.get("table") != Property.__tablename__:
+                    continue  # Derived tables of the count wrapper
+
+                status = "ok"
+                access = row.get("type")
+                if access == "index" and name in ORDERED_INDEX_SCANS:
+                    pass
+                elif access in FULL_SCAN_TYPES:
+                    if name in allow:
+                        status = "warn"
+                        warnings.append(name)
+                    else:
+                        status = "FAIL"
+                        failures.append(name)
+
+                print(f"  [{status:>4}] {name:<36} type={row.get('type')} key={row.get('key')} rows={row.get('rows')}")
+
+    print()
+    if warnings:
+        print(f"⚠️  {len(warnings)} allow-listed shapes do a full scan: {', '.join(warnings)}")
+    if failures:
+        print(f"❌ {len(failures)} shapes do a full table or index scan: {', '.join(failures)}")
+        return False
+
+    print("✅ No query shape needs a full scan")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="EXPLAIN the property search queries")
+    parser.add_argument(
+        "--allow", action="append", default=[], metavar="SHAPE",
+        help="Query shape allowed to do a full scan (repeatable)"
+    )
+    args = parser.parse_args()
+
+    sys.exit(0 if check_query_plans(allow=args.allow) else 1)
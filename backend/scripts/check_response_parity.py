@@ -0,0 +1,103 @@
+"""
+Response-shape parity check for the fast read path
+Loads the same properties through the ORM + Pydantic path and the Core row
++ orjson path and compares the JSON they produce, field by field. Also
+reports the time each path takes to hydrate and encode.
+
+Usage:
+    python scripts/check_response_parity.py
+    python scripts/check_response_parity.py --sample 100
+
+Exits with status 1 when any property differs.
+"""
+import sys
+import asyncio
+import argparse
+import time
+from pathlib import Path
+import orjson
+from sqlalchemy import select
+
+# Add parent directory to path
+sys.path.append(str(Path(__file__).parent.parent))
+
+from app.services.encoding import dumps
+from app.database import AsyncSessionLocal, async_engine
+from app.models.property import Property
+from app.schemas.property import PropertyCardSchema, PropertyResponse
+from app.services.property_service import PropertyService
+
+
+def diff(expected, actual, path="") -> list:
+    """Paths where two JSON values differ"""
+    if isinstance(expected, dict) and isinstance(actual, dict):
+        differences = []
+        for key in expected.keys() | actual.keys():
+            if key not in actual or key not in expected:
+                differences.append(f"{path}.{key} (missing on one side)")
+            else:
+                differences.extend(diff(expected[key], actual[key], f"{path}.{key}"))
+        return differences
+    if isinstance(expected, list) and isinstance(actual, list):
+        if len(expected) != len(actual):
+            return [f"{path} (length {len(expected)} != {len(actual)})"]
+        differences = []
+        for i, (left, right) in enumerate(zip(expected, actual)):
+            differences.extend(diff(left, right, f"{path}[{i}]"))
+        return differences
+    return [] if expected == actual else [f"{path}: {expected!r} != {actual!r}"]
+
+
+async def check_response_parity(sample: int) -> bool:
+    """
+    Compare both read paths on the first `sample` properties
+
+    Returns:
+        True if every property serializes identically
+    """
+    async with AsyncSessionLocal() as db:
+        property_ids = list((await db.execute(
+            select(Property.id).order_by(Property.id).limit(sample)
+        )).scalars().all())
+
+        start = time.perf_counter()
+        orm_properties = await PropertyService.get_properties_by_ids(db, property_ids)
+        expected = [PropertyResponse.model_validate(prop).model_dump(mode="json") for prop in orm_properties]
+        orm_seconds = time.perf_counter() - start
+
+        start = time.perf_counter()
+        rows = await PropertyService.get_property_rows_by_ids(db, property_ids)
+        encoded = dumps(rows)
+        fast_seconds = time.perf_counter() - start
+
+        cards = await PropertyService.get_property_cards_by_ids(db, property_ids)
+
+    await async_engine.dispose()
+
+    differences = diff(expected, orjson.loads(encoded), "properties")
+    differences += diff(
+        [PropertyCardSchema.model_validate(card).model_dump(mode="json") for card in cards],
+        orjson.loads(dumps(cards)),
+        "cards"
+    )
+
+    print(f"Compared {len(property_ids)} properties")
+    print(f"  ORM + Pydantic: {orm_seconds * 1000:.1f} ms")
+    print(f"  Core + orjson:  {fast_seconds * 1000:.1f} ms")
+
+    if differences:
+        print(f"\n❌ {len(differences)} differences:")
+        for difference in differences[:50]:
+            print(f"  {difference}")
+        return False
+
+    print("\n✅ Fast read path matches the response schemas")
+    return True
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Compare the ORM and fast read paths")
+    parser.add_argument("--sample", type=int, default=100, help="Number of properties to compare")
+    args = parser.parse_args()
+
+    sys.exit(0 if asyncio.run(check_response_parity(args.sample)) else 1)
@@ -12,6 +12,7 @@ sys.path.append(str(Path(__file__).parent.parent))
 
 from app.database import SessionLocal
 from app.models import Property, PropertyType, PropertyImage, Review, User, UserRole
+from app.services.response_cache import response_cache
 
 # Pre-computed bcrypt hash for "password123"
 # This avoids runtime bcrypt issues during seeding
@@ -248,6 +249,9 @@ def main():
         # Seed properties and assign to landlords
         seed_properties(db, landlords, num_properties=80)
 
+        # Drop cached listing responses (reaches the API when RESPONSE_CACHE_BACKEND=sqlite)
+        response_cache.invalidate()
+
         print("\n" + "=" * 50)
         print("[SUCCESS] Database seeding completed successfully!")
         print("=" * 50)
@@ -7,6 +7,7 @@ from sqlalchemy.orm import Session
 from app.database import SessionLocal
 from app.models.property import Property
 from app.models.property_image import PropertyImage
+from app.services.response_cache import response_cache
 
 # Large pool of curated Unsplash images organized by property type and room type
 IMAGE_POOLS = {
@@ -210,6 +211,9 @@ def update_all_property_images():
                 total_images += 1
 
         db.commit()
+
+        # Drop cached listing responses (reaches the API when RESPONSE_CACHE_BACKEND=sqlite)
+        response_cache.invalidate()
         print(f"✅ Successfully added {total_images} images to {len(properties)} properties!")
         print(f"📊 Average: {total_images / len(properties):.1f} images per property")
 
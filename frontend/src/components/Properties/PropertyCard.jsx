@@ -1,8 +1,10 @@
 import { useState } from 'react';
 import PropertyDetailsModal from './PropertyDetailsModal';
+import { propertiesAPI } from '../../services/api';
 
 const PropertyCard = ({ property }) => {
   const [showModal, setShowModal] = useState(false);
+  const [details, setDetails] = useState(null);
 
   const {
     title,
@@ -12,6 +14,7 @@ const PropertyCard = ({ property }) => {
     bathrooms,
     rent_price,
     furnishing_status,
+    image_url,
     images = [],
   } = property;
 
@@ -24,8 +27,19 @@ const PropertyCard = ({ property }) => {
     }).format(price);
   };
 
-  // Get first image or placeholder
-  const mainImage = images.length > 0 ? images[0].image_url : '/placeholder-property.jpg';
+  // Card image (list/chat cards carry only the primary one), else first image or placeholder
+  const mainImage = image_url || (images.length > 0 ? images[0].image_url : '/placeholder-property.jpg');
+
+  // Cards don't include images, landlord or description - load full details on open
+  const openDetails = () => {
+    setShowModal(true);
+    if (!details) {
+      propertiesAPI
+        .getPropertyById(property.id)
+        .then(setDetails)
+        .catch((error) => console.error('Error loading property details:', error));
+    }
+  };
 
   return (
     <>
@@ -119,7 +133,7 @@ const PropertyCard = ({ property }) => {
               <p className="text-xl font-bold text-rajah">{formatPrice(rent_price)}</p>
             </div>
             <button
-              onClick={() => setShowModal(true)}
+              onClick={openDetails}
               className="bg-primary hover:bg-primary/80 text-white px-4 py-2 rounded-lg text-sm font-semibold transition-colors"
             >
               View Details
@@ -132,7 +146,7 @@ const PropertyCard = ({ property }) => {
     {/* Property Details Modal */}
     {showModal && (
       <PropertyDetailsModal
-        property={property}
+        property={details || property}
         onClose={() => setShowModal(false)}
       />
     )}
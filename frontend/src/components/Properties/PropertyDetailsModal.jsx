@@ -88,7 +88,7 @@ const PropertyDetailsModal = ({ property, onClose }) => {
 
   const currentImage = images.length > 0
     ? images[currentImageIndex].image_url
-    : 'https://via.placeholder.com/800x600?text=No+Image';
+    : property.image_url || 'https://via.placeholder.com/800x600?text=No+Image';
 
   return (
     <div className="fixed inset-0 z-50 flex items-center justify-center p-4 bg-black/70 backdrop-blur-sm animate-fade-in">
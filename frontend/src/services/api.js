@@ -34,6 +34,9 @@ export const propertiesAPI = {
     if (filters.max_rent) params.append('max_rent', filters.max_rent);
     if (filters.page) params.append('page', filters.page);
     if (filters.limit) params.append('limit', filters.limit);
+    if (filters.sort) params.append('sort', filters.sort);
+    if (filters.cursor) params.append('cursor', filters.cursor);
+    if (filters.count_mode) params.append('count_mode', filters.count_mode);
 
     const response = await api.get(`/api/v1/properties?${params.toString()}`);
     return response.data;